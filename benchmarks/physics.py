@@ -0,0 +1,263 @@
+"""Physics and game-loop microbenchmarks.
+
+Runs scripted scenarios through the headless ``World`` and reports, per
+scenario, the cost of a whole tick and of each physics kernel::
+
+    python -m benchmarks.physics --json results.json
+    python -m benchmarks.physics --compare results.json
+
+``Game.handle_collisions``, ``Ball.apply_physics``, ``Field.check_*`` and
+``Player.update_*`` all delegate to the state objects measured here, so the
+numbers cover the game's hot path without needing a window.
+
+Reported values:
+    ns_per_tick: Best average time of one ``World.step``
+    ticks_per_sec: 1e9 / ns_per_tick
+    alloc_blocks_per_tick: Net Python memory blocks allocated per tick
+        (should be ~0; anything else is a leak)
+    peak_bytes_per_tick: Peak temporary memory traced by tracemalloc during
+        a tick
+    kernels: Best average ns per call of each kernel while the scenario
+        plays, with the timer's own overhead subtracted
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from src.core.config import raio, chao
+from src.controllers.base import IDLE
+from src.core.game.world import World, BallState, PlayerState, FieldRules
+
+
+def chase(world, state):
+    """Control state that runs at the ball and jumps/kicks when close"""
+    dx = world.ball.x - state.x
+    close = abs(dx) < 60
+    return {
+        "movement": "right" if dx > 10 else "left" if dx < -10 else "none",
+        "jump": "jumping" if close and world.ball.y < state.y - 40 else "ready",
+        "kick": "kicking" if close and world.ball.y > state.y else "ready"
+    }
+
+
+def setup_rest(world):
+    """Ball lying still on the ground"""
+    for _ in range(600):
+        world.step({1: IDLE, 2: IDLE})
+    world.tick = 0
+
+
+def setup_header_duel(world):
+    """Ball dropped between two players who chase it and head it"""
+    world.player1.set_position(560, 503)
+    world.player2.set_position(640, 503)
+    world.ball.set_position(600, 250)
+
+
+def setup_crossbar(world):
+    """Ball dropped onto the left crossbar"""
+    bar = world.field.left_goal_bounds
+    world.ball.set_position((bar['x1'] + bar['x2']) / 2, 200)
+
+
+def setup_goal(world):
+    """Ball rolling into the left goal"""
+    world.ball.set_position(250, chao - raio)
+    world.ball.velx = -6
+
+
+def duel_controls(world):
+    return {1: chase(world, world.player1), 2: chase(world, world.player2)}
+
+
+def idle_controls(world):
+    return {1: IDLE, 2: IDLE}
+
+
+# name: (setup, controls, ticks before the scenario restarts)
+SCENARIOS = {
+    "rest": (setup_rest, idle_controls, 600),
+    "header_duel": (setup_header_duel, duel_controls, 240),
+    "crossbar": (setup_crossbar, idle_controls, 90),
+    "goal": (setup_goal, idle_controls, 120),
+}
+
+# name: (class, method) of each kernel timed inside the running scenario
+KERNELS = {
+    "ball.apply_physics": (BallState, "apply_physics"),
+    "world.handle_collisions": (World, "handle_collisions"),
+    "field.check_field_collision": (FieldRules, "check_field_collision"),
+    "field.check_goal": (FieldRules, "check_goal"),
+    "player.update_jump": (PlayerState, "update_jump"),
+    "player.update_kick": (PlayerState, "update_kick"),
+}
+
+
+class ScenarioRun:
+    """A world playing one scenario over and over"""
+
+    def __init__(self, name):
+        setup, self.controls, self.period = SCENARIOS[name]
+        self.world = World()
+        setup(self.world)
+        self.start = self.world.snapshot()
+
+    def tick(self):
+        """Play one tick, restarting the scenario when it's over"""
+        world = self.world
+        world.step(self.controls(world))
+        if world.is_goal or world.tick >= self.period:
+            world.restore(self.start)
+
+
+def best_of(repeats, func):
+    """Shortest wall time of several runs of func"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        func()
+        best = min(best, time.perf_counter_ns() - start)
+    return best
+
+
+def bench_ticks(name, ticks, repeats):
+    """Whole-tick timing and memory of a scenario"""
+    run = ScenarioRun(name)
+
+    def loop():
+        for _ in range(ticks):
+            run.tick()
+
+    loop()  # Warm up
+    ns = best_of(repeats, loop) / ticks
+
+    blocks = sys.getallocatedblocks()
+    loop()
+    alloc_blocks = (sys.getallocatedblocks() - blocks) / ticks
+
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    run.tick()
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    return {
+        "ns_per_tick": round(ns, 1),
+        "ticks_per_sec": round(1e9 / ns),
+        "alloc_blocks_per_tick": round(alloc_blocks, 3),
+        "peak_bytes_per_tick": peak,
+    }
+
+
+def timed(func, totals, key):
+    """Wrap func so that its run time and call count add up in totals[key]"""
+    clock = time.perf_counter_ns
+
+    def wrapper(*args, **kwargs):
+        start = clock()
+        result = func(*args, **kwargs)
+        entry = totals[key]
+        entry[0] += clock() - start
+        entry[1] += 1
+        return result
+    return wrapper
+
+
+def timer_overhead(samples=20000):
+    """ns the timing wrapper itself adds to a measured call"""
+    totals = {"empty": [0, 0]}
+    empty = timed(lambda: None, totals, "empty")
+    best = float("inf")
+    for _ in range(5):
+        totals["empty"] = [0, 0]
+        for _ in range(samples):
+            empty()
+        best = min(best, totals["empty"][0] / samples)
+    return best
+
+
+def bench_kernels(name, ticks, repeats):
+    """Average ns per call of every kernel while the scenario plays"""
+    overhead = timer_overhead()
+    best = {}
+    originals = {key: getattr(cls, method) for key, (cls, method) in KERNELS.items()}
+    totals = {key: [0, 0] for key in KERNELS}
+    try:
+        for key, (cls, method) in KERNELS.items():
+            setattr(cls, method, timed(originals[key], totals, key))
+        for _ in range(repeats):
+            run = ScenarioRun(name)
+            for key in KERNELS:
+                totals[key] = [0, 0]
+            for _ in range(ticks):
+                run.tick()
+            for key, (elapsed, calls) in totals.items():
+                if calls:
+                    best[key] = min(best.get(key, float("inf")), elapsed / calls - overhead)
+    finally:
+        for key, (cls, method) in KERNELS.items():
+            setattr(cls, method, originals[key])
+    return {key: round(max(best.get(key, 0.0), 0.0), 1) for key in KERNELS}
+
+
+def run_all(ticks, repeats, names=None):
+    """Run the suite; returns the JSON-ready results"""
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "ticks": ticks,
+        "scenarios": {}
+    }
+    for name in names or SCENARIOS:
+        entry = bench_ticks(name, ticks, repeats)
+        entry["kernels"] = bench_kernels(name, ticks, repeats)
+        results["scenarios"][name] = entry
+    return results
+
+
+def print_results(results, baseline=None):
+    """Print a table, with the change against a previous run if given"""
+    for name, entry in results["scenarios"].items():
+        print(f"{name}:")
+        rows = [("tick", entry["ns_per_tick"])] + list(entry["kernels"].items())
+        old = (baseline or {}).get("scenarios", {}).get(name)
+        for row_name, ns in rows:
+            line = f"  {row_name:30s} {ns:10.1f} ns"
+            if old:
+                before = old["ns_per_tick"] if row_name == "tick" else old["kernels"].get(row_name)
+                if before:
+                    line += f"  ({(ns - before) / before * 100:+.1f}%)"
+            print(line)
+        print(f"  {'ticks/sec':30s} {entry['ticks_per_sec']:10d}")
+        print(f"  {'alloc blocks/tick':30s} {entry['alloc_blocks_per_tick']:10.3f}")
+        print(f"  {'peak bytes/tick':30s} {entry['peak_bytes_per_tick']:10d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Head Soccer physics benchmarks")
+    parser.add_argument("--ticks", type=int, default=2000, help="ticks per measurement")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per measurement (best is kept)")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="scenario to run (default: all)")
+    parser.add_argument("--json", metavar="PATH", help="write results to a JSON file")
+    parser.add_argument("--compare", metavar="PATH", help="JSON results to compare against")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    results = run_all(args.ticks, args.repeats, args.scenario)
+    print_results(results, baseline)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"[INFO] Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import time
+from .base import Controller, IDLE
+from ..core.game.predictor import TrajectoryPredictor
+
+
+class AIController(Controller):
+    """Computer opponent driving one or both players
+
+    Decisions are anytime: a cheap chase-the-ball decision is always
+    available, and the trajectory prediction that refines it only runs while
+    the per-tick budget lasts, so the AI never stretches the frame.
+    """
+
+    REACH = 40          # Ball distance from a head/foot centre that counts as a touch
+    JUMP_HEIGHT = 96    # Height of a full jump
+    BEHIND = 18         # How far behind the ball to stand before striking it
+    DEADBAND = 6        # Distance to the target at which the player stops moving
+
+    def __init__(self, players=(2,), base=None, budget=0.0005, world=None, predictor=None):
+        """Create an AI controller
+
+        Args:
+            players: Player numbers (1, 2 or both) driven by the AI
+            base: Optional controller for the other players (keyboard, vision)
+            budget: Time allowed per ``process_input`` call, in seconds
+            world: World to play in; can also be given later with ``attach``
+            predictor: TrajectoryPredictor to share (default: a new one)
+        """
+        self.players = tuple(players)
+        self.base = base
+        self.budget = budget
+        self.predictor = predictor
+        self.world = None
+        self.overruns = 0
+        if world is not None:
+            self.attach(world)
+
+    def attach(self, world):
+        """Start playing in a world; the AI stays idle until then"""
+        self.world = world
+        if self.predictor is None or self.predictor.field is not world.field:
+            self.predictor = TrajectoryPredictor(world.field, substeps=world.substeps)
+
+    def process_input(self):
+        """Control state of every player: the AI's own and the base controller's"""
+        deadline = time.perf_counter() + self.budget
+        states = self.base.process_input() if self.base else {1: dict(IDLE), 2: dict(IDLE)}
+        states = dict(states)
+        for number in self.players:
+            states[number] = self.decide(number, deadline)
+        if time.perf_counter() > deadline:
+            self.overruns += 1
+        return states
+
+    def decide(self, number, deadline):
+        """Control state of one AI player, as a new dict"""
+        if self.world is None:
+            return dict(IDLE)
+        world = self.world
+        player = world.players[number - 1]
+        ball = world.ball
+
+        # Anytime fallback: chase the current ball position
+        target = self.strike_position(player, ball.x)
+        head_ball_y = ball.y
+
+        if time.perf_counter() < deadline:
+            prediction = self.predictor.predict(ball, deadline)
+            intercept = self.find_intercept(player, prediction)
+            if intercept is not None:
+                target = self.strike_position(player, intercept[0])
+                head_ball_y = intercept[1]
+            elif prediction.on_target and self.own_goal(player) == prediction.goal_side:
+                # Ball is going in and can't be reached in time: fall back to the line
+                target = self.defend_position(player, world)
+
+        dx = target - player.x
+        movement = "right" if dx > self.DEADBAND else "left" if dx < -self.DEADBAND else "none"
+
+        head_x, head_y = player.head_position
+        foot_x, foot_y = player.foot_position
+        near = abs(ball.x - player.x) < self.REACH + 10
+        # Jump when the ball will come down within a jump's reach above the head
+        jump = "jumping" if (near and head_y - self.JUMP_HEIGHT - self.REACH < head_ball_y
+                             < head_y - self.REACH / 2) else "ready"
+        # Kick when the ball is at the foot and in front of it
+        in_front = ball.x >= foot_x - 5 if player.is_left_player else ball.x <= foot_x + 5
+        foot_dist = ((ball.x - foot_x) ** 2 + (ball.y - foot_y) ** 2) ** 0.5
+        kick = "kicking" if in_front and foot_dist < self.REACH + 10 else "ready"
+        return {"movement": movement, "jump": jump, "kick": kick}
+
+    def find_intercept(self, player, prediction):
+        """First predicted ball position the player can reach in time
+
+        Returns:
+            tuple: (x, y) of the ball at that point, or None
+        """
+        head_y = player.head_position[1]
+        move_speed = self.world.params.move_speed
+        for tick, (ball_x, ball_y) in enumerate(prediction.path, 1):
+            if ball_y < head_y - self.JUMP_HEIGHT - self.REACH:
+                continue  # Too high to reach even with a jump
+            if abs(self.strike_position(player, ball_x) - player.x) <= move_speed * tick:
+                return ball_x, ball_y
+        return None
+
+    def strike_position(self, player, ball_x):
+        """Where to stand to play the ball towards the opponent's goal"""
+        return ball_x - self.BEHIND if player.is_left_player else ball_x + self.BEHIND
+
+    def own_goal(self, player):
+        """Side credited when this player concedes"""
+        return "right" if player.is_left_player else "left"
+
+    def defend_position(self, player, world):
+        """Spot just in front of the player's own goal"""
+        bounds = world.field.left_goal_bounds if player.is_left_player else world.field.right_goal_bounds
+        return bounds['x2'] + 30 if player.is_left_player else bounds['x1'] - 30
+
+    def stop(self):
+        """Stop any background work; the base controller is left alone"""
+        pass
+
+    def cleanup(self):
+        """Stop the AI and clean up the base controller"""
+        self.stop()
+        if self.base:
+            self.base.cleanup()
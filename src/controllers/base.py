@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
 
+# Control state of a player pressing nothing
+IDLE = {"movement": "none", "jump": "ready", "kick": "ready"}
+
 class Controller(ABC):
     """Base class for all game controllers (keyboard, vision, etc.)"""
     
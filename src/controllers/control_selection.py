@@ -1,6 +1,5 @@
+from src.graphics.assets import assets, CONTROLS_BACKGROUND
 from src.graphics.graphics import Image, Point, Rectangle, Text
-from PIL import Image as PILImage
-import os
 import time
 
 class ControlSelector:
@@ -52,38 +51,22 @@ class ControlSelector:
         """
         print("Mostrando pantalla de selección...")  # Debug print
         
-        # Load the GIF background image directly
-        src_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        bg_image_path = os.path.join(src_dir, "src", "assets", "images", "istockphoto-1204755567-612x612.gif")
-        
+        # Background image, from the asset bundle or its own file
+        bg_image = None
         try:
-            print(f"Loading background image from: {bg_image_path}")
-            if os.path.exists(bg_image_path):
+            print(f"Loading background image: {CONTROLS_BACKGROUND}")
+            if assets.has(CONTROLS_BACKGROUND):
                 # Creamos un rectángulo blanco del tamaño de la ventana
                 bg_rect = Rectangle(Point(0, 0), Point(x, y))
                 bg_rect.setFill("white")
                 bg_rect.setWidth(0)
                 bg_rect.draw(self.window)
 
-                # Abrimos la imagen GIF con PIL y la redimensionamos
-                pil_img = PILImage.open(bg_image_path)
-                # Redimensionar manteniendo proporción para cubrir la ventana
-                orig_w, orig_h = pil_img.size
-                scale_x = x / orig_w
-                scale_y = y / orig_h
-                scale = max(scale_x, scale_y)
-                new_w = int(orig_w * scale)
-                new_h = int(orig_h * scale)
-                pil_img = pil_img.resize((new_w, new_h), PILImage.LANCZOS)
-
-                # Guardar imagen temporalmente
-                temp_path = os.path.join(os.path.dirname(bg_image_path), "_temp_bg.gif")
-                pil_img.save(temp_path, format="GIF")
-
-                # Cargar la imagen escalada en el objeto Image
-                background = Image(Point(x/2, y/2), temp_path)
+                # Imagen redimensionada para cubrir la ventana, en caché
+                # tras la primera visita
+                background = Image(Point(x/2, y/2), assets.cover(CONTROLS_BACKGROUND, (x, y)))
                 background.draw(self.window)
-                print(f"Successfully set background image with scale factor: {scale}")
+                print("Successfully set background image")
                 bg_image = background
             
         except Exception as e:
@@ -0,0 +1,250 @@
+import multiprocessing
+import threading
+import numpy as np
+from .ai import AIController
+from ..core.game.batch import BatchWorld
+from ..core.game.world import World
+
+# Opponent movements each plan is tested against
+OPPONENT_MOVES = (-1, 0, 1)
+
+
+def candidate_plans(horizon):
+    """Input sequences to try: (movement, jump tick, kick tick)
+
+    The movement is held for the whole horizon; the jump and kick controls
+    are pressed once at the given tick, or never (None). Plans that press
+    something early come first, so a search cut short has tried them.
+    """
+    timings = [0, None] + [t for t in (4, 8, 14) if t < horizon]
+    return [(movement, jump, kick)
+            for jump in timings for kick in timings for movement in (1, -1, 0)]
+
+
+class RolloutPlanner:
+    """Scores plans for one player by rolling every one of them out in a BatchWorld"""
+
+    GOAL_VALUE = 1000
+
+    def __init__(self, player, horizon=45, chunk=75, substeps=1, params=None):
+        """Create a planner
+
+        Args:
+            player: Player number to plan for
+            horizon: Ticks each rollout looks ahead
+            chunk: Plans rolled out per batch. Smaller chunks let the search
+                stop sooner but cost more per plan; the default covers every
+                candidate in one batch
+            substeps: Physics substeps of the simulated world
+            params: PhysicsParams of the simulated world
+        """
+        self.player = player
+        self.col = player - 1
+        self.side = 1 if player == 1 else -1  # Direction of the opponent's goal
+        self.horizon = horizon
+        self.plans = candidate_plans(horizon)
+        self.chunk = min(chunk, len(self.plans))
+        self.world = World(substeps=substeps, params=params)
+        self.batch = BatchWorld(chunk * len(OPPONENT_MOVES), substeps=substeps, params=params)
+
+    def inputs(self, plans):
+        """Per-tick (movement, jump, kick) arrays for a chunk of plans
+
+        Rows are ordered plan-major: every opponent move of plan 0, then plan 1...
+        """
+        rows = self.batch.n
+        count = len(OPPONENT_MOVES)
+        movement = np.zeros((self.horizon, rows, 2), dtype=int)
+        jump = np.zeros((self.horizon, rows, 2), dtype=bool)
+        kick = np.zeros((self.horizon, rows, 2), dtype=bool)
+        for index, (move, jump_tick, kick_tick) in enumerate(plans):
+            block = slice(index * count, (index + 1) * count)
+            movement[:, block, self.col] = move
+            movement[:, block, 1 - self.col] = OPPONENT_MOVES
+            if jump_tick is not None:
+                jump[jump_tick, block, self.col] = True
+            if kick_tick is not None:
+                kick[kick_tick, block, self.col] = True
+        return movement, jump, kick
+
+    def evaluate(self, plans):
+        """Worst-case score of each plan over the opponent moves, from ``self.world``"""
+        batch = self.batch
+        batch.load_world(self.world)
+        start_ball_x = self.world.ball.x
+        movement, jump, kick = self.inputs(plans)
+
+        scored = np.zeros(batch.n, dtype=bool)
+        conceded = np.zeros(batch.n, dtype=bool)
+        own = 0 if self.player == 1 else 1
+        for tick in range(self.horizon):
+            before = batch.score.copy()
+            batch.step(movement[tick], jump[tick], kick[tick])
+            gained = batch.score - before
+            scored |= (gained[:, own] > 0) & ~conceded
+            conceded |= (gained[:, 1 - own] > 0) & ~scored
+            # Carry on from kickoff after a goal, like the game does
+            batch.reset_positions(batch.is_goal)
+
+        # Positional terms only mean something where play wasn't reset by a goal
+        player_x = batch.player_x[:, self.col]
+        position = (self.side * (batch.ball_x - start_ball_x)
+                    + 5 * self.side * batch.ball_velx
+                    - 0.5 * np.abs(player_x - batch.ball_x))
+        score = np.where(scored | conceded,
+                         self.GOAL_VALUE * (scored.astype(float) - conceded), position)
+        score = score.reshape(-1, len(OPPONENT_MOVES)).min(axis=1)
+        return score[:len(plans)]
+
+    def search(self, snapshot, rollouts=None, should_stop=None):
+        """Find the best plan from a world snapshot
+
+        Args:
+            snapshot: ``World.snapshot()`` to plan from
+            rollouts: Max rollouts (plans x opponent moves) to run (default: all)
+            should_stop: Optional callable checked between chunks; the best
+                plan so far is returned once it returns True
+
+        Returns:
+            tuple: (best plan, its score, rollouts run)
+        """
+        self.world.restore(snapshot)
+        limit = len(self.plans) if rollouts is None else max(1, rollouts // len(OPPONENT_MOVES))
+        best, best_score, done = None, -np.inf, 0
+        for start in range(0, min(limit, len(self.plans)), self.chunk):
+            plans = self.plans[start:min(start + self.chunk, limit)]
+            scores = self.evaluate(plans + [plans[-1]] * (self.chunk - len(plans)))[:len(plans)]
+            index = int(np.argmax(scores))
+            if scores[index] > best_score:
+                best, best_score = plans[index], float(scores[index])
+            done += len(plans) * len(OPPONENT_MOVES)
+            if should_stop is not None and should_stop():
+                break
+        return best, best_score, done
+
+
+def _search_worker(conn, player, horizon, rollouts, substeps, params):
+    """Plan on every snapshot received, always moving on to the newest one"""
+    planner = RolloutPlanner(player, horizon, substeps=substeps, params=params)
+    while True:
+        message = conn.recv()
+        while message is not None and conn.poll():
+            message = conn.recv()
+        if message is None:
+            break
+        tick, snapshot = message
+        plan, _, _ = planner.search(snapshot, rollouts, should_stop=conn.poll)
+        conn.send((tick, plan))
+    conn.close()
+
+
+class SearchAIController(AIController):
+    """Stronger AI that picks inputs by rolling out many short futures
+
+    Every AI player gets a background worker (a process by default, so the
+    search runs on another core) that receives world snapshots and sends
+    back the best input plan found. Until a plan arrives, or when the plan
+    is out of date, the heuristic ``AIController`` decides instead.
+
+    With ``worker="inline"`` the search runs synchronously every ``replan``
+    ticks instead, which is slow but deterministic, for headless matches.
+    """
+
+    def __init__(self, players=(2,), base=None, budget=0.0005, world=None, predictor=None,
+                 horizon=45, rollouts=None, worker="process", replan=3):
+        """Create a search AI
+
+        Args:
+            players: Player numbers (1, 2 or both) driven by the AI
+            base: Optional controller for the other players
+            budget: Per-tick time budget of the heuristic fallback, in seconds
+            world: World to play in; can also be given later with ``attach``
+            predictor: TrajectoryPredictor to share
+            horizon: Ticks each rollout looks ahead
+            rollouts: Max rollouts per decision (default: every candidate plan)
+            worker: "process", "thread" or "inline"
+            replan: Ticks between searches in inline mode
+        """
+        self.horizon = horizon
+        self.rollouts = rollouts
+        self.worker = worker
+        self.replan = replan
+        self.planners = {}
+        self.workers = {}
+        self.plans = {}
+        self.pending = {}
+        self.requested_score = {}
+        super().__init__(players, base, budget, world, predictor)
+
+    def attach(self, world):
+        """Start playing in a world and start the search workers"""
+        super().attach(world)
+        self.plans.clear()
+        if self.workers or self.planners:
+            return
+        for number in self.players:
+            if self.worker == "inline":
+                self.planners[number] = RolloutPlanner(number, self.horizon, substeps=world.substeps,
+                                                       params=world.params)
+                continue
+            conn, worker_conn = multiprocessing.Pipe()
+            args = (worker_conn, number, self.horizon, self.rollouts, world.substeps, world.params)
+            if self.worker == "thread":
+                worker = threading.Thread(target=_search_worker, args=args, daemon=True)
+            else:
+                worker = multiprocessing.Process(target=_search_worker, args=args, daemon=True)
+            worker.start()
+            self.workers[number] = (worker, conn)
+            self.pending[number] = False
+
+    def decide(self, number, deadline):
+        """Input from the latest search plan, or the heuristic without one"""
+        if self.world is None:
+            return super().decide(number, deadline)
+        world = self.world
+        if self.worker == "inline":
+            entry = self.plans.get(number)
+            if entry is None or world.tick - entry[0] >= self.replan or entry[1] != world.score:
+                plan, _, _ = self.planners[number].search(world.snapshot(), self.rollouts)
+                self.plans[number] = (world.tick, dict(world.score), plan)
+        else:
+            self.receive_plans(number)
+
+        entry = self.plans.get(number)
+        if entry is not None:
+            tick, score, plan = entry
+            offset = world.tick - tick
+            # Plans from before a goal or too old don't apply anymore
+            if plan is not None and score == world.score and 0 <= offset < self.horizon:
+                move, jump_tick, kick_tick = plan
+                return {
+                    "movement": "right" if move > 0 else "left" if move < 0 else "none",
+                    "jump": "jumping" if offset == jump_tick else "ready",
+                    "kick": "kicking" if offset == kick_tick else "ready"
+                }
+        return super().decide(number, deadline)
+
+    def receive_plans(self, number):
+        """Collect the worker's plans and hand it the current state when it's free"""
+        world = self.world
+        _, conn = self.workers[number]
+        while conn.poll():
+            tick, plan = conn.recv()
+            self.plans[number] = (tick, self.requested_score[number], plan)
+            self.pending[number] = False
+        if not self.pending[number]:
+            conn.send((world.tick, world.snapshot()))
+            self.requested_score[number] = dict(world.score)
+            self.pending[number] = True
+
+    def stop(self):
+        """Stop the search workers"""
+        for worker, conn in self.workers.values():
+            try:
+                conn.send(None)
+            except (OSError, BrokenPipeError):
+                pass
+            worker.join(timeout=1)
+            if isinstance(worker, multiprocessing.Process) and worker.is_alive():
+                worker.terminate()
+        self.workers.clear()
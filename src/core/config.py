@@ -35,4 +35,12 @@ altura_inicial = 503
 gol = False
 contador_gol1 = 0
 contador_gol2 = 0
-cont_trave = 0
\ No newline at end of file
+cont_trave = 0
+
+# Game loop
+tick_rate = 60          # Physics ticks per second
+max_catchup_ticks = 5   # Max physics ticks run in one frame before dropping time
+physics_substeps = 1    # Physics substeps per tick (2 = 120 Hz, 4 = 240 Hz)
+
+# Rendering
+show_hitboxes = False   # Draw the head, foot and ball collision circles
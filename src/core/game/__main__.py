@@ -1,8 +1,48 @@
-from .game import Game
+import argparse
+import time
 
 def main():
     """Entry point for the game"""
-    game = Game()
+    parser = argparse.ArgumentParser(description="Head Soccer")
+    parser.add_argument("--record", metavar="PATH",
+                        help="record controller input to a replay log")
+    parser.add_argument("--replay", metavar="PATH",
+                        help="play a replay log headless as fast as possible")
+    parser.add_argument("--watch", action="store_true",
+                        help="with --replay, show the replay in the game window")
+    parser.add_argument("--net-player", type=int, choices=(1, 2),
+                        help="play this player against a peer over UDP")
+    parser.add_argument("--net-port", type=int, default=7000,
+                        help="local UDP port for network play")
+    parser.add_argument("--peer", metavar="HOST:PORT",
+                        help="address of the other machine for network play")
+    parser.add_argument("--ai", choices=("1", "2", "both"),
+                        help="let the computer play player 1, player 2 or both")
+    parser.add_argument("--ai-level", choices=("normal", "search"), default="normal",
+                        help="computer strength; search rolls out futures on another core")
+    args = parser.parse_args()
+
+    if args.replay and not args.watch:
+        from .replay import replay
+        start = time.perf_counter()
+        world = replay(args.replay)
+        elapsed = time.perf_counter() - start
+        print(f"[INFO] Replayed {world.tick} ticks in {elapsed:.3f}s "
+              f"({world.tick / max(elapsed, 1e-9):.0f} ticks/s)")
+        print(f"[INFO] Final score: {world.score['left']} - {world.score['right']}")
+        return
+
+    net = None
+    if args.net_player:
+        if not args.peer:
+            parser.error("--net-player requires --peer")
+        host, _, port = args.peer.rpartition(":")
+        net = (args.net_player, args.net_port, (host or "127.0.0.1", int(port)))
+
+    from .game import Game
+    ai_players = {None: (), "1": (1,), "2": (2,), "both": (1, 2)}[args.ai]
+    game = Game(record_path=args.record, replay_path=args.replay, net=net, ai_players=ai_players,
+                ai_level=args.ai_level)
     try:
         game.run()
     finally:
@@ -1,100 +1,102 @@
-from ...graphics.graphics import Circle, Point, Image
-from ..config import raio
+from ...graphics.assets import assets
+from ...graphics.graphics import Circle, Point, Image, Group
+from ..config import raio, show_hitboxes
+from .world import BallState
 
 class Ball:
     def __init__(self, x, y, window):
-        """Initialize the ball with its collision circle and sprite
-        
+        """Initialize the ball state and its sprite
+
+        The collision shape lives in the state; it is only drawn, as an
+        outline, when show_hitboxes is set.
+
         Args:
             x: Initial x position
             y: Initial y position
             window: GraphWin window to draw on
         """
-        self.collision_circle = Circle(Point(x, y), raio)
-        self.collision_circle.setOutline("")
-        self.collision_circle.setFill("")
-        self.collision_circle.draw(window)
-        
-        # Get correct path for ball sprite
-        import os
-        src_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        images_dir = os.path.join(src_dir, "assets", "images")
-        ball_path = os.path.join(images_dir, "ball.gif")
-        
-        self.sprite = Image(Point(x, y), ball_path)
-        self.sprite.draw(window)
-        
-        self.velx = 0
-        self.vely = 0
+        self.state = BallState(x, y)
+
+        # Every canvas item of the ball, moved with one canvas call
+        self.sprite = Image(Point(x, y), assets.get("ball.gif"))
+        self.entity = Group(self.sprite)
+        if show_hitboxes:
+            hitbox = Circle(Point(x, y), raio)
+            hitbox.setOutline("yellow")
+            self.entity.add(hitbox)
+        self.entity.draw(window)
+
+        # Position currently shown on the canvas
+        self.drawn_x = x
+        self.drawn_y = y
+        self.store_previous()
         self.window = window
-        
+
     @property
     def x(self):
         """Current x position of the ball"""
-        return self.collision_circle.getCenter().getX()
-        
+        return self.state.x
+
     @property
     def y(self):
         """Current y position of the ball"""
-        return self.collision_circle.getCenter().getY()
-        
+        return self.state.y
+
+    @property
+    def velx(self):
+        return self.state.velx
+
+    @velx.setter
+    def velx(self, value):
+        self.state.velx = value
+
+    @property
+    def vely(self):
+        return self.state.vely
+
+    @vely.setter
+    def vely(self, value):
+        self.state.vely = value
+
     def move(self, dx, dy):
         """Move the ball by the given amounts"""
-        self.collision_circle.move(dx, dy)
-        self.sprite.move(dx, dy)
-        
+        self.state.move(dx, dy)
+
     def set_position(self, x, y):
         """Set the ball to a specific position"""
-        current_x = self.x
-        current_y = self.y
-        self.move(x - current_x, y - current_y)
-        
-    def apply_physics(self, atrito, chao):
+        self.state.set_position(x, y)
+
+    def apply_physics(self, atrito, chao, dt=1.0):
         """Apply physics calculations to the ball
-        
+
         Args:
             atrito: Friction coefficient
             chao: Floor y-coordinate
+            dt: Time step in ticks
         """
-        # Apply gravity when ball is in air
-        if self.y + raio < chao:
-            # Apply gravity with increasing effect up to terminal velocity
-            if self.vely < 12:  # Terminal velocity
-                self.vely += 0.4  # Base gravity
-
-            
-        # Apply velocity
-        self.move(2 * self.velx // 1, 2 * self.vely // 1)
-        
-        # Ground collision and friction
-        if self.y + raio >= chao:
-            # Enforce ground boundary and calculate bounce
-            if self.y + raio > chao:
-                # Move to ground surface
-                self.move(0, chao - (self.y + raio))
-                
-                # Calculate bounce with more energy loss
-                bounce_factor = min(0.6, max(0.3, abs(self.vely) / 25))  # Reducimos el factor de rebote
-                if abs(self.vely) > 2:  # Only bounce if moving fast enough
-                    self.vely = (self.vely * -bounce_factor) // 1
-                else:
-                    self.vely = 0  # Stop vertical movement
-                    
-                # Reduce horizontal speed more on impact
-                self.velx = (self.velx * 0.6) // 1  # Mayor pérdida de velocidad horizontal
-                
-            if self.y + raio == chao:
-                # Apply friction when ball is on ground
-                if self.velx > 0:
-                    self.velx -= atrito
-                if self.velx < 0:
-                    self.velx += atrito
-                # Ensure velocity stops at zero
-                if abs(self.velx) < atrito:
-                    self.velx = 0
-                    
+        self.state.apply_physics(atrito, chao, dt)
+
     def reset(self, x, y):
         """Reset ball to initial position with no velocity"""
-        self.set_position(x, y)
-        self.velx = 0
-        self.vely = 0
+        self.state.reset(x, y)
+
+    def store_previous(self):
+        """Remember the current state as the start of the next interpolation"""
+        self.prev_x = self.state.x
+        self.prev_y = self.state.y
+
+    def render(self, alpha=1.0):
+        """Move the canvas items to the state position
+
+        Args:
+            alpha: Interpolation factor between the previous tick (0) and
+                the current one (1)
+        """
+        target_x = self.prev_x + (self.state.x - self.prev_x) * alpha
+        target_y = self.prev_y + (self.state.y - self.prev_y) * alpha
+        dx = target_x - self.drawn_x
+        dy = target_y - self.drawn_y
+        if dx or dy:
+            self.entity.move(dx, dy)
+            self.drawn_x = target_x
+            self.drawn_y = target_y
@@ -0,0 +1,434 @@
+"""Vectorized simulation of many independent matches.
+
+``BatchWorld`` holds the state of N matches in NumPy arrays and advances all
+of them with one call to ``step``. Every kernel reproduces the scalar rules in
+``world.py`` operation by operation, so a batch row stays bit-identical to a
+``World`` fed the same inputs.
+"""
+import numpy as np
+from ..config import x as field_width, raio, raio_cabeca, chao, physics_substeps
+from .params import DEFAULT_PARAMS
+from .world import (
+    World, PlayerState, FieldRules, FieldGrid, BALL_START, PLAYER1_START, PLAYER2_START,
+    CROSSBAR_DEPTH
+)
+
+# Movement codes used for batched inputs
+MOVEMENT_CODES = {"none": 0, "left": -1, "right": 1}
+MOVEMENT_NAMES = {code: name for name, code in MOVEMENT_CODES.items()}
+
+# Sprite action codes ('', 'kick1', 'kick2')
+SPRITE_ACTIONS = ('', 'kick1', 'kick2')
+
+COLLISION_RADIUS = 40
+
+
+def encode_inputs(player_states):
+    """Convert one ``Controller.process_input`` dict to batch input rows
+
+    Returns:
+        tuple: (movement, jump, kick) arrays of shape (2,)
+    """
+    movement = np.array([MOVEMENT_CODES[player_states[p]["movement"]] for p in (1, 2)])
+    jump = np.array([player_states[p]["jump"] == "jumping" for p in (1, 2)])
+    kick = np.array([player_states[p]["kick"] == "kicking" for p in (1, 2)])
+    return movement, jump, kick
+
+
+def decode_inputs(movement, jump, kick):
+    """Convert one batch input row back to the ``process_input`` dict format"""
+    return {
+        p: {
+            "movement": MOVEMENT_NAMES[int(movement[p - 1])],
+            "jump": "jumping" if jump[p - 1] else "ready",
+            "kick": "kicking" if kick[p - 1] else "ready"
+        }
+        for p in (1, 2)
+    }
+
+
+def _jump_height(elapsed):
+    """Vectorized world.jump_height"""
+    return 8 * np.minimum(elapsed, 12) - 8 * np.maximum(elapsed - 12, 0)
+
+
+class BatchWorld:
+    """State of N matches stored column-wise in NumPy arrays
+
+    Player arrays have shape (N, 2); column 0 is the left player and column 1
+    the right player. Score columns are ordered ("left", "right").
+    """
+
+    def __init__(self, n, field=None, substeps=physics_substeps, params=None):
+        """Create N matches at kickoff
+
+        Args:
+            n: Number of matches
+            field: FieldRules to use (default: rules for the configured width
+                and ``params``)
+            substeps: Physics substeps per tick
+            params: PhysicsParams (default: those of ``field``), as in ``World``
+        """
+        self.n = n
+        self.substeps = substeps
+        if field is None:
+            field = FieldRules(field_width, params if params is not None else DEFAULT_PARAMS)
+        self.field = field
+        self.params = params if params is not None else field.params
+        # Field grid with a ring of all-flags cells around it, so a clipped
+        # index covers positions off the field
+        grid = self.field.grid
+        cells = np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.rows, grid.cols)
+        self.field_cells = np.pad(cells, 1, constant_values=FieldGrid.COLLISION | FieldGrid.GOAL)
+
+        self.ball_x = np.full(n, float(BALL_START[0]))
+        self.ball_y = np.full(n, float(BALL_START[1]))
+        self.ball_velx = np.zeros(n)
+        self.ball_vely = np.zeros(n)
+
+        self.player_x = np.tile(np.array([PLAYER1_START[0], PLAYER2_START[0]], dtype=float), (n, 1))
+        self.player_y = np.tile(np.array([PLAYER1_START[1], PLAYER2_START[1]], dtype=float), (n, 1))
+        self.foot_dx = np.zeros((n, 2))
+        self.foot_dy = np.zeros((n, 2))
+        self.jumping = np.zeros((n, 2), dtype=bool)
+        self.jump_ready = np.ones((n, 2), dtype=bool)
+        self.jump_count = np.zeros((n, 2))
+        self.kicking = np.zeros((n, 2), dtype=bool)
+        self.kick_count = np.zeros((n, 2))
+        self.sprite_action = np.zeros((n, 2), dtype=np.int8)
+
+        self.score = np.zeros((n, 2), dtype=np.int64)
+        self.is_goal = np.zeros(n, dtype=bool)
+        self.tick = np.zeros(n, dtype=np.int64)
+
+        # +1 for the left player, -1 for the right player
+        self._side = np.array([1, -1])
+
+    # ------------------------------------------------------------------
+    # Conversion from and to the scalar world
+    # ------------------------------------------------------------------
+
+    def load_world(self, world, rows=slice(None)):
+        """Copy the state of a scalar World into the given rows"""
+        ball = world.ball
+        self.ball_x[rows] = ball.x
+        self.ball_y[rows] = ball.y
+        self.ball_velx[rows] = ball.velx
+        self.ball_vely[rows] = ball.vely
+        for col, player in enumerate((world.player1, world.player2)):
+            self.player_x[rows, col] = player.x
+            self.player_y[rows, col] = player.y
+            self.foot_dx[rows, col] = player.foot_dx
+            self.foot_dy[rows, col] = player.foot_dy
+            self.jumping[rows, col] = player.jumping
+            self.jump_ready[rows, col] = player.jump_ready
+            self.jump_count[rows, col] = player.jump_count
+            self.kicking[rows, col] = player.kicking
+            self.kick_count[rows, col] = player.kick_count
+            self.sprite_action[rows, col] = SPRITE_ACTIONS.index(player.sprite_action)
+        self.score[rows, 0] = world.score["left"]
+        self.score[rows, 1] = world.score["right"]
+        self.is_goal[rows] = world.is_goal
+        self.tick[rows] = world.tick
+
+    def to_world(self, row):
+        """Build a scalar World holding the state of one row"""
+        world = World(field=self.field, substeps=self.substeps, params=self.params)
+        ball = world.ball
+        ball.x = float(self.ball_x[row])
+        ball.y = float(self.ball_y[row])
+        ball.velx = float(self.ball_velx[row])
+        ball.vely = float(self.ball_vely[row])
+        for col, player in enumerate((world.player1, world.player2)):
+            player.x = float(self.player_x[row, col])
+            player.y = float(self.player_y[row, col])
+            player.foot_dx = float(self.foot_dx[row, col])
+            player.foot_dy = float(self.foot_dy[row, col])
+            player.jumping = bool(self.jumping[row, col])
+            player.jump_ready = bool(self.jump_ready[row, col])
+            player.jump_count = float(self.jump_count[row, col])
+            player.kicking = bool(self.kicking[row, col])
+            player.kick_count = float(self.kick_count[row, col])
+            player.sprite_action = SPRITE_ACTIONS[self.sprite_action[row, col]]
+        world.score = {"left": int(self.score[row, 0]), "right": int(self.score[row, 1])}
+        world.is_goal = bool(self.is_goal[row])
+        world.tick = int(self.tick[row])
+        return world
+
+    # ------------------------------------------------------------------
+    # Simulation
+    # ------------------------------------------------------------------
+
+    def step(self, movement, jump, kick):
+        """Advance every match by one tick
+
+        Args:
+            movement: (N, 2) array of -1 (left), 0 (none) or 1 (right)
+            jump: (N, 2) bool array, True where the jump control is active
+            kick: (N, 2) bool array, True where the kick control is active
+
+        Returns:
+            numpy.ndarray: (N,) bool array, True where a goal is pending
+        """
+        self.apply_inputs(movement, jump, kick)
+        self.update_physics()
+        return self.is_goal
+
+    def apply_inputs(self, movement, jump, kick):
+        """Apply batched control states to all players"""
+        self._move_players(np.asarray(movement) * self.params.move_speed, 0.0)
+
+        start = np.asarray(jump, dtype=bool) & self.jump_ready & ~self.jumping & ~self.kicking
+        self.jumping |= start
+        self.jump_count[start] = 0
+        self.jump_ready &= ~start
+
+        start = np.asarray(kick, dtype=bool) & ~self.kicking
+        self.kicking |= start
+        self.kick_count[start] = 0
+
+    def update_physics(self):
+        """Advance physics and collisions of all matches by one tick"""
+        dt = 1.0 / self.substeps
+        for _ in range(self.substeps):
+            self.integrate(dt)
+        self.tick += 1
+
+    def integrate(self, dt):
+        """Advance physics and collisions of all matches by ``dt`` ticks"""
+        self.update_jump(dt)
+        self.update_kick(dt)
+        self.handle_collisions()
+
+        # Only matches whose ball is in a flagged field cell need the exact rules
+        rows = np.flatnonzero(self.field_flags(self.ball_x, self.ball_y) & FieldGrid.COLLISION)
+        if rows.size:
+            self.ball_velx[rows], self.ball_vely[rows] = self.check_field_collision(
+                self.ball_x[rows], self.ball_y[rows], self.ball_velx[rows], self.ball_vely[rows]
+            )
+        self.apply_ball_physics(dt)
+
+        scored = np.zeros(self.n, dtype=bool)
+        left_scores = np.zeros(self.n, dtype=bool)
+        rows = np.flatnonzero(self.field_flags(self.ball_x, self.ball_y) & FieldGrid.GOAL)
+        if rows.size:
+            scored[rows], left_scores[rows] = self.check_goal(self.ball_x[rows], self.ball_y[rows])
+        scored &= ~self.is_goal
+        self.score[:, 0] += scored & left_scores
+        self.score[:, 1] += scored & ~left_scores
+        self.is_goal |= scored
+
+    def _move_players(self, dx, dy):
+        """Vectorized PlayerState.move, including the field boundary clamp"""
+        dx = np.broadcast_to(dx, self.player_x.shape)
+        blocked = (((dx < 0) & (self.player_x - raio_cabeca + dx <= 0)) |
+                   ((dx > 0) & (self.player_x + raio_cabeca + dx >= field_width)))
+        self.player_x = self.player_x + np.where(blocked, 0, dx)
+        self.player_y = self.player_y + dy
+
+    def update_jump(self, dt=1.0):
+        """Vectorized PlayerState.update_jump"""
+        active = self.jumping & ~self.kicking
+        elapsed = np.minimum(self.jump_count + dt, 24)
+        rise = _jump_height(self.jump_count) - _jump_height(elapsed)
+        self._move_players(0.0, np.where(active, rise, 0.0))
+        self.jump_count = np.where(active, self.jump_count + dt, self.jump_count)
+
+        landed = active & (self.jump_count >= 24)
+        self.jumping &= ~landed
+        self.jump_count[landed] = 0
+
+        foot_y = self.player_y + PlayerState.FOOT_OFFSET + self.foot_dy
+        self.jump_ready |= foot_y + raio >= chao - 5
+
+    def update_kick(self, dt=1.0):
+        """Vectorized PlayerState.update_kick"""
+        kicking = self.kicking
+        self.kick_count = np.where(kicking, self.kick_count + dt, self.kick_count)
+        done = kicking & (self.kick_count >= 15)
+        swinging = kicking & ~done
+
+        swing = 2 * (self.kick_count - 8)
+        late = self.kick_count > 8
+        offset_x = np.where(late, swing * self._side, 0.0)
+        offset_y = np.where(late, 8 - swing, 8.0)
+        self.foot_dx = np.where(swinging, offset_x, np.where(done, 0.0, self.foot_dx))
+        self.foot_dy = np.where(swinging, offset_y, np.where(done, 0.0, self.foot_dy))
+        self.sprite_action = np.where(swinging, np.where(late, 2, 1),
+                                      np.where(done, 0, self.sprite_action)).astype(np.int8)
+
+        self.kick_count[done] = 0
+        self.kicking = swinging
+
+    def handle_collisions(self):
+        """Vectorized World.handle_collisions"""
+        # Both players are tested against the ball position at the start of the tick
+        ball_x = self.ball_x.copy()
+        ball_y = self.ball_y.copy()
+
+        params = self.params
+        # Player 1's contact is resolved twice, as in the scalar world
+        for col, head_velx, passes in ((0, params.header_velx, 2), (1, -params.header_velx, 1)):
+            head_x = self.player_x[:, col]
+            head_y = self.player_y[:, col] + PlayerState.HEAD_OFFSET
+            foot_x = self.player_x[:, col] + self.foot_dx[:, col]
+            foot_y = self.player_y[:, col] + PlayerState.FOOT_OFFSET + self.foot_dy[:, col]
+            head_dist = np.hypot(head_x - ball_x, head_y - ball_y)
+            foot_dist = np.hypot(foot_x - ball_x, foot_y - ball_y)
+
+            hit = (head_dist <= COLLISION_RADIUS) | (foot_dist <= COLLISION_RADIUS)
+            if not hit.any():
+                continue
+
+            is_foot = head_dist > foot_dist
+            contact_x = np.where(is_foot, foot_x, head_x)
+            contact_y = np.where(is_foot, foot_y, head_y)
+
+            dx = ball_x - contact_x
+            dy = ball_y - contact_y
+            dist = np.sqrt(dx*dx + dy*dy)
+            hit &= dist > 0
+            with np.errstate(invalid="ignore", divide="ignore"):
+                nx = dx/dist
+                ny = dy/dist
+
+            base_force = params.touch_force
+            kick_force = base_force * params.kick_force
+            kick = is_foot & self.kicking[:, col]
+            touch = is_foot & ~self.kicking[:, col]
+            with np.errstate(invalid="ignore"):
+                new_velx = np.where(kick, np.trunc(kick_force * params.kick_forward * nx),
+                                    np.where(touch, np.trunc(base_force * nx), head_velx))
+                new_vely = np.where(kick, float(int(kick_force * -params.kick_lift)),
+                                    np.where(touch, np.trunc(base_force * ny * -params.touch_lift),
+                                             params.header_vely))
+            self.ball_velx = np.where(hit, new_velx, self.ball_velx)
+            self.ball_vely = np.where(hit, new_vely, self.ball_vely)
+
+            separation_distance = COLLISION_RADIUS + 1
+            with np.errstate(invalid="ignore"):
+                ball_move_x = (contact_x + separation_distance * nx) - ball_x
+                ball_move_y = (contact_y + separation_distance * ny) - ball_y
+            for _ in range(passes):
+                self.ball_x = np.where(hit, self.ball_x + ball_move_x, self.ball_x)
+                self.ball_y = np.where(hit, self.ball_y + ball_move_y, self.ball_y)
+
+    def field_flags(self, ball_x, ball_y):
+        """Vectorized FieldGrid.lookup
+
+        Returns:
+            ndarray: uint8 FieldGrid flags of each ball position
+        """
+        grid = self.field.grid
+        scale = 1.0 / grid.cell_size
+        col = np.clip(ball_x * scale + 1, 0, grid.cols + 1).astype(np.intp)
+        row = np.clip(ball_y * scale + 1, 0, grid.rows + 1).astype(np.intp)
+        return self.field_cells[row, col]
+
+    def check_field_collision(self, ball_x, ball_y, ball_velx, ball_vely):
+        """Vectorized FieldRules.check_field_collision
+
+        Returns:
+            tuple: (new_velx, new_vely) arrays
+        """
+        width = self.field.width
+        params = self.field.params
+        bounce_x = np.maximum(np.abs(ball_velx) * params.restitution, params.min_bounce_speed)
+        bounce_y = np.maximum(np.abs(ball_vely) * params.restitution, params.min_bounce_speed)
+
+        # Field boundaries
+        wall_push = params.wall_push
+        new_velx = np.where((ball_x + raio > width) & (ball_velx > 0), -bounce_x - wall_push, ball_velx)
+        new_velx = np.where((ball_x - raio < 0) & (ball_velx < 0), bounce_x + wall_push, new_velx)
+        new_vely = np.where((ball_y - raio < 0) & (ball_vely < 0),
+                            bounce_y + params.ceiling_push, ball_vely)
+
+        # Crossbars
+        push = np.where(ball_x < width / 2, params.crossbar_push, -params.crossbar_push)
+        for bounds in (self.field.left_goal_bounds, self.field.right_goal_bounds):
+            hit = ((bounds['x1'] - raio <= ball_x) & (ball_x <= bounds['x2'] + raio) &
+                   (ball_y <= bounds['y1'] + CROSSBAR_DEPTH) & (ball_y + raio > bounds['y1'] - 5))
+            new_vely = np.where(hit, -bounce_y, new_vely)
+            new_velx = np.where(hit, new_velx + push, new_velx)
+
+        return new_velx, new_vely
+
+    def apply_ball_physics(self, dt=1.0):
+        """Vectorized BallState.apply_physics"""
+        params = self.params
+        vely = self.ball_vely
+        vely = np.where((self.ball_y + raio < chao) & (vely < params.terminal_velocity),
+                        vely + params.gravity * dt, vely)
+        ball_x = self.ball_x + np.floor(params.velocity_scale * self.ball_velx) * dt
+        ball_y = self.ball_y + np.floor(params.velocity_scale * vely) * dt
+        velx = self.ball_velx
+
+        # Ground collision
+        below = ball_y + raio > chao
+        ball_y = np.where(below, ball_y + (chao - (ball_y + raio)), ball_y)
+        bounce_factor = np.minimum(params.bounce_max,
+                                   np.maximum(params.bounce_min, np.abs(vely) / params.bounce_speed))
+        bounced = np.where(np.abs(vely) > params.stop_speed, np.floor(vely * -bounce_factor), 0.0)
+        vely = np.where(below, bounced, vely)
+        velx = np.where(below, np.floor(velx * params.ground_damping), velx)
+
+        # Friction on the ground
+        grounded = ball_y + raio == chao
+        friction = params.friction * dt
+        velx = np.where(grounded & (velx > 0), velx - friction, velx)
+        velx = np.where(grounded & (velx < 0), velx + friction, velx)
+        velx = np.where(grounded & (np.abs(velx) < friction), 0.0, velx)
+
+        self.ball_x = ball_x
+        self.ball_y = ball_y
+        self.ball_velx = velx
+        self.ball_vely = vely
+
+    def check_goal(self, ball_x, ball_y):
+        """Vectorized FieldRules.check_goal
+
+        Returns:
+            tuple: (scored, left_scores) bool arrays
+        """
+        def inside(bounds):
+            return ((bounds['x1'] <= ball_x - raio) & (ball_x + raio <= bounds['x2']) &
+                    (bounds['y1'] <= ball_y + raio) & (ball_y - raio <= bounds['y2']) &
+                    (ball_y + raio > bounds['y1'] + CROSSBAR_DEPTH))
+
+        in_left = inside(self.field.left_goal_bounds)
+        in_right = inside(self.field.right_goal_bounds)
+        # The left goal is tested first, so it wins if both match
+        return in_left | in_right, ~in_left & in_right
+
+    def reset_positions(self, rows=None):
+        """Put ball and players of the given rows (default: all) back at kickoff"""
+        if rows is None:
+            rows = np.ones(self.n, dtype=bool)
+        # Copy, since the mask is often self.is_goal itself
+        rows = np.array(rows, dtype=bool)
+
+        self.is_goal &= ~rows
+        # BallState.reset moves by the difference, so mirror that arithmetic
+        self.ball_x = np.where(rows, self.ball_x + (BALL_START[0] - self.ball_x), self.ball_x)
+        self.ball_y = np.where(rows, self.ball_y + (BALL_START[1] - self.ball_y), self.ball_y)
+        self.ball_velx[rows] = 0
+        self.ball_vely[rows] = 0
+
+        target_x = np.array([PLAYER1_START[0], PLAYER2_START[0]], dtype=float)
+        target_y = np.array([PLAYER1_START[1], PLAYER2_START[1]], dtype=float)
+        mask = rows[:, None]
+        self._move_players(np.where(mask, target_x - self.player_x, 0.0),
+                           np.where(mask, target_y - self.player_y, 0.0))
+        for array, value in ((self.jumping, False), (self.jump_ready, True),
+                             (self.jump_count, 0), (self.kicking, False),
+                             (self.kick_count, 0), (self.foot_dx, 0),
+                             (self.foot_dy, 0), (self.sprite_action, 0)):
+            array[rows] = value
+
+    def reset_match(self, rows=None):
+        """Reset score and positions of the given rows (default: all)"""
+        if rows is None:
+            rows = np.ones(self.n, dtype=bool)
+        self.score[np.asarray(rows, dtype=bool)] = 0
+        self.reset_positions(rows)
+
@@ -0,0 +1,287 @@
+"""Contact detection and response between players, balls and goal posts.
+
+Every step the world is turned into a flat list of bodies: a head and a foot
+per player, one body per ball and the static crossbar sensors of each goal.
+Candidate pairs come from a uniform grid whose cells are at least as large as
+the widest contact, so the cost grows linearly with the number of bodies.
+Small scenes such as a 1v1 match skip the grid and test every pair, which is
+cheaper below ``GRID_MIN_BODIES``.
+
+Player contacts are resolved in the original game's order and against the
+ball position at the start of the step, so a 1v1 match plays out exactly as
+before.
+"""
+import math
+from ..config import raio
+from .params import DEFAULT_PARAMS
+
+# Body kinds
+HEAD = 0
+FOOT = 1
+BALL = 2
+POST = 3
+
+PLAYER_REACH = 40                   # Max ball centre distance from a head/foot centre
+PART_RADIUS = PLAYER_REACH - raio   # Head/foot radius that gives that reach against a ball
+SEPARATION = PLAYER_REACH + 1       # Distance the ball is moved out to
+CROSSBAR_DEPTH = 20                 # Crossbar depth below a goal's top; only a ball under it scores
+
+CELL_SIZE = 2 * PLAYER_REACH
+GRID_MIN_BODIES = 16
+
+
+class Body:
+    """A circle or axis-aligned box taking part in collision detection"""
+    __slots__ = ("kind", "owner", "x", "y", "radius", "half_width", "half_height", "sensor")
+
+    def __init__(self, kind, owner, x, y, radius=0, half_width=0, half_height=0, sensor=False):
+        """Create a body
+
+        Args:
+            kind: HEAD, FOOT, BALL or POST
+            owner: State object the body belongs to (PlayerState, BallState, ...)
+            x: Centre x position
+            y: Centre y position
+            radius: Circle radius, or 0 for a box
+            half_width: Box half width
+            half_height: Box half height
+            sensor: Sensors report contacts but are never resolved
+        """
+        self.kind = kind
+        self.owner = owner
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.half_width = half_width or radius
+        self.half_height = half_height or radius
+        self.sensor = sensor
+
+    def overlaps(self, other):
+        """Exact overlap test; at least one of the two bodies must be a circle"""
+        # Cheap bounding box rejection first
+        if (abs(self.x - other.x) > self.half_width + other.half_width
+                or abs(self.y - other.y) > self.half_height + other.half_height):
+            return False
+        if not self.radius:
+            return other.overlaps(self)
+        if other.radius:
+            return math.hypot(self.x - other.x, self.y - other.y) <= self.radius + other.radius
+        # Circle against box: distance to the closest point of the box
+        closest_x = min(max(self.x, other.x - other.half_width), other.x + other.half_width)
+        closest_y = min(max(self.y, other.y - other.half_height), other.y + other.half_height)
+        return math.hypot(self.x - closest_x, self.y - closest_y) <= self.radius
+
+
+def post_bodies(field):
+    """Crossbar sensors of both goals of a FieldRules
+
+    They cover the zone in which ``FieldRules.check_field_collision``
+    bounces the ball off the crossbar.
+    """
+    bodies = []
+    for bounds in (field.left_goal_bounds, field.right_goal_bounds):
+        top = bounds['y1'] - 5
+        bottom = bounds['y1'] + CROSSBAR_DEPTH
+        bodies.append(Body(POST, bounds, (bounds['x1'] + bounds['x2']) / 2, (top + bottom) / 2,
+                           half_width=(bounds['x2'] - bounds['x1']) / 2,
+                           half_height=(bottom - top) / 2, sensor=True))
+    return bodies
+
+
+class CollisionSystem:
+    """Finds and resolves contacts between any number of players and balls"""
+
+    def __init__(self, cell_size=CELL_SIZE, grid_min_bodies=GRID_MIN_BODIES, params=DEFAULT_PARAMS):
+        """Create a collision system
+
+        Args:
+            cell_size: Broadphase grid cell size; must be at least the
+                largest contact distance between two bodies
+            grid_min_bodies: Below this many bodies every pair is tested directly
+            params: PhysicsParams for kicks, touches and headers
+        """
+        self.params = params
+        self.cell_size = cell_size
+        self.grid_min_bodies = grid_min_bodies
+        self.contacts = []
+        self.touching = set()  # ids of the players touching a ball in the last step
+        self._parts = {}
+
+    def candidate_pairs(self, bodies):
+        """Grid broadphase: index pairs (i, j), i < j, that may touch
+
+        Only pairs with at least one ball are returned.
+        """
+        size = self.cell_size
+        grid = {}
+        for index, body in enumerate(bodies):
+            x0 = int((body.x - body.half_width) // size)
+            x1 = int((body.x + body.half_width) // size)
+            y0 = int((body.y - body.half_height) // size)
+            y1 = int((body.y + body.half_height) // size)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    grid.setdefault((cx, cy), []).append(index)
+
+        pairs = set()
+        for cell in grid.values():
+            for a in range(len(cell)):
+                for b in range(a + 1, len(cell)):
+                    if bodies[cell[a]].kind == BALL or bodies[cell[b]].kind == BALL:
+                        pairs.add((cell[a], cell[b]))
+        return sorted(pairs)
+
+    def find_contacts(self, bodies):
+        """Broad and narrow phase: list of overlapping (body, body) pairs
+
+        Only contacts involving a ball are looked for.
+        """
+        contacts = []
+        if len(bodies) < self.grid_min_bodies:
+            for j, b in enumerate(bodies):
+                if b.kind != BALL:
+                    continue
+                for i, a in enumerate(bodies):
+                    if (i < j or a.kind != BALL) and i != j and a.overlaps(b):
+                        contacts.append((a, b) if i < j else (b, a))
+            return contacts
+
+        for i, j in self.candidate_pairs(bodies):
+            a = bodies[i]
+            b = bodies[j]
+            if a.overlaps(b):
+                contacts.append((a, b))
+        return contacts
+
+    def step(self, players, balls, posts=()):
+        """Detect and resolve all contacts for one physics step
+
+        Args:
+            players: PlayerStates, in resolution order
+            balls: BallStates, in resolution order
+            posts: Static bodies (see ``post_bodies``)
+
+        Returns:
+            list: The (body, body) contacts found, sensors included
+        """
+        bodies = []
+        parts = {}
+        for player in players:
+            head, foot = self._part_bodies(player)
+            head.x, head.y = player.head_position
+            foot.x, foot.y = player.foot_position
+            parts[id(player)] = (head, foot)
+            bodies.append(head)
+            bodies.append(foot)
+        bodies.extend(posts)
+        # Ball bodies keep the position at the start of the step
+        ball_bodies = [Body(BALL, ball, ball.x, ball.y, raio) for ball in balls]
+        bodies.extend(ball_bodies)
+
+        contacts = self.find_contacts(bodies)
+        touched = set()
+        ball_pairs = []
+        for a, b in contacts:
+            if a.kind == BALL and b.kind == BALL:
+                ball_pairs.append((a.owner, b.owner))
+            elif not (a.sensor or b.sensor):
+                part, ball = (a, b) if b.kind == BALL else (b, a)
+                touched.add((id(part.owner), id(ball.owner)))
+
+        for ball_body in ball_bodies:
+            ball = ball_body.owner
+            for player in players:
+                if (id(player), id(ball)) in touched:
+                    head, foot = parts[id(player)]
+                    resolve_player_contact(player, head, foot, ball, ball_body.x, ball_body.y,
+                                           self.params)
+
+        for a, b in ball_pairs:
+            resolve_ball_contact(a, b)
+
+        self.contacts = contacts
+        self.touching = {player for player, _ in touched}
+        return contacts
+
+    def _part_bodies(self, player):
+        """Head and foot bodies of a player, reused from step to step"""
+        pair = self._parts.get(id(player))
+        if pair is None or pair[0].owner is not player:
+            pair = (Body(HEAD, player, 0, 0, PART_RADIUS), Body(FOOT, player, 0, 0, PART_RADIUS))
+            self._parts[id(player)] = pair
+        return pair
+
+
+def resolve_player_contact(player, head, foot, ball, ball_x, ball_y, params=DEFAULT_PARAMS):
+    """Bounce a ball off the closer of a player's head and foot
+
+    Args:
+        player: PlayerState touching the ball
+        head: Head body of the player
+        foot: Foot body of the player
+        ball: BallState to change
+        ball_x: Ball x position at the start of the step
+        ball_y: Ball y position at the start of the step
+        params: PhysicsParams for the ball speed after the contact
+    """
+    head_dist = math.hypot(head.x - ball_x, head.y - ball_y)
+    foot_dist = math.hypot(foot.x - ball_x, foot.y - ball_y)
+
+    # Use closest point for collision
+    contact = head if head_dist <= foot_dist else foot
+
+    # Calculate collision normal
+    dx = ball_x - contact.x
+    dy = ball_y - contact.y
+    dist = math.sqrt(dx*dx + dy*dy)
+    if dist <= 0:
+        return
+    nx = dx/dist
+    ny = dy/dist
+
+    if contact.kind == FOOT:
+        base_force = params.touch_force
+        if player.kicking:
+            # Patada más suave con más altura
+            kick_force = base_force * params.kick_force
+            ball.velx = int(kick_force * params.kick_forward * nx)
+            ball.vely = int(kick_force * -params.kick_lift)
+        else:
+            # Normal foot touch
+            ball.velx = int(base_force * nx)
+            ball.vely = int(base_force * ny * -params.touch_lift)
+    else:
+        # Head collision - simple parabolic motion away from the player
+        ball.velx = params.header_velx if player.is_left_player else -params.header_velx
+        ball.vely = params.header_vely
+
+    # Move ball out of collision. The left player's separation is applied
+    # twice, as in the original game.
+    ball_move_x = (contact.x + SEPARATION * nx) - ball_x
+    ball_move_y = (contact.y + SEPARATION * ny) - ball_y
+    for _ in range(2 if player.is_left_player else 1):
+        ball.move(ball_move_x, ball_move_y)
+
+
+def resolve_ball_contact(a, b):
+    """Push two touching balls apart and swap their velocities along the normal"""
+    dx = b.x - a.x
+    dy = b.y - a.y
+    dist = math.hypot(dx, dy)
+    if dist <= 0:
+        return
+    nx = dx/dist
+    ny = dy/dist
+
+    # Equal masses: exchange the normal components if they are approaching
+    closing = (a.velx - b.velx) * nx + (a.vely - b.vely) * ny
+    if closing > 0:
+        a.velx -= closing * nx
+        a.vely -= closing * ny
+        b.velx += closing * nx
+        b.vely += closing * ny
+
+    push = (2 * raio - dist) / 2
+    if push > 0:
+        a.move(-push * nx, -push * ny)
+        b.move(push * nx, push * ny)
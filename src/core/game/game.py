@@ -1,35 +1,59 @@
-import os
 import sys
 import time
-import math
+from src.graphics.assets import assets, INTRO_IMAGE
 from src.graphics.graphics import GraphWin, Point, Text, Image, Rectangle
 from src.core.config import (
-    x, y, raio, raio_cabeca, chao, vel, atrito,
+    x, y, raio_cabeca,
     larg_t, alt_t, contador_gol1, contador_gol2
 )
 from src.core.game.ball import Ball
 from src.core.game.field import Field
 from src.core.game.player import Player
+from src.core.game.world import World
+from src.core.game.loop import FixedTimestep
+from src.core.game.replay import InputRecorder, RecordingController, ReplayController
+from src.net.rollback import RollbackSession
+from src.net.transport import UdpTransport
 from src.controllers.vision import VisionController
 from src.controllers.keyboard import KeyboardController
+from src.controllers.ai import AIController
+from src.controllers.search_ai import SearchAIController
 from src.controllers.control_selection import ControlSelector
 
 class Game:
-    def __init__(self):
-        """Initialize the game window and all components"""
+    def __init__(self, record_path=None, replay_path=None, net=None, ai_players=(),
+                 ai_level="normal"):
+        """Initialize the game window and all components
+        
+        Args:
+            record_path: Optional file to record controller input to
+            replay_path: Optional replay log to play instead of live controls
+            net: Optional (local player, local port, peer address) tuple for
+                rollback play against another machine
+            ai_players: Player numbers driven by the computer opponent
+            ai_level: "normal" for the heuristic AI, "search" for the
+                stronger rollout-search AI
+        """
         print("[INFO] Initializing game...")
         # Create main window
-        self.window = GraphWin("Head Soccer", x, y, False)
+        self.window = GraphWin("Head Soccer", x, y, False, deferred=True)
         self.window.setBackground("black")
-        # Initialize game state
-        self.score = {"left": 0, "right": 0}
-        self.is_goal = False
+        # Input recording/replay
+        self.recorder = InputRecorder(record_path) if record_path else None
+        self.replay_path = replay_path
+        self.ai_players = tuple(ai_players)
+        self.ai_level = ai_level
+        self.ai = None
         # Initialize controllers first
         self.setup_controllers()
         # Then show intro screen
         self.show_intro()
         # Initialize game objects
         self.setup_game_objects()
+        # Networked play, started from the kickoff state
+        self.net_session = None
+        if net:
+            self.setup_network(*net)
         # Initialize score display
         self.setup_score_display()
         # Enable key buffer for better keyboard response
@@ -66,11 +90,26 @@ class Game:
             print("[ERROR] Falling back to keyboard controls")
             self.controller = KeyboardController(self.window)
             self.use_vision = False
+        if self.ai_players:
+            # The AI drives its players and passes the others through
+            if self.ai:
+                self.ai.stop()
+            ai_class = SearchAIController if self.ai_level == "search" else AIController
+            self.ai = ai_class(self.ai_players, base=self.controller,
+                               world=getattr(self, 'world', None))
+            self.controller = self.ai
+        if self.recorder:
+            self.controller = RecordingController(self.controller, self.recorder)
         time.sleep(0.5)
 
     def setup_controllers(self):
         """Show control selection screen and set controller."""
         print("[INFO] Setting up controllers...")
+        if self.replay_path:
+            print(f"[INFO] Playing replay: {self.replay_path}")
+            self.controller = ReplayController(self.replay_path)
+            self.use_vision = False
+            return
         selector = ControlSelector(self.window)
         control_type = selector.show_selection_screen(x, y)
         print(f"[INFO] Control type selected: {control_type}")
@@ -79,9 +118,7 @@ class Game:
     def show_intro(self):
         """Show and handle the intro screen with custom buttons"""
         # Background image (optional, keep as before)
-        src_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        image_dir = os.path.join(src_dir, "assets", "images")
-        intro_bg = Image(Point(x / 2, y / 2), os.path.join(image_dir, "intro2.gif"))
+        intro_bg = Image(Point(x / 2, y / 2), assets.get(INTRO_IMAGE))
         intro_bg.draw(self.window)
 
         # Button positions and sizes
@@ -164,7 +201,9 @@ class Game:
                 if enter == "Return":
                     time.sleep(0.06)
                     break
-            time.sleep(0.07)
+            # Decode the match images while waiting, instead of at kickoff
+            if not assets.preload_step():
+                time.sleep(0.07)
 
         # Clear intro screen
         intro_bg.undraw()
@@ -187,6 +226,27 @@ class Game:
         # Create ball
         self.ball = Ball(x / 2, 100, self.window)
         
+        # Simulation state shared with the renderers above
+        self.world = World(self.ball.state, self.player1.state, self.player2.state,
+                           self.field.rules)
+        if self.ai:
+            self.ai.attach(self.world)
+        
+    def setup_network(self, local_player, port, peer):
+        """Play the given player locally and the other one over UDP"""
+        print(f"[INFO] Network play as player {local_player}, port {port}, peer {peer[0]}:{peer[1]}")
+        self.net_session = RollbackSession(self.world, local_player, UdpTransport(port, peer))
+        
+    @property
+    def score(self):
+        """Current score, owned by the world"""
+        return self.world.score
+        
+    @property
+    def is_goal(self):
+        """Whether a goal was scored and the kickoff reset is pending"""
+        return self.world.is_goal
+        
     def setup_score_display(self):
         """Initialize score display"""
         self.score_left = Text(Point(x / 2 - 20, 40), "0")
@@ -207,212 +267,68 @@ class Game:
             # Only print controller type at each frame
             # print(f"[DEBUG] handle_controls: using controller {type(self.controller).__name__}")
             player_states = self.controller.process_input()
-            # Handle Player 1
-            if player_states[1]["movement"] == "left":
-                self.player1.move(-vel, 0)
-            elif player_states[1]["movement"] == "right":
-                self.player1.move(vel, 0)
-            if player_states[1]["jump"] == "jumping":
-                self.player1.start_jump()
-            if player_states[1]["kick"] == "kicking":
-                self.player1.start_kick()
-            # Handle Player 2
-            if player_states[2]["movement"] == "left":
-                self.player2.move(-vel, 0)
-            elif player_states[2]["movement"] == "right":
-                self.player2.move(vel, 0)
-            if player_states[2]["jump"] == "jumping":
-                self.player2.start_jump()
-            if player_states[2]["kick"] == "kicking":
-                self.player2.start_kick()
+            if isinstance(self.controller, ReplayController) and self.controller.restart_pending:
+                self.world.reset_match()
+            self.world.apply_inputs(player_states)
+        except Exception as e:
+            print(f"[ERROR] Error handling controls: {e}")
+            
+    def handle_network_controls(self):
+        """Run one networked tick with the local player's input"""
+        try:
+            player_states = self.controller.process_input()
+            self.net_session.advance(player_states[self.net_session.local_player])
         except Exception as e:
             print(f"[ERROR] Error handling controls: {e}")
             
     def update_physics(self):
         """Update physics and collisions"""
-        # Update player animations
-        self.player1.update_jump()
-        self.player1.update_kick()
-        self.player2.update_jump()
-        self.player2.update_kick()
-        
-        # Handle collisions first
-        self.handle_collisions()
-        
-        # Check field boundaries and goal post collisions
-        new_velx, new_vely = self.field.check_field_collision(
-            self.ball.x, self.ball.y, raio, 
-            self.ball.velx, self.ball.vely
-        )
-        self.ball.velx = new_velx
-        self.ball.vely = new_vely
-        
-        # Then apply physics
-        self.ball.apply_physics(atrito, chao)
-        
-        # Finally check for goals, but only if not already in goal state
-        if not self.is_goal:
-            is_goal, side = self.field.check_goal(self.ball.x, self.ball.y, raio)
-            if is_goal:
-                if side == "left":
-                    self.score["left"] += 1
-                else:
-                    self.score["right"] += 1
-                self.is_goal = True
+        self.world.update_physics()
         
     def handle_collisions(self):
         """Handle all collision checks and responses based on original game physics"""
-        # Get current positions
-        ball_x = self.ball.x
-        ball_y = self.ball.y
-        
-        # Player 1 positions
-        head1_x = self.player1.head.getCenter().getX()
-        head1_y = self.player1.head.getCenter().getY()
-        foot1_x = self.player1.foot.getCenter().getX()
-        foot1_y = self.player1.foot.getCenter().getY()
-        
-        # Player 2 positions
-        head2_x = self.player2.head.getCenter().getX()
-        head2_y = self.player2.head.getCenter().getY()
-        foot2_x = self.player2.foot.getCenter().getX()
-        foot2_y = self.player2.foot.getCenter().getY()
-        
-        # Calculate collision distances
-        head1_dist = math.hypot(head1_x - ball_x, head1_y - ball_y)
-        foot1_dist = math.hypot(foot1_x - ball_x, foot1_y - ball_y)
-        head2_dist = math.hypot(head2_x - ball_x, head2_y - ball_y)
-        foot2_dist = math.hypot(foot2_x - ball_x, foot2_y - ball_y)
-        
-        COLLISION_DIST = 45  # Collision detection distance
-        
-        # Collision radius (reduced from 80)
-        COLLISION_RADIUS = 40  # Slightly tighter collision detection
-        RESTITUTION = 0.7  # Reduced bounciness for better control
-        
-        # Calculate distances
-        head1_dist = math.hypot((head1_x - ball_x), (head1_y - ball_y))
-        foot1_dist = math.hypot((foot1_x - ball_x), (foot1_y - ball_y))
-        head2_dist = math.hypot((head2_x - ball_x), (head2_y - ball_y))
-        foot2_dist = math.hypot((foot2_x - ball_x), (foot2_y - ball_y))
-        
-        # Player 1 collisions
-        if head1_dist <= COLLISION_RADIUS or foot1_dist <= COLLISION_RADIUS:
-            # Use closest point for collision
-            if head1_dist <= foot1_dist:
-                contact_x, contact_y = head1_x, head1_y
-                is_foot = False
-            else:
-                contact_x, contact_y = foot1_x, foot1_y
-                is_foot = True
-                
-            # Calculate collision normal
-            dx = ball_x - contact_x
-            dy = ball_y - contact_y
-            dist = math.sqrt(dx*dx + dy*dy)
-            if dist > 0:
-                nx = dx/dist
-                ny = dy/dist
-                
-                # Calculate collision response
-                base_force = 5  # Base force for collisions
-                
-                if is_foot:
-                    if self.player1.kicking:
-                        # Patada más suave con más altura
-                        kick_force = base_force * 1.8  # Reducido de 2.5 a 1.8
-                        self.ball.velx = int(kick_force * 1.2 * nx)  # Reducido de 1.8 a 1.2
-                        self.ball.vely = int(kick_force * -0.7)  # Aumentado de -0.4 a -0.7 para más altura
-                    else:
-                        # Normal foot touch
-                        self.ball.velx = int(base_force * nx)
-                        self.ball.vely = int(base_force * ny * -0.8)
-                else:
-                    # Head collision - simple parabolic motion for Player 1
-                    self.ball.velx = 5  # Reducido de 7 a 5 para menos potencia
-                    self.ball.vely = -8  # Ajustado de -9 a -8
-                
-                # Move ball out of collision
-                separation_distance = COLLISION_RADIUS + 1
-                ball_move_x = (contact_x + separation_distance * nx) - ball_x
-                ball_move_y = (contact_y + separation_distance * ny) - ball_y
-                self.ball.move(ball_move_x, ball_move_y)
-
-                
-                # Move ball out of collision
-                
-                separation_distance = COLLISION_RADIUS + 1
-                ball_move_x = (contact_x + separation_distance * nx) - ball_x
-                ball_move_y = (contact_y + separation_distance * ny) - ball_y
-                self.ball.move(ball_move_x, ball_move_y)
-                
-        # Player 2 collisions
-        if head2_dist <= COLLISION_RADIUS or foot2_dist <= COLLISION_RADIUS:
-            # Use closest point for collision
-            if head2_dist <= foot2_dist:
-                contact_x, contact_y = head2_x, head2_y
-                is_foot = False
-            else:
-                contact_x, contact_y = foot2_x, foot2_y
-                is_foot = True
-                
-            # Calculate collision normal
-            dx = ball_x - contact_x
-            dy = ball_y - contact_y
-            dist = math.sqrt(dx*dx + dy*dy)
-            if dist > 0:
-                nx = dx/dist
-                ny = dy/dist
-                
-                # Calculate collision response
-                base_force = 5  # Base force for collisions
-                
-                if is_foot:
-                    if self.player2.kicking:
-                        # Patada más suave con más altura
-                        kick_force = base_force * 1.8  # Reducido de 2.5 a 1.8
-                        self.ball.velx = int(kick_force * 1.2 * nx)  # Reducido de 1.8 a 1.2
-                        self.ball.vely = int(kick_force * -0.7)  # Aumentado de -0.4 a -0.7 para más altura
-                    else:
-                        # Normal foot touch
-                        self.ball.velx = int(base_force * nx)
-                        self.ball.vely = int(base_force * ny * -0.8)
-                else:
-                    # Head collision - simple parabolic motion for Player 2
-                    self.ball.velx = -5  # Reducido de -7 a -5 para menos potencia
-                    self.ball.vely = -8  # Ajustado de -9 a -8
-                
-                # Move ball out of collision
-                
-                separation_distance = COLLISION_RADIUS + 1
-                ball_move_x = (contact_x + separation_distance * nx) - ball_x
-                ball_move_y = (contact_y + separation_distance * ny) - ball_y
-                self.ball.move(ball_move_x, ball_move_y)
+        self.world.handle_collisions()
         
     def reset_after_goal(self):
         """Reset game state after a goal"""
-        self.is_goal = False
-        # Reset ball and player positions
-        self.ball.reset(x / 2, 100)
-        self.player1.set_position(300, 503)
-        self.player2.set_position(900, 503)
+        # Reset ball and player positions (also clears jump/kick states)
+        self.world.reset_positions()
+        self.store_render_state()
         
         # Reset controller states to prevent stuck states
         if self.use_vision:
             self.vision_controller.reset_states()
-            
-        # Reset player states
-        self.player1.jumping = False
-        self.player1.kicking = False
-        self.player2.jumping = False
-        self.player2.kicking = False
         
         time.sleep(1)
         
-    def update_display(self):
-        """Update the game display"""
+    def snapshot(self):
+        """Save the full match state (see World.snapshot)"""
+        return self.world.snapshot()
+        
+    def restore(self, snapshot):
+        """Rewind the match; the canvas catches up on the next update_display"""
+        self.world.restore(snapshot)
+        self.store_render_state()
+        
+    def store_render_state(self):
+        """Start the next render interpolation from the current state"""
+        self.ball.store_previous()
+        self.player1.store_previous()
+        self.player2.store_previous()
+        
+    def update_display(self, alpha=1.0):
+        """Update the game display
+        
+        Args:
+            alpha: Interpolation factor between the last two physics ticks
+        """
+        self.ball.render(alpha)
+        self.player1.render(alpha)
+        self.player2.render(alpha)
+        # Unchanged texts aren't sent to Tk (see GraphicsObject._reconfig)
         self.score_left.setText(str(self.score["left"]))
         self.score_right.setText(str(self.score["right"]))
+        # One commit of every change of the frame, then one Tk update
         self.window.update()
         
     def run(self):
@@ -475,6 +391,7 @@ class Game:
         restart_btn_text.setStyle("bold")
         restart_btn_text.draw(self.window)
 
+        self.timestep = FixedTimestep()
         while True:
             # Handle mouse input for navigation buttons
             click = self.window.checkMouse()
@@ -482,17 +399,16 @@ class Game:
                 cx, cy = click.getX(), click.getY()
                 # Restart Match button (top-left)
                 if (margin <= cx <= margin + btn_width) and (margin <= cy <= margin + btn_height):
+                    if self.net_session:
+                        print("[INFO] Restart is disabled in network play")
+                        continue
                     print("[INFO] Restarting match...")
-                    self.score = {"left": 0, "right": 0}
-                    self.is_goal = False
-                    self.ball.reset(x / 2, 100)
-                    self.player1.set_position(300, 503)
-                    self.player2.set_position(900, 503)
-                    self.player1.jumping = False
-                    self.player1.kicking = False
-                    self.player2.jumping = False
-                    self.player2.kicking = False
+                    self.world.reset_match()
+                    if self.recorder:
+                        self.recorder.mark_restart()
+                    self.store_render_state()
                     self.update_display()
+                    self.timestep.reset()
                     continue
                 # Exit button (top-right)
                 if (x - btn_width - margin <= cx <= x - margin) and (margin <= cy <= margin + btn_height):
@@ -548,6 +464,7 @@ class Game:
                                 self.cleanup()
                                 sys.exit()
                         time.sleep(0.05)
+                    self.timestep.reset()
                     continue  # Skip rest of loop to avoid double input
                 # Select Controls button (top-right)
                 elif (x - 2*btn_width - 2*margin <= cx <= x - btn_width - 2*margin) and (margin <= cy <= margin + btn_height):
@@ -558,15 +475,28 @@ class Game:
                     print(f"[INFO] New control selected: {control_type}")
                     # Reassign controller
                     self.set_controller(control_type)
+                    self.timestep.reset()
 
-            # Normal game controls
-            self.handle_controls()
-            self.update_physics()
-            self.update_display()
+            # Normal game controls, run at a fixed tick rate
+            for _ in range(self.timestep.advance()):
+                self.store_render_state()
+                if self.net_session:
+                    # Goals reset inside the session's tick, without the pause
+                    self.handle_network_controls()
+                    continue
+                self.handle_controls()
+                self.update_physics()
+                if self.is_goal:
+                    break
 
             if self.is_goal:
+                # Show the scoring tick before the kickoff pause
+                self.update_display()
                 self.reset_after_goal()
-            time.sleep(0.016)
+                self.timestep.reset()
+            else:
+                self.update_display(self.timestep.alpha)
+            self.timestep.wait()
             if self.window.isClosed():
                 break
             
@@ -574,4 +504,10 @@ class Game:
         """Clean up resources before exit"""
         if self.use_vision:
             self.vision_controller.cleanup()
+        if self.ai:
+            self.ai.stop()
+        if self.recorder:
+            self.recorder.close()
+        if self.net_session:
+            self.net_session.transport.close()
         self.window.close()
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""Fixed-timestep scheduling for the game loop."""
+import time
+from ..config import tick_rate, max_catchup_ticks
+
+
+class FixedTimestep:
+    """Accumulator that turns elapsed wall-clock time into fixed physics ticks
+
+    Each frame, ``advance`` reports how many ticks of ``1 / tick_rate`` seconds
+    are due, so game speed stays constant however long a frame takes to render.
+    The time left over in the accumulator gives ``alpha``, the fraction of a
+    tick to interpolate rendering by.
+    """
+
+    def __init__(self, rate=tick_rate, max_catchup=max_catchup_ticks, clock=time.monotonic):
+        """Create a scheduler
+
+        Args:
+            rate: Physics ticks per second
+            max_catchup: Max ticks returned by one ``advance`` call; time
+                beyond that is dropped so a long stall doesn't snowball
+            clock: Monotonic clock returning seconds
+        """
+        self.dt = 1.0 / rate
+        self.max_catchup = max_catchup
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        """Restart timing from now, e.g. after a pause or a blocking screen"""
+        self.last_time = self.clock()
+        self.accumulator = 0.0
+
+    def advance(self):
+        """Accumulate the time since the last call
+
+        Returns:
+            int: Number of physics ticks to run this frame
+        """
+        now = self.clock()
+        self.accumulator += now - self.last_time
+        self.last_time = now
+
+        ticks = int(self.accumulator // self.dt)
+        if ticks > self.max_catchup:
+            # Too far behind: run the cap and drop the rest
+            ticks = self.max_catchup
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= ticks * self.dt
+        return ticks
+
+    @property
+    def alpha(self):
+        """Fraction of the next tick already elapsed, in [0, 1)"""
+        return min(self.accumulator / self.dt, 1.0)
+
+    def wait(self):
+        """Sleep until the next tick is due"""
+        remaining = self.dt - self.accumulator - (self.clock() - self.last_time)
+        if remaining > 0:
+            time.sleep(remaining)
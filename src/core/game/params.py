@@ -0,0 +1,103 @@
+"""Tunable physics parameters.
+
+``PhysicsParams`` gathers the constants of the ball, field and contact rules
+so they can be changed per World without editing code. The defaults are the
+original game's values, so a World built without parameters plays exactly as
+before. Geometry (ball and head radius, floor, goal sizes) stays in
+``config.py``, since the field grid and the renderers are built from it.
+"""
+from ..config import vel, atrito
+
+
+class PhysicsParams:
+    """Set of tuning constants for one simulation
+
+    Attributes:
+        move_speed: Player movement per tick, in pixels
+        gravity: Ball speed gained per tick in the air
+        terminal_velocity: Falling speed above which gravity stops
+        velocity_scale: Pixels moved per tick per unit of ball velocity
+        friction: Ball speed lost per tick on the ground
+        ground_damping: Factor applied to the horizontal speed on landing
+        bounce_min: Smallest share of the vertical speed kept by a bounce
+        bounce_max: Largest share of the vertical speed kept by a bounce
+        bounce_speed: A bounce keeps ``speed / bounce_speed`` of the vertical
+            speed, within ``bounce_min`` and ``bounce_max``
+        stop_speed: Vertical landing speed below which the ball doesn't bounce
+        restitution: Speed factor of wall, ceiling and crossbar bounces
+        min_bounce_speed: Smallest speed after a wall, ceiling or crossbar bounce
+        wall_push: Extra inward speed after a side wall bounce
+        ceiling_push: Extra downward speed after a ceiling bounce
+        crossbar_push: Extra speed towards the middle after a crossbar bounce
+        touch_force: Ball speed after a plain foot touch
+        touch_lift: Vertical share of a foot touch
+        kick_force: Factor applied to ``touch_force`` for a kick
+        kick_forward: Horizontal share of a kick
+        kick_lift: Upward share of a kick
+        header_velx: Horizontal ball speed after a header
+        header_vely: Vertical ball speed after a header
+    """
+
+    DEFAULTS = {
+        "move_speed": vel,
+        "gravity": 0.4,
+        "terminal_velocity": 12,
+        "velocity_scale": 2,
+        "friction": atrito,
+        "ground_damping": 0.6,
+        "bounce_min": 0.3,
+        "bounce_max": 0.6,
+        "bounce_speed": 25,
+        "stop_speed": 2,
+        "restitution": 1.2,
+        "min_bounce_speed": 8,
+        "wall_push": 3,
+        "ceiling_push": 4,
+        "crossbar_push": 3,
+        "touch_force": 5,
+        "touch_lift": 0.8,
+        "kick_force": 1.8,
+        "kick_forward": 1.2,
+        "kick_lift": 0.7,
+        "header_velx": 5,
+        "header_vely": -8,
+    }
+    __slots__ = tuple(DEFAULTS)
+
+    def __init__(self, **values):
+        """Create a parameter set
+
+        Args:
+            **values: Parameters to change from the defaults
+
+        Raises:
+            TypeError: If a name is not a known parameter
+        """
+        unknown = set(values) - set(self.DEFAULTS)
+        if unknown:
+            raise TypeError(f"Unknown physics parameters: {', '.join(sorted(unknown))}")
+        for name, default in self.DEFAULTS.items():
+            setattr(self, name, values.get(name, default))
+
+    def replace(self, **values):
+        """Copy with some parameters changed"""
+        return PhysicsParams(**dict(self.to_dict(), **values))
+
+    def to_dict(self):
+        """Parameters as a plain dict"""
+        return {name: getattr(self, name) for name in self.DEFAULTS}
+
+    def changes(self):
+        """Parameters that differ from the defaults"""
+        return {name: value for name, value in self.to_dict().items()
+                if value != self.DEFAULTS[name]}
+
+    def __eq__(self, other):
+        return isinstance(other, PhysicsParams) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        changes = ", ".join(f"{name}={value!r}" for name, value in self.changes().items())
+        return f"PhysicsParams({changes})"
+
+
+DEFAULT_PARAMS = PhysicsParams()
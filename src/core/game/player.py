@@ -1,10 +1,23 @@
-from ...graphics.graphics import Circle, Point, Image
-from ..config import raio, raio_cabeca, x, chao
+from ...graphics.assets import assets
+from ...graphics.graphics import Circle, Point, Image, Group
+from ..config import raio, raio_cabeca, show_hitboxes
+from .world import PlayerState
+
+# Sprite frames, by PlayerState.sprite_action
+SPRITE_ACTIONS = ('', 'kick1', 'kick2')
+
+
+def sprite_file(is_left_player, action):
+    """File name of a player sprite frame"""
+    prefix = "Left" if is_left_player else "Right"
+    suffix = f"_{action}" if action else ""
+    return f"{prefix}Char{suffix}.gif"
+
 
 class Player:
     def __init__(self, x, y, is_left_player, window):
-        """Initialize a player with their body parts and sprites
-        
+        """Initialize a player state with its body parts and sprites
+
         Args:
             x: Initial x position
             y: Initial y position
@@ -15,154 +28,115 @@ class Player:
         self.COLLISION_RADIUS = 40  # Match the game's collision radius
         self.is_left_player = is_left_player
         self.window = window
-        
-        # Create collision circles
-        self.head = Circle(Point(x, y - 12), raio_cabeca)
-        self.head.setOutline("")
-        self.head.setFill("")
-        self.head.draw(window)
-        
-        self.foot = Circle(Point(x, y + 26), raio)
-        self.foot.setOutline("")
-        self.foot.setFill("")
-        self.foot.draw(window)
-        
-        # Create sprite with correct path
-        import os
-        src_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        images_dir = os.path.join(src_dir, "assets", "images")
-        
-        sprite_file = "LeftChar.gif" if is_left_player else "RightChar.gif"
-        sprite_path = os.path.join(images_dir, sprite_file)
-        self.sprite = Image(Point(x, y), sprite_path)
-        self.sprite.draw(window)
-        
-        # State variables
-        self.jumping = False
-        self.jump_ready = True  # Track if player can jump again
-        self.jump_count = 0
-        self.kicking = False
-        self.kick_count = 0
-        
+        self.state = PlayerState(x, y, is_left_player)
+
+        # Create sprite; every animation frame is loaded up front
+        self.frames = {action: assets.get(sprite_file(is_left_player, action))
+                       for action in SPRITE_ACTIONS}
+        self.sprite = Image(Point(x, y), self.frames[''])
+
+        # Every canvas item moving with the body, moved with one canvas call.
+        # Collision shapes live in the state; they are only drawn, as
+        # outlines, when show_hitboxes is set.
+        self.entity = Group(self.sprite)
+        foot_x, foot_y = self.state.foot_position
+        self.foot = None
+        if show_hitboxes:
+            head_x, head_y = self.state.head_position
+            head = Circle(Point(head_x, head_y), raio_cabeca)
+            head.setOutline("yellow")
+            self.entity.add(head)
+            self.foot = Circle(Point(foot_x, foot_y), raio)
+            self.foot.setOutline("yellow")
+            self.foot.draw(window)
+        self.entity.draw(window)
+
+        # State currently shown on the canvas
+        self.drawn_x = x
+        self.drawn_y = y
+        self.drawn_foot = (foot_x, foot_y)
+        self.store_previous()
+        self.sprite_action = ''
+
     def move(self, dx, dy):
         """Move the player by the given amounts while respecting field boundaries"""
-        # Get current position
-        head_x = self.head.getCenter().getX()
-        
-        # Check field boundaries before moving
-        if dx < 0 and head_x - raio_cabeca + dx <= 0:
-            # Don't move past left boundary
-            dx = 0
-        elif dx > 0 and head_x + raio_cabeca + dx >= x:
-            # Don't move past right boundary
-            dx = 0
-            
-        # Apply allowed movement
-        self.head.move(dx, dy)
-        self.foot.move(dx, dy)
-        self.sprite.move(dx, dy)
-        
+        self.state.move(dx, dy)
+
     def set_position(self, x, y):
         """Set the player to a specific position and reset movement states"""
-        # Move to new position
-        current_x = self.sprite.getAnchor().getX()
-        current_y = self.sprite.getAnchor().getY()
-        self.move(x - current_x, y - current_y)
-        
-        # Reset all movement states
-        self.jumping = False
-        self.jump_ready = True
-        self.jump_count = 0
-        self.kicking = False
-        self.kick_count = 0
-        
+        self.state.set_position(x, y)
+
     def start_jump(self):
         """Start jumping animation if ready"""
-        if self.jump_ready and not self.jumping and not self.kicking:
-            self.jumping = True
-            self.jump_count = 0
-            self.jump_ready = False  # Can't jump again until landing
-            
-    def update_jump(self):
+        self.state.start_jump()
+
+    def update_jump(self, dt=1.0):
         """Update jump animation state using original game physics"""
-        # When jumping, apply upward force first then gravity
-        if self.jumping and not self.kicking:
-            if self.jump_count < 12:
-                # Going up
-                self.move(0, -8)
-            elif self.jump_count < 24:
-                # Coming down
-                self.move(0, 8)
-            
-            self.jump_count += 1
-            
-            if self.jump_count >= 24:
-                self.jumping = False
-                self.jump_count = 0
-                
-        # Check if we're on ground to reset jump ability
-        if self.foot.getCenter().getY() + raio >= chao - 5:  # Small threshold
-            self.jump_ready = True
-                
+        self.state.update_jump(dt)
+
     def start_kick(self):
         """Start kicking animation"""
-        if not self.kicking:
-            self.kicking = True
-            self.kick_count = 0
-            
-    def update_kick(self):
+        self.state.start_kick()
+
+    def update_kick(self, dt=1.0):
         """Update kick animation state"""
-        if self.kicking:
-            if self.kick_count // 1 == 0:
-                self.foot.move(0, 8)
-                # Update sprite
-                self._update_sprite('kick1')
-            if self.kick_count // 8 == 1:
-                self.foot.move(2 if self.is_left_player else -2, -2)
-                # Update sprite
-                self._update_sprite('kick2')
-                
-            self.kick_count += 1
-            if self.kick_count == 15:
-                # Reset sprite
-                self._update_sprite('')
-                self.kick_count = 0
-                self.foot.move(-14 if self.is_left_player else 14, 6)
-                self.kicking = False
-                
+        self.state.update_kick(dt)
+
+    def store_previous(self):
+        """Remember the current state as the start of the next interpolation"""
+        self.prev_x = self.state.x
+        self.prev_y = self.state.y
+        self.prev_foot = self.state.foot_position
+
+    def render(self, alpha=1.0):
+        """Move the canvas items and swap the sprite to match the state
+
+        Args:
+            alpha: Interpolation factor between the previous tick (0) and
+                the current one (1)
+        """
+        target_x = self.prev_x + (self.state.x - self.prev_x) * alpha
+        target_y = self.prev_y + (self.state.y - self.prev_y) * alpha
+        dx = target_x - self.drawn_x
+        dy = target_y - self.drawn_y
+        if dx or dy:
+            self.entity.move(dx, dy)
+            self.drawn_x = target_x
+            self.drawn_y = target_y
+
+        if self.foot is not None:
+            foot_x, foot_y = self.state.foot_position
+            foot_x = self.prev_foot[0] + (foot_x - self.prev_foot[0]) * alpha
+            foot_y = self.prev_foot[1] + (foot_y - self.prev_foot[1]) * alpha
+            dx = foot_x - self.drawn_foot[0]
+            dy = foot_y - self.drawn_foot[1]
+            if dx or dy:
+                self.foot.move(dx, dy)
+                self.drawn_foot = (foot_x, foot_y)
+
+        if self.state.sprite_action != self.sprite_action:
+            self._update_sprite(self.state.sprite_action)
+
     def _update_sprite(self, action):
-        """Update the player's sprite
-        
+        """Show another animation frame on the existing sprite item
+
         Args:
             action: Action name ('', 'kick1', 'kick2')
         """
-        import os
-        src_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
-        images_dir = os.path.join(src_dir, "assets", "images")
-        
-        self.sprite.undraw()
-        prefix = "Left" if self.is_left_player else "Right"
-        suffix = f"_{action}" if action else ""
-        sprite_path = os.path.join(images_dir, f"{prefix}Char{suffix}.gif")
-        
-        self.sprite = Image(
-            self.sprite.getAnchor(),
-            sprite_path
-        )
-        self.sprite.draw(self.window)
-        
+        self.sprite.setImage(self.frames[action])
+        self.sprite_action = action
+
     @property
     def head_position(self):
         """Get the head's position"""
-        return (self.head.getCenter().getX(), self.head.getCenter().getY())
-        
+        return self.state.head_position
+
     @property
     def foot_position(self):
         """Get the foot's position"""
-        return (self.foot.getCenter().getX(), self.foot.getCenter().getY())
-        
+        return self.state.foot_position
+
     @property
     def sprite_position(self):
         """Get the sprite's position"""
-        anchor = self.sprite.getAnchor()
-        return (anchor.getX(), anchor.getY())
+        return (self.state.x, self.state.y)
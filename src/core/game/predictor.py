@@ -0,0 +1,196 @@
+"""Ball trajectory prediction.
+
+``TrajectoryPredictor`` plays the ball forward on its own, with the same
+field-collision, physics and goal rules in the same order as
+``World.integrate``, and reports where it lands, what it bounces off and
+whether it goes in. Players are ignored, so the prediction holds until
+somebody touches the ball.
+
+Results are memoized on the ball state quantized to ``position_quantum``
+pixels and ``velocity_quantum`` pixels/tick, so an AI, the HUD and analytics
+asking about the same ball in one tick share one simulation.
+"""
+import time
+from collections import OrderedDict
+from ..config import x as field_width, raio, chao, physics_substeps
+from .world import BallState, FieldRules, CROSSBAR_DEPTH
+
+# Bounce kinds
+WALL = "wall"
+CEILING = "ceiling"
+CROSSBAR = "crossbar"
+GROUND = "ground"
+
+
+class Prediction:
+    """Future of a ball left alone
+
+    Attributes:
+        path: (x, y) of the ball after each tick, up to the horizon, a goal
+            or the ball coming to rest
+        landing_tick: First tick after which the ball is on the ground, or None
+        landing_x: Ball x at that tick, or None
+        bounces: (tick, kind, x, y) for every wall, ceiling, crossbar and
+            ground bounce, in order
+        goal_tick: Tick at which the ball is in a goal, or None
+        goal_side: Side that scores ("left" or "right"), or None
+        rest_tick: Tick from which the ball lies still, or None
+        truncated: True if a deadline cut the simulation short
+    """
+    __slots__ = ("path", "landing_tick", "landing_x", "bounces",
+                 "goal_tick", "goal_side", "rest_tick", "truncated")
+
+    def __init__(self):
+        self.path = []
+        self.landing_tick = None
+        self.landing_x = None
+        self.bounces = []
+        self.goal_tick = None
+        self.goal_side = None
+        self.rest_tick = None
+        self.truncated = False
+
+    @property
+    def on_target(self):
+        """Whether the ball goes in without anybody touching it"""
+        return self.goal_tick is not None
+
+    def position_at(self, tick):
+        """Ball position after ``tick`` ticks, 1 or more
+
+        Past the end of the path this is the last known position.
+        """
+        return self.path[min(tick, len(self.path)) - 1]
+
+
+class TrajectoryPredictor:
+    """Memoized ball-only simulation"""
+
+    def __init__(self, field=None, horizon=240, substeps=physics_substeps,
+                 position_quantum=1.0, velocity_quantum=0.1, cache_size=512):
+        """Create a predictor
+
+        Args:
+            field: FieldRules of the match (default: rules for the configured
+                width); the ball follows its PhysicsParams
+            horizon: Max ticks to look ahead
+            substeps: Physics substeps per tick, as in the World being predicted
+            position_quantum: Position step, in pixels, below which queries
+                share a cached result (0 caches exact states only)
+            velocity_quantum: Same for velocities, in pixels per tick
+            cache_size: Max number of cached predictions
+        """
+        self.field = field if field is not None else FieldRules(field_width)
+        self.horizon = horizon
+        self.substeps = substeps
+        self.position_quantum = position_quantum
+        self.velocity_quantum = velocity_quantum
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, x, y, velx, vely):
+        """Cache key of a ball state"""
+        pq = self.position_quantum
+        vq = self.velocity_quantum
+        if pq:
+            x, y = round(x / pq), round(y / pq)
+        if vq:
+            velx, vely = round(velx / vq), round(vely / vq)
+        return x, y, velx, vely
+
+    def predict(self, ball, deadline=None):
+        """Predict the future of a ball
+
+        Args:
+            ball: Object with x, y, velx and vely (BallState, Ball, ...)
+            deadline: Optional ``time.perf_counter()`` value at which to stop
+                simulating; a cut-short prediction is returned but not cached
+
+        Returns:
+            Prediction: Shared with other queries for the same quantized
+                state; don't modify it
+        """
+        key = self.key(ball.x, ball.y, ball.velx, ball.vely)
+        cache = self.cache
+        prediction = cache.get(key)
+        if prediction is not None:
+            cache.move_to_end(key)
+            self.hits += 1
+            return prediction
+
+        self.misses += 1
+        prediction = self.simulate(ball.x, ball.y, ball.velx, ball.vely, deadline)
+        if prediction.truncated:
+            return prediction
+        cache[key] = prediction
+        if len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        return prediction
+
+    def simulate(self, x, y, velx, vely, deadline=None):
+        """Uncached prediction from an exact ball state"""
+        field = self.field
+        params = field.params
+        ball = BallState(x, y)
+        ball.velx = velx
+        ball.vely = vely
+        prediction = Prediction()
+        dt = 1.0 / self.substeps
+
+        # Field rules are only checked outside the zone where none can apply
+        x_min, x_max, y_min = field.free_zone(raio)
+        is_goal = False
+
+        for tick in range(1, self.horizon + 1):
+            if deadline is not None and time.perf_counter() > deadline:
+                prediction.truncated = True
+                break
+            for _ in range(self.substeps):
+                if not (x_min < ball.x < x_max and ball.y >= y_min):
+                    before_x, before_y = ball.velx, ball.vely
+                    ball.velx, ball.vely = field.check_field_collision(
+                        ball.x, ball.y, raio, ball.velx, ball.vely
+                    )
+                    if (ball.velx, ball.vely) != (before_x, before_y):
+                        prediction.bounces.append(
+                            (tick, self._bounce_kind(ball.x, ball.y), ball.x, ball.y))
+
+                airborne = ball.y + raio < chao
+                ball.apply_physics(params.friction, chao, dt, params)
+                grounded = ball.y + raio == chao
+                if airborne and grounded:
+                    prediction.bounces.append((tick, GROUND, ball.x, ball.y))
+
+                if not x_min < ball.x < x_max:
+                    is_goal, side = field.check_goal(ball.x, ball.y, raio)
+                    if is_goal:
+                        break
+
+            prediction.path.append((ball.x, ball.y))
+            if grounded and prediction.landing_tick is None:
+                prediction.landing_tick = tick
+                prediction.landing_x = ball.x
+            if is_goal:
+                prediction.goal_tick = tick
+                prediction.goal_side = side
+                break
+            if grounded and ball.velx == 0 and ball.vely == 0:
+                prediction.rest_tick = tick
+                break
+        return prediction
+
+    def _bounce_kind(self, ball_x, ball_y):
+        """Which field rule bounced a ball at this position"""
+        for bounds in (self.field.left_goal_bounds, self.field.right_goal_bounds):
+            if (bounds['x1'] - raio <= ball_x <= bounds['x2'] + raio and
+                    bounds['y1'] - 5 - raio < ball_y <= bounds['y1'] + CROSSBAR_DEPTH):
+                return CROSSBAR
+        if ball_y - raio < 0:
+            return CEILING
+        return WALL
+
+    def clear(self):
+        """Forget every cached prediction"""
+        self.cache.clear()
@@ -0,0 +1,218 @@
+"""Input-log recording and replay.
+
+A replay log stores the output of ``Controller.process_input`` for every
+tick. Because ``World`` is deterministic, feeding the log back reproduces the
+match exactly, for keyboard and vision sessions alike, and without any pacing
+sleep it plays back far faster than real time.
+
+File format (little endian)::
+
+    header  "HSRP", version (uint16), physics substeps (uint16)
+    entry   tick (uint32), player 1 input (uint8), player 2 input (uint8), flags (uint8)
+
+Entries are only written when the input changes, so long stretches of held
+or idle controls cost nothing. An input byte packs the movement in bits 0-1
+(0 none, 1 left, 2 right), the jump control in bit 2 and the kick control in
+bit 3.
+"""
+import struct
+from ...controllers.base import Controller, IDLE
+from ..config import physics_substeps
+from .world import World
+
+MAGIC = b"HSRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHH")
+ENTRY = struct.Struct("<IBBB")
+
+# Entry flags
+FLAG_RESTART = 0x01  # Match restarted before this tick's input
+FLAG_END = 0x02      # End of the log; the tick number is the total length
+
+_MOVEMENT_BITS = {"none": 0, "left": 1, "right": 2}
+_MOVEMENT_NAMES = {bits: name for name, bits in _MOVEMENT_BITS.items()}
+
+_IDLE_STATES = {1: IDLE, 2: IDLE}  # Only compared against, never handed out
+
+
+def encode_player(state):
+    """Pack one player's control state into a byte"""
+    code = _MOVEMENT_BITS[state["movement"]]
+    if state["jump"] == "jumping":
+        code |= 0x04
+    if state["kick"] == "kicking":
+        code |= 0x08
+    return code
+
+
+def decode_player(code):
+    """Unpack a byte into one player's control state"""
+    return {
+        "movement": _MOVEMENT_NAMES[code & 0x03],
+        "jump": "jumping" if code & 0x04 else "ready",
+        "kick": "kicking" if code & 0x08 else "ready"
+    }
+
+
+class InputRecorder:
+    """Writes per-tick controller output to a replay log"""
+
+    def __init__(self, path, substeps=physics_substeps):
+        """Open a new log
+
+        Args:
+            path: File to write
+            substeps: Physics substeps of the recorded session
+        """
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, substeps))
+        self.tick = 0
+        self.last = None
+        self.pending_flags = 0
+
+    def record(self, player_states):
+        """Record the control state used for the current tick"""
+        codes = (encode_player(player_states[1]), encode_player(player_states[2]))
+        if codes != self.last or self.pending_flags:
+            self.file.write(ENTRY.pack(self.tick, codes[0], codes[1], self.pending_flags))
+            self.last = codes
+            self.pending_flags = 0
+        self.tick += 1
+
+    def mark_restart(self):
+        """Record that the match is restarted before the next tick"""
+        self.pending_flags |= FLAG_RESTART
+
+    def close(self):
+        """Write the end marker and close the file"""
+        if self.file.closed:
+            return
+        self.file.write(ENTRY.pack(self.tick, 0, 0, FLAG_END))
+        self.file.close()
+
+
+class InputLog:
+    """A replay log loaded in memory"""
+
+    def __init__(self, path):
+        """Read a log written by InputRecorder
+
+        Raises:
+            ValueError: If the file is not a replay log of a known version
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not a replay log")
+        magic, version, self.substeps = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay log")
+
+        self.entries = [ENTRY.unpack_from(data, offset)
+                        for offset in range(HEADER.size, len(data) - ENTRY.size + 1, ENTRY.size)]
+        if self.entries and self.entries[-1][3] & FLAG_END:
+            self.length = self.entries.pop()[0]
+        else:
+            # Log of a session that didn't close cleanly
+            self.length = self.entries[-1][0] + 1 if self.entries else 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        """Yield (tick, player_states, restart) for every tick"""
+        entries = self.entries
+        index = 0
+        player_states = None
+        for tick in range(self.length):
+            restart = False
+            if index < len(entries) and entries[index][0] == tick:
+                _, code1, code2, flags = entries[index]
+                player_states = {1: decode_player(code1), 2: decode_player(code2)}
+                restart = bool(flags & FLAG_RESTART)
+                index += 1
+            yield tick, player_states, restart
+
+    def runs(self):
+        """Yield (tick, count, player_states, restart) for every stretch of
+        ``count`` ticks played with the same inputs, starting at ``tick``"""
+        entries = self.entries
+        for index, (tick, code1, code2, flags) in enumerate(entries):
+            end = entries[index + 1][0] if index + 1 < len(entries) else self.length
+            if end > tick:
+                player_states = {1: decode_player(code1), 2: decode_player(code2)}
+                yield tick, end - tick, player_states, bool(flags & FLAG_RESTART)
+
+
+class RecordingController(Controller):
+    """Passes another controller's input through while recording it"""
+
+    def __init__(self, controller, recorder):
+        self.controller = controller
+        self.recorder = recorder
+
+    def process_input(self):
+        player_states = self.controller.process_input()
+        self.recorder.record(player_states)
+        return player_states
+
+    def cleanup(self):
+        """Clean up the wrapped controller; the recorder is closed by its owner"""
+        self.controller.cleanup()
+
+
+class ReplayController(Controller):
+    """Plays back a replay log, one tick per ``process_input`` call
+
+    Once the log runs out both players stay idle.
+    """
+
+    def __init__(self, log):
+        self.log = log if isinstance(log, InputLog) else InputLog(log)
+        self.ticks = iter(self.log)
+        self.restart_pending = False
+
+    def process_input(self):
+        for _, player_states, restart in self.ticks:
+            self.restart_pending = restart
+            return player_states
+        self.restart_pending = False
+        return {1: dict(IDLE), 2: dict(IDLE)}
+
+    def cleanup(self):
+        pass
+
+
+def replay(log, world=None):
+    """Play a log through a headless world as fast as possible
+
+    Goals reset the kickoff the same way ``Game.reset_after_goal`` does.
+
+    Args:
+        log: InputLog or path to a log file
+        world: World to play into (default: a new world at kickoff)
+
+    Returns:
+        World: The world after the last tick
+    """
+    if not isinstance(log, InputLog):
+        log = InputLog(log)
+    if world is None:
+        world = World(substeps=log.substeps)
+
+    for _, count, player_states, restart in log.runs():
+        if restart:
+            world.reset_match()
+        if player_states == _IDLE_STATES:
+            # Nobody presses anything: let the world skip free ball flight
+            while count:
+                count -= world.skip_idle(count)
+                if world.is_goal:
+                    world.reset_positions()
+            continue
+        for _ in range(count):
+            world.apply_inputs(player_states)
+            world.update_physics()
+            if world.is_goal:
+                world.reset_positions()
+    return world
@@ -0,0 +1,730 @@
+"""Headless simulation state for the game.
+
+Everything in this module is plain Python state, so a match can be simulated
+without a Tk window. ``Ball``, ``Player`` and ``Field`` are renderers that
+draw this state, and ``Game`` drives it through ``World.apply_inputs`` and
+``World.update_physics``.
+
+Motion kernels take ``dt`` in ticks (1.0 = one 60 Hz frame). With ``dt=1``
+they reproduce the original per-frame rules exactly; smaller steps let the
+physics run at 120/240 Hz while input and rendering stay at 60 Hz.
+"""
+import struct
+from .collision import CollisionSystem, CROSSBAR_DEPTH, PLAYER_REACH, post_bodies
+from .params import DEFAULT_PARAMS
+from ..config import (
+    x as field_width, y as field_height, raio, raio_cabeca, chao,
+    larg_t, alt_t, physics_substeps
+)
+
+# Kickoff positions
+BALL_START = (field_width / 2, 100)
+PLAYER1_START = (300, 503)
+PLAYER2_START = (900, 503)
+
+
+class BallState:
+    """Position and velocity of the ball"""
+    __slots__ = ("x", "y", "velx", "vely")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.velx = 0
+        self.vely = 0
+
+    def move(self, dx, dy):
+        """Move the ball by the given amounts"""
+        self.x += dx
+        self.y += dy
+
+    def set_position(self, x, y):
+        """Set the ball to a specific position"""
+        self.move(x - self.x, y - self.y)
+
+    def apply_physics(self, atrito, chao, dt=1.0, params=DEFAULT_PARAMS):
+        """Apply physics calculations to the ball
+
+        Args:
+            atrito: Friction coefficient (per tick)
+            chao: Floor y-coordinate
+            dt: Time step in ticks
+            params: PhysicsParams for gravity and bounces
+        """
+        # Apply gravity when ball is in air
+        if self.y + raio < chao:
+            # Apply gravity with increasing effect up to terminal velocity
+            if self.vely < params.terminal_velocity:
+                self.vely += params.gravity * dt
+
+        # Apply velocity, quantized to whole pixels per tick
+        scale = params.velocity_scale
+        self.move((scale * self.velx // 1) * dt, (scale * self.vely // 1) * dt)
+
+        # Ground collision and friction
+        if self.y + raio >= chao:
+            # Enforce ground boundary and calculate bounce
+            if self.y + raio > chao:
+                # Move to ground surface
+                self.move(0, chao - (self.y + raio))
+
+                # Calculate bounce with more energy loss
+                bounce_factor = min(params.bounce_max,
+                                    max(params.bounce_min, abs(self.vely) / params.bounce_speed))
+                if abs(self.vely) > params.stop_speed:  # Only bounce if moving fast enough
+                    self.vely = (self.vely * -bounce_factor) // 1
+                else:
+                    self.vely = 0  # Stop vertical movement
+
+                # Reduce horizontal speed more on impact
+                self.velx = (self.velx * params.ground_damping) // 1
+
+            if self.y + raio == chao:
+                # Apply friction when ball is on ground
+                friction = atrito * dt
+                if self.velx > 0:
+                    self.velx -= friction
+                if self.velx < 0:
+                    self.velx += friction
+                # Ensure velocity stops at zero
+                if abs(self.velx) < friction:
+                    self.velx = 0
+
+    def reset(self, x, y):
+        """Reset ball to initial position with no velocity"""
+        self.set_position(x, y)
+        self.velx = 0
+        self.vely = 0
+
+
+def jump_height(elapsed):
+    """Height reached after ``elapsed`` ticks of a jump: up 8 px/tick for 12 ticks, then down"""
+    return 8 * min(elapsed, 12) - 8 * max(elapsed - 12, 0)
+
+
+def kick_foot_offset(elapsed, is_left_player):
+    """Foot displacement after ``elapsed`` ticks of a kick
+
+    The foot drops 8 px for the first 8 ticks, then swings 2 px/tick forward
+    and up until the kick ends after 15 ticks.
+    """
+    if elapsed <= 8:
+        return (0, 8)
+    swing = 2 * (elapsed - 8)
+    return (swing if is_left_player else -swing, 8 - swing)
+
+
+class PlayerState:
+    """Position and jump/kick counters of a player
+
+    ``x``/``y`` is the sprite anchor. The head and foot are kept as offsets
+    from it, and ``foot_dx``/``foot_dy`` hold the extra foot displacement of
+    a kick in progress. ``jump_count`` and ``kick_count`` are elapsed times
+    in ticks.
+    """
+    __slots__ = ("x", "y", "is_left_player", "foot_dx", "foot_dy",
+                 "jumping", "jump_ready", "jump_count",
+                 "kicking", "kick_count", "sprite_action")
+
+    HEAD_OFFSET = -12
+    FOOT_OFFSET = 26
+
+    def __init__(self, x, y, is_left_player):
+        self.x = x
+        self.y = y
+        self.is_left_player = is_left_player
+        self.foot_dx = 0
+        self.foot_dy = 0
+        self.jumping = False
+        self.jump_ready = True  # Track if player can jump again
+        self.jump_count = 0
+        self.kicking = False
+        self.kick_count = 0
+        self.sprite_action = ''  # '', 'kick1' or 'kick2'
+
+    @property
+    def head_position(self):
+        """Get the head's position"""
+        return (self.x, self.y + self.HEAD_OFFSET)
+
+    @property
+    def foot_position(self):
+        """Get the foot's position"""
+        return (self.x + self.foot_dx, self.y + self.FOOT_OFFSET + self.foot_dy)
+
+    def move(self, dx, dy):
+        """Move the player by the given amounts while respecting field boundaries"""
+        # Check field boundaries before moving
+        if dx < 0 and self.x - raio_cabeca + dx <= 0:
+            # Don't move past left boundary
+            dx = 0
+        elif dx > 0 and self.x + raio_cabeca + dx >= field_width:
+            # Don't move past right boundary
+            dx = 0
+
+        self.x += dx
+        self.y += dy
+
+    def set_position(self, x, y):
+        """Set the player to a specific position and reset movement states"""
+        self.move(x - self.x, y - self.y)
+
+        # Reset all movement states, including a kick cut short
+        self.jumping = False
+        self.jump_ready = True
+        self.jump_count = 0
+        self.kicking = False
+        self.kick_count = 0
+        self.foot_dx = 0
+        self.foot_dy = 0
+        self.sprite_action = ''
+
+    def start_jump(self):
+        """Start jumping if ready"""
+        if self.jump_ready and not self.jumping and not self.kicking:
+            self.jumping = True
+            self.jump_count = 0
+            self.jump_ready = False  # Can't jump again until landing
+
+    def update_jump(self, dt=1.0):
+        """Update jump state using original game physics
+
+        Args:
+            dt: Time step in ticks
+        """
+        if self.jumping and not self.kicking:
+            # Going up for 12 ticks, then coming down
+            elapsed = min(self.jump_count + dt, 24)
+            self.move(0, jump_height(self.jump_count) - jump_height(elapsed))
+
+            self.jump_count += dt
+
+            if self.jump_count >= 24:
+                self.jumping = False
+                self.jump_count = 0
+
+        # Check if we're on ground to reset jump ability
+        if self.foot_position[1] + raio >= chao - 5:  # Small threshold
+            self.jump_ready = True
+
+    def pack_flags(self):
+        """Pack the boolean jump/kick states into a byte"""
+        return self.jumping | self.jump_ready << 1 | self.kicking << 2
+
+    def unpack_flags(self, flags):
+        """Restore the boolean states from ``pack_flags``, and the kick pose they imply"""
+        self.jumping = bool(flags & 1)
+        self.jump_ready = bool(flags & 2)
+        self.kicking = bool(flags & 4)
+        if self.kicking and self.kick_count > 0:
+            self.foot_dx, self.foot_dy = kick_foot_offset(self.kick_count, self.is_left_player)
+            self.sprite_action = 'kick1' if self.kick_count <= 8 else 'kick2'
+        else:
+            self.foot_dx = 0
+            self.foot_dy = 0
+            self.sprite_action = ''
+
+    def start_kick(self):
+        """Start kicking"""
+        if not self.kicking:
+            self.kicking = True
+            self.kick_count = 0
+
+    def update_kick(self, dt=1.0):
+        """Update kick state
+
+        Args:
+            dt: Time step in ticks
+        """
+        if self.kicking:
+            self.kick_count += dt
+            if self.kick_count >= 15:
+                self.sprite_action = ''
+                self.kick_count = 0
+                self.foot_dx = 0
+                self.foot_dy = 0
+                self.kicking = False
+            else:
+                self.foot_dx, self.foot_dy = kick_foot_offset(self.kick_count, self.is_left_player)
+                self.sprite_action = 'kick1' if self.kick_count <= 8 else 'kick2'
+
+
+class FieldGrid:
+    """Precomputed map of where the static field rules can apply
+
+    The field is split into square cells of ball-centre positions. Each cell
+    holds flags telling whether a wall/crossbar bounce (``COLLISION``) or a
+    goal (``GOAL``) is possible anywhere in it, worked out from the rule
+    boundaries for one ball radius. Most of the field is neither, so a single
+    lookup answers most queries; flagged cells and positions off the grid
+    still go through the exact rules, which keeps the results unchanged.
+    """
+
+    COLLISION = 0x01
+    GOAL = 0x02
+
+    def __init__(self, rules, ball_radius, height=field_height, cell_size=8):
+        """Bake the grid
+
+        Args:
+            rules: FieldRules to bake
+            ball_radius: Ball radius the grid is valid for
+            height: Height of the field in pixels
+            cell_size: Cell size in pixels
+        """
+        self.ball_radius = ball_radius
+        self.cell_size = cell_size
+        self.cols = -(-rules.width // cell_size)
+        self.rows = -(-height // cell_size)
+
+        r = ball_radius
+        inf = float("inf")
+        # Each rule fires only inside an (x range) x (y range) box
+        collision_boxes = [
+            (rules.width - r, inf, -inf, inf),  # Right wall
+            (-inf, r, -inf, inf),               # Left wall
+            (-inf, inf, -inf, r)                # Ceiling
+        ]
+        goal_boxes = []
+        for bounds in (rules.left_goal_bounds, rules.right_goal_bounds):
+            collision_boxes.append((bounds['x1'] - r, bounds['x2'] + r,
+                                    bounds['y1'] - 5 - r, bounds['y1'] + CROSSBAR_DEPTH))
+            goal_boxes.append((bounds['x1'] + r, bounds['x2'] - r,
+                               bounds['y1'] + CROSSBAR_DEPTH - r, bounds['y2'] + r))
+
+        # Cells are grown by a pixel so rounding in a lookup can't pick a
+        # quiet neighbour of a flagged position
+        cells = bytearray(self.cols * self.rows)
+        for row in range(self.rows):
+            y0 = row * cell_size - 1
+            y1 = y0 + cell_size + 2
+            for col in range(self.cols):
+                x0 = col * cell_size - 1
+                x1 = x0 + cell_size + 2
+                flags = 0
+                for bx0, bx1, by0, by1 in collision_boxes:
+                    if bx0 <= x1 and x0 <= bx1 and by0 <= y1 and y0 <= by1:
+                        flags |= self.COLLISION
+                for bx0, bx1, by0, by1 in goal_boxes:
+                    if bx0 <= x1 and x0 <= bx1 and by0 <= y1 and y0 <= by1:
+                        flags |= self.GOAL
+                cells[row * self.cols + col] = flags
+        self.cells = bytes(cells)
+
+    def lookup(self, ball_x, ball_y):
+        """Flags of the cell containing a ball centre (all flags if off the grid)"""
+        col = int(ball_x // self.cell_size)
+        row = int(ball_y // self.cell_size)
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self.cells[row * self.cols + col]
+        return self.COLLISION | self.GOAL
+
+
+class FieldRules:
+    """Goal boundaries and boundary collision rules of the field"""
+
+    def __init__(self, width, params=DEFAULT_PARAMS):
+        """Create the rules of a field
+
+        Args:
+            width: Field width
+            params: PhysicsParams for the wall, ceiling and crossbar bounces
+        """
+        self.width = width
+        self.params = params
+
+        # Goal sprites are anchored at (55, 450) and (width - 55, 450)
+        self.left_goal_bounds = {
+            'x1': 55 - larg_t,
+            'x2': 55 + larg_t,
+            'y1': 450 - alt_t,
+            'y2': 450 + alt_t
+        }
+
+        self.right_goal_bounds = {
+            'x1': width - 55 - larg_t,
+            'x2': width - 55 + larg_t,
+            'y1': 450 - alt_t,
+            'y2': 450 + alt_t
+        }
+        self._grid = None
+
+    @property
+    def grid(self):
+        """FieldGrid for the configured ball radius, baked on first use"""
+        if self._grid is None:
+            self._grid = FieldGrid(self, raio)
+        return self._grid
+
+    def free_zone(self, ball_radius):
+        """Ball centre positions at which no field rule can apply
+
+        Between the goal zones and below the ceiling neither
+        ``check_field_collision`` nor ``check_goal`` changes anything,
+        whatever the velocity. The floor is handled by the ball physics.
+
+        Returns:
+            tuple: (x_min, x_max, y_min); a ball is clear of every rule while
+                x_min < x < x_max and y >= y_min
+        """
+        return (self.left_goal_bounds['x2'] + ball_radius,
+                self.right_goal_bounds['x1'] - ball_radius,
+                ball_radius)
+
+    def check_goal(self, ball_x, ball_y, ball_radius):
+        """Check if a goal has been scored
+
+        Args:
+            ball_x: Ball's x position
+            ball_y: Ball's y position
+            ball_radius: Ball's radius
+
+        Returns:
+            tuple: (bool, str) - (is_goal, side_scored)
+                  side_scored can be "left" or "right" or None
+        """
+        # Check left goal - ball must be fully inside the goal area AND below crossbar
+        if (self.left_goal_bounds['x1'] <= ball_x - ball_radius and
+            ball_x + ball_radius <= self.left_goal_bounds['x2'] and
+            self.left_goal_bounds['y1'] <= ball_y + ball_radius and
+            ball_y - ball_radius <= self.left_goal_bounds['y2']):
+            # Only count as goal if ball is below the crossbar
+            if ball_y + ball_radius > self.left_goal_bounds['y1'] + CROSSBAR_DEPTH:
+                return True, "right"  # Right player scores when ball enters left goal
+
+        # Check right goal - ball must be fully inside the goal area AND below crossbar
+        if (self.right_goal_bounds['x1'] <= ball_x - ball_radius and
+            ball_x + ball_radius <= self.right_goal_bounds['x2'] and
+            self.right_goal_bounds['y1'] <= ball_y + ball_radius and
+            ball_y - ball_radius <= self.right_goal_bounds['y2']):
+            # Only count as goal if ball is below the crossbar
+            if ball_y + ball_radius > self.right_goal_bounds['y1'] + CROSSBAR_DEPTH:
+                return True, "left"  # Left player scores when ball enters right goal
+
+        return False, None
+
+    def check_field_collision(self, ball_x, ball_y, ball_radius, ball_velx, ball_vely):
+        """Check and handle ball collisions with field boundaries and goal posts
+
+        Args:
+            ball_x: Ball's x position
+            ball_y: Ball's y position
+            ball_radius: Ball's radius
+            ball_velx: Ball's x velocity
+            ball_vely: Ball's y velocity
+
+        Returns:
+            tuple: (new_velx, new_vely) - Updated velocities after collision
+        """
+        new_velx = ball_velx
+        new_vely = ball_vely
+        params = self.params
+        RESTITUTION = params.restitution  # Increased bounce factor
+        MIN_BOUNCE_SPEED = params.min_bounce_speed  # Ensures the ball returns to play
+
+        # Field boundaries with strong bounce back
+        if ball_x + ball_radius > self.width:
+            if ball_velx > 0:
+                new_velx = -max(abs(ball_velx) * RESTITUTION, MIN_BOUNCE_SPEED)
+                # Add inward force
+                new_velx -= params.wall_push
+        if ball_x - ball_radius < 0:
+            if ball_velx < 0:
+                new_velx = max(abs(ball_velx) * RESTITUTION, MIN_BOUNCE_SPEED)
+                # Add inward force
+                new_velx += params.wall_push
+        if ball_y - ball_radius < 0:
+            if ball_vely < 0:
+                new_vely = max(abs(ball_vely) * RESTITUTION, MIN_BOUNCE_SPEED)
+                # Add downward force
+                new_vely += params.ceiling_push
+
+        # Goal post collisions with strong bounce back
+        # Left goal collision
+        if (self.left_goal_bounds['x1'] - ball_radius <= ball_x <= self.left_goal_bounds['x2'] + ball_radius and
+            ball_y <= self.left_goal_bounds['y1'] + CROSSBAR_DEPTH):
+            if ball_y + ball_radius > self.left_goal_bounds['y1'] - 5:
+                # Strong bounce with additional outward force
+                new_vely = -max(abs(ball_vely) * RESTITUTION, MIN_BOUNCE_SPEED)
+                # Add slight push towards field center
+                if ball_x < self.width / 2:
+                    new_velx += params.crossbar_push
+                else:
+                    new_velx -= params.crossbar_push
+
+        # Right goal collision
+        if (self.right_goal_bounds['x1'] - ball_radius <= ball_x <= self.right_goal_bounds['x2'] + ball_radius and
+            ball_y <= self.right_goal_bounds['y1'] + CROSSBAR_DEPTH):
+            if ball_y + ball_radius > self.right_goal_bounds['y1'] - 5:
+                # Strong bounce with additional outward force
+                new_vely = -max(abs(ball_vely) * RESTITUTION, MIN_BOUNCE_SPEED)
+                # Add slight push towards field center
+                if ball_x < self.width / 2:
+                    new_velx += params.crossbar_push
+                else:
+                    new_velx -= params.crossbar_push
+
+        return new_velx, new_vely
+
+
+class World:
+    """Complete match state with a Tk-free simulation step"""
+
+    # tick, ball x/y/velx/vely, per player x/y/jump_count/kick_count/flags,
+    # score left/right, is_goal
+    SNAPSHOT = struct.Struct("<I4d4dB4dBHH?")
+
+    def __init__(self, ball=None, player1=None, player2=None, field=None,
+                 substeps=physics_substeps, params=None):
+        """Create a match at kickoff, or around existing state objects
+
+        Args:
+            ball: BallState to simulate (default: new ball at kickoff)
+            player1: Left PlayerState (default: new player at kickoff)
+            player2: Right PlayerState (default: new player at kickoff)
+            field: FieldRules to use (default: rules for the configured width
+                and ``params``)
+            substeps: Physics substeps per tick
+            params: PhysicsParams (default: those of ``field``). Field bounces
+                always follow the parameters of the field rules
+        """
+        self.ball = ball if ball is not None else BallState(*BALL_START)
+        self.player1 = player1 if player1 is not None else PlayerState(*PLAYER1_START, True)
+        self.player2 = player2 if player2 is not None else PlayerState(*PLAYER2_START, False)
+        if field is None:
+            field = FieldRules(field_width, params if params is not None else DEFAULT_PARAMS)
+        self.field = field
+        self.params = params if params is not None else field.params
+        self.score = {"left": 0, "right": 0}
+        self.touches = {"left": 0, "right": 0}  # Statistics only, not in snapshots
+        self.is_goal = False
+        self.tick = 0
+        self.substeps = substeps
+
+        # Everything the collision system sees; player1, player2 and ball
+        # are the 1v1 match, further entries come from add_player/add_ball
+        self.players = [self.player1, self.player2]
+        self.balls = [self.ball]
+        self.posts = post_bodies(self.field)
+        self.collisions = CollisionSystem(params=self.params)
+
+    def add_player(self, x, y, is_left_player):
+        """Add a player for 2v2 or practice modes
+
+        Extra players are controlled through key 3, 4, ... of the
+        ``apply_inputs`` control state.
+
+        Returns:
+            PlayerState: The new player
+        """
+        player = PlayerState(x, y, is_left_player)
+        self.players.append(player)
+        return player
+
+    def add_ball(self, x, y):
+        """Add another ball for multi-ball or practice modes
+
+        Returns:
+            BallState: The new ball
+        """
+        ball = BallState(x, y)
+        self.balls.append(ball)
+        return ball
+
+    def step(self, inputs):
+        """Advance the match by one tick
+
+        Args:
+            inputs: Control state in the ``Controller.process_input`` format
+
+        Returns:
+            bool: True if a goal was scored during this tick
+        """
+        self.apply_inputs(inputs)
+        self.update_physics()
+        return self.is_goal
+
+    def apply_inputs(self, player_states):
+        """Apply a control state to the players; missing players stay idle"""
+        for number, player in enumerate(self.players, 1):
+            state = player_states.get(number)
+            if state is None:
+                continue
+            if state["movement"] == "left":
+                player.move(-self.params.move_speed, 0)
+            elif state["movement"] == "right":
+                player.move(self.params.move_speed, 0)
+            if state["jump"] == "jumping":
+                player.start_jump()
+            if state["kick"] == "kicking":
+                player.start_kick()
+
+    def update_physics(self):
+        """Advance physics and collisions by one tick, in ``substeps`` steps"""
+        dt = 1.0 / self.substeps
+        for _ in range(self.substeps):
+            self.integrate(dt)
+        self.tick += 1
+
+    def integrate(self, dt):
+        """Advance physics and collisions by ``dt`` ticks"""
+        # Update player jump/kick counters
+        for player in self.players:
+            player.update_jump(dt)
+            player.update_kick(dt)
+
+        # Handle collisions first
+        self.handle_collisions()
+
+        for ball in self.balls:
+            # Check field boundaries and goal post collisions
+            ball.velx, ball.vely = self.field.check_field_collision(
+                ball.x, ball.y, raio, ball.velx, ball.vely
+            )
+
+            # Then apply physics
+            ball.apply_physics(self.params.friction, chao, dt, self.params)
+
+            # Finally check for goals, but only if not already in goal state
+            if not self.is_goal:
+                is_goal, side = self.field.check_goal(ball.x, ball.y, raio)
+                if is_goal:
+                    self.score[side] += 1
+                    self.is_goal = True
+
+    def skip_idle(self, ticks):
+        """Advance up to ``ticks`` ticks with no input, skipping free ball flight
+
+        Gives exactly the same result as ``step({})`` called tick by tick, but
+        while nothing can happen except the ball moving (players standing
+        still, the ball clear of them and of every field rule) only the ball
+        physics is run, and once the match stops changing, e.g. with the ball
+        at rest, the remaining ticks are skipped at once.
+
+        Args:
+            ticks: Max ticks to advance
+
+        Returns:
+            int: Ticks advanced; fewer than ``ticks`` if a goal was scored,
+                which ends the skip right after the scoring tick
+        """
+        done = 0
+        while done < ticks:
+            flown = self._fly(ticks - done)
+            done += flown
+            if done < ticks:
+                goal_pending = self.is_goal
+                self.step({})
+                done += 1
+                if self.is_goal and not goal_pending:
+                    break
+        return done
+
+    def _fly(self, ticks):
+        """Run up to ``ticks`` ticks of ball-only physics while that is exact
+
+        Returns:
+            int: Ticks run; 0 if the next tick needs the full step
+        """
+        if len(self.balls) != 1:
+            return 0
+        for player in self.players:
+            if player.jumping or player.kicking or not player.jump_ready:
+                return 0
+
+        # Players don't move, so their heads and feet are fixed circles
+        reach = (PLAYER_REACH + 1) ** 2  # Margin for the rounding of the exact test
+        parts = []
+        for player in self.players:
+            parts.append(player.head_position)
+            parts.append(player.foot_position)
+        x_min, x_max, y_min = self.field.free_zone(raio)
+        ball = self.ball
+        params = self.params
+        friction = params.friction
+        dt = 1.0 / self.substeps
+        substeps = range(self.substeps)
+
+        done = 0
+        while done < ticks:
+            start = (ball.x, ball.y, ball.velx, ball.vely)
+            clear = True
+            for _ in substeps:
+                x, y = ball.x, ball.y
+                if not (x_min < x < x_max and y >= y_min):
+                    clear = False
+                    break
+                for part_x, part_y in parts:
+                    if (x - part_x) ** 2 + (y - part_y) ** 2 <= reach:
+                        clear = False
+                        break
+                if not clear:
+                    break
+                ball.apply_physics(friction, chao, dt, params)
+            # The goal check after the last substep needs the ball clear too
+            if not clear or not (x_min < ball.x < x_max):
+                ball.x, ball.y, ball.velx, ball.vely = start
+                break
+            done += 1
+            end = (ball.x, ball.y, ball.velx, ball.vely)
+            if end == start and list(map(type, end)) == list(map(type, start)):
+                # Nothing changes any more: every further tick is the same
+                done = ticks
+                break
+
+        if done:
+            self.tick += done
+            self.collisions.contacts = []
+            self.collisions.touching = set()
+        return done
+
+    def handle_collisions(self):
+        """Handle ball collisions with every player's head and foot"""
+        was_touching = self.collisions.touching
+        self.collisions.step(self.players, self.balls, self.posts)
+        touching = self.collisions.touching
+        if touching and touching != was_touching:
+            # A touch starts when a player gets in contact with the ball
+            for player in self.players:
+                if id(player) in touching and id(player) not in was_touching:
+                    self.touches["left" if player.is_left_player else "right"] += 1
+
+    def snapshot(self):
+        """Pack the 1v1 match state into a fixed-size record
+
+        Balls and players added with ``add_ball``/``add_player`` are not
+        included.
+
+        Returns:
+            bytes: ``World.SNAPSHOT.size`` bytes to pass to ``restore``
+        """
+        ball, p1, p2 = self.ball, self.player1, self.player2
+        return self.SNAPSHOT.pack(
+            self.tick, ball.x, ball.y, ball.velx, ball.vely,
+            p1.x, p1.y, p1.jump_count, p1.kick_count, p1.pack_flags(),
+            p2.x, p2.y, p2.jump_count, p2.kick_count, p2.pack_flags(),
+            self.score["left"], self.score["right"], self.is_goal
+        )
+
+    def restore(self, snapshot):
+        """Rewind to a state returned by ``snapshot``, in place"""
+        ball, p1, p2 = self.ball, self.player1, self.player2
+        (self.tick, ball.x, ball.y, ball.velx, ball.vely,
+         p1.x, p1.y, p1.jump_count, p1.kick_count, flags1,
+         p2.x, p2.y, p2.jump_count, p2.kick_count, flags2,
+         self.score["left"], self.score["right"], self.is_goal) = self.SNAPSHOT.unpack(snapshot)
+        p1.unpack_flags(flags1)
+        p2.unpack_flags(flags2)
+
+    def reset_positions(self):
+        """Put ball and players back at kickoff"""
+        self.is_goal = False
+        self.ball.reset(*BALL_START)
+        self.player1.set_position(*PLAYER1_START)
+        self.player2.set_position(*PLAYER2_START)
+
+    def reset_match(self):
+        """Reset score and positions for a new match"""
+        self.score = {"left": 0, "right": 0}
+        self.touches = {"left": 0, "right": 0}
+        self.reset_positions()
@@ -0,0 +1,294 @@
+"""Shared image assets.
+
+Every screen asks the ``assets`` manager for its images instead of working
+out paths and decoding files itself. Gameplay images are decoded once and
+kept for the whole session; the game preloads them while the intro screen
+waits for input, so the first match frame doesn't stall on disk reads.
+Menu-only images are kept in a small LRU cache, so a long-running session
+holds at most a few of them no matter how often the menus are visited.
+
+Images derived from a source file, like the control-selection background
+scaled to the window, come from a ``DerivedCache``: they are computed once
+per source content and size, and optionally saved in the user cache
+directory for the next run. Nothing is ever written to the source tree.
+
+When a bundle built by ``python -m src.tools.build_assets`` is present,
+images are sliced from its memory-mapped atlas instead of read from their
+own files (see ``bundle.py``).
+"""
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+from .backend import image_size
+from .bundle import open_bundle
+from .paths import IMAGES_DIR, BUNDLE_PATH
+
+# Images used every match, kept for the whole session
+GAMEPLAY_IMAGES = (
+    "bg.gif", "trave1.gif", "trave2.gif", "ball.gif",
+    "LeftChar.gif", "LeftChar_kick1.gif", "LeftChar_kick2.gif",
+    "RightChar.gif", "RightChar_kick1.gif", "RightChar_kick2.gif",
+)
+# Images only shown by the menus
+INTRO_IMAGE = "intro2.gif"
+CONTROLS_BACKGROUND = "istockphoto-1204755567-612x612.gif"
+MENU_IMAGES = (INTRO_IMAGE, CONTROLS_BACKGROUND)
+
+MENU_CACHE_SIZE = 2     # Menu images kept decoded at once
+DERIVED_CACHE_SIZE = 2  # Derived images kept in memory at once
+BYTES_PER_PIXEL = 4     # Tk photo images are stored as 32-bit RGBA
+
+
+def _load_photo(path):
+    """Default loader: a Tk PhotoImage"""
+    from .graphics import load_image
+    return load_image(path)
+
+
+def _photo_from_pil(picture):
+    """Default converter: a Tk PhotoImage showing a PIL image"""
+    from .graphics import image_from_pil
+    return image_from_pil(picture)
+
+
+def user_cache_dir():
+    """Per-user directory for derived images"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "head-soccer")
+
+
+class DerivedCache:
+    """Images computed from source files, keyed by source hash and size
+
+    Args:
+        cache_dir: Directory to save derived images in for later runs, or
+            None to keep them in memory only
+        size: Derived images kept in memory at once
+    """
+
+    def __init__(self, cache_dir=None, size=DERIVED_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.size = size
+        self.images = OrderedDict()
+        self.digests = {}
+
+    def digest(self, path):
+        """Hash of a file's content, computed again only if the file changes"""
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self.digests.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        with open(path, "rb") as source:
+            digest = hashlib.sha1(source.read()).hexdigest()
+        self.digests[path] = (stamp, digest)
+        return digest
+
+    def cover(self, path, size, digest=None, load=None):
+        """Source image scaled to cover ``size``, keeping its proportions
+
+        Args:
+            path: Source image file
+            size: (width, height) to cover
+            digest: Hash of the source, if already known
+            load: Function returning the source as a PIL image, to read it
+                from somewhere other than ``path``
+
+        Returns:
+            PIL.Image.Image: At least ``size`` large, centred on the target
+        """
+        width, height = size
+        key = f"{digest or self.digest(path)}-cover-{width}x{height}"
+        picture = self.images.get(key)
+        if picture is not None:
+            self.images.move_to_end(key)
+            return picture
+
+        from PIL import Image as PILImage
+        cached = os.path.join(self.cache_dir, key + ".png") if self.cache_dir else None
+        if cached and os.path.exists(cached):
+            picture = PILImage.open(cached)
+            picture.load()
+        else:
+            picture = (load() if load else PILImage.open(path)).convert("RGBA")
+            scale = max(width / picture.width, height / picture.height)
+            picture = picture.resize((int(picture.width * scale), int(picture.height * scale)),
+                                     PILImage.LANCZOS)
+            if cached:
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    picture.save(cached + ".tmp", format="PNG")
+                    os.replace(cached + ".tmp", cached)
+                except OSError as e:
+                    print(f"[ERROR] Could not save {cached}: {e}")
+
+        self.images[key] = picture
+        while len(self.images) > self.size:
+            self.images.popitem(last=False)
+        return picture
+
+
+class AssetManager:
+    """Decodes images once and shares them between every screen
+
+    Args:
+        images_dir: Directory the image files live in
+        menu_cache_size: Menu-only images kept decoded at once
+        loader: Function turning a file path into a decoded image with
+            ``width()`` and ``height()`` (a Tk PhotoImage by default)
+        pinned: Names kept for the whole session; every other image goes
+            through the LRU cache
+        converter: Function turning a PIL image into a displayable image
+        derived: DerivedCache for scaled copies (in memory only by default)
+        bundle: AssetBundle to take images from before trying their files
+    """
+
+    def __init__(self, images_dir=IMAGES_DIR, menu_cache_size=MENU_CACHE_SIZE,
+                 loader=_load_photo, pinned=GAMEPLAY_IMAGES, converter=_photo_from_pil,
+                 derived=None, bundle=None):
+        self.images_dir = images_dir
+        self.menu_cache_size = menu_cache_size
+        self.loader = loader
+        self.converter = converter
+        self.derived = derived if derived is not None else DerivedCache()
+        self.bundle = bundle
+        self.pinned_names = frozenset(pinned)
+        self.paths = {}
+        self.pinned = {}
+        self.menu = OrderedDict()
+        self.pending = list(pinned)
+
+    def path(self, name):
+        """Absolute path of an image file, resolved once"""
+        path = self.paths.get(name)
+        if path is None:
+            path = self.paths[name] = os.path.join(self.images_dir, name)
+        return path
+
+    def has(self, name):
+        """Whether an image can be loaded, from the bundle or its own file"""
+        return (self.bundle is not None and name in self.bundle) or os.path.exists(self.path(name))
+
+    def get(self, name):
+        """Decoded image, shared with every other caller
+
+        Raises:
+            Whatever the loader raises if the file can't be read
+        """
+        image = self.pinned.get(name)
+        if image is not None:
+            return image
+        if name in self.pinned_names:
+            image = self.pinned[name] = self._load(name)
+            return image
+
+        image = self._recall(name)
+        if image is None:
+            image = self._remember(name, self._load(name))
+        return image
+
+    def _load(self, name):
+        """Decode an image from the bundle, or else from its file"""
+        if self.bundle is not None and name in self.bundle:
+            return self.converter(self.bundle.picture(name))
+        return self.loader(self.path(name))
+
+    def cover(self, name, size):
+        """Image scaled to cover ``size`` (see DerivedCache.cover)
+
+        Kept in the menu LRU cache like any menu image.
+        """
+        key = f"{name}@{size[0]}x{size[1]}"
+        image = self._recall(key)
+        if image is None:
+            if self.bundle is not None and name in self.bundle:
+                picture = self.derived.cover(None, size, digest=self.bundle.digest(name),
+                                             load=lambda: self.bundle.picture(name))
+            else:
+                picture = self.derived.cover(self.path(name), size)
+            image = self._remember(key, self.converter(picture))
+        return image
+
+    def _recall(self, key):
+        """Menu image from the LRU cache, or None"""
+        image = self.menu.get(key)
+        if image is not None:
+            self.menu.move_to_end(key)
+        return image
+
+    def _remember(self, key, image):
+        """Add a menu image to the LRU cache"""
+        self.menu[key] = image
+        # Images still on screen stay alive through their Image objects
+        while len(self.menu) > self.menu_cache_size:
+            self.menu.popitem(last=False)
+        return image
+
+    def preload_step(self):
+        """Decode the next gameplay image not loaded yet
+
+        Meant to be called from a menu loop while it waits for input.
+
+        Returns:
+            bool: False once every gameplay image is loaded
+        """
+        while self.pending:
+            name = self.pending.pop(0)
+            if name in self.pinned:
+                continue
+            try:
+                self.get(name)
+            except Exception as e:
+                print(f"[ERROR] Could not preload {name}: {e}")
+            return True
+        return False
+
+    def preload(self):
+        """Decode every gameplay image not loaded yet"""
+        while self.preload_step():
+            pass
+
+    def use(self, loader, converter):
+        """Switch to another image format, e.g. for an off-screen backend
+
+        Every cached image is dropped and decoded again on its next get.
+        """
+        self.loader = loader
+        self.converter = converter
+        self.pinned.clear()
+        self.menu.clear()
+        self.pending = list(self.pinned_names)
+
+    def release(self, name):
+        """Drop a cached image; it is decoded again on the next get"""
+        self.pinned.pop(name, None)
+        self.menu.pop(name, None)
+
+    def memory(self):
+        """Decoded size of every cached image
+
+        Returns:
+            dict: Image name to bytes
+        """
+        images = dict(self.pinned)
+        images.update(self.menu)
+        sizes = {name: image_size(image) for name, image in images.items()}
+        return {name: width * height * BYTES_PER_PIXEL for name, (width, height) in sizes.items()}
+
+    def report(self):
+        """Print the decoded size of every cached image"""
+        memory = self.memory()
+        for name, size in sorted(memory.items(), key=lambda item: -item[1]):
+            kind = "pinned" if name in self.pinned else "menu"
+            print(f"[INFO] {name:40s} {kind:6s} {size / 1024:9.1f} KiB")
+        print(f"[INFO] {'total':40s} {'':6s} {sum(memory.values()) / 1024:9.1f} KiB")
+
+
+# Shared by every screen of the game
+assets = AssetManager(derived=DerivedCache(user_cache_dir()), bundle=open_bundle(BUNDLE_PATH))
@@ -0,0 +1,283 @@
+"""Rendering backends.
+
+Graphics objects (``graphics.py``) draw through a ``RenderBackend``: the
+surface they are drawn to. ``GraphWin`` is the Tk backend, a window with a
+canvas; ``OffscreenWin`` (``offscreen.py``) composites the same objects into
+a NumPy framebuffer without a display, and ``NullWin`` (``null.py``) only
+records what was drawn. The last two keep their items in a
+``DisplayListBackend``.
+
+A backend keeps a display list of items, identified by the ids its
+``create_*`` methods return; tags name sets of items. The methods follow
+the Tk canvas ones, so graphics objects talk to every backend the same way.
+"""
+from abc import ABC, abstractmethod
+
+
+def split_args(args, kw):
+    """Split Tk-style ``create_*`` arguments into coordinates and options
+
+    Args:
+        args: Coordinates, possibly nested in lists or tuples, and option dicts
+        kw: Keyword options
+
+    Returns:
+        tuple: (list of coordinates, dict of options)
+    """
+    coords = []
+    options = {}
+    for arg in args:
+        if isinstance(arg, dict):
+            options.update(arg)
+        elif isinstance(arg, (list, tuple)):
+            coords.extend(arg)
+        else:
+            coords.append(arg)
+    options.update(kw)
+    return coords, options
+
+
+def image_size(image):
+    """(width, height) of a Tk PhotoImage, PIL image or (height, width, ...) array"""
+    if hasattr(image, "shape"):
+        return image.shape[1], image.shape[0]
+    if callable(image.width):
+        return image.width(), image.height()
+    return image.width, image.height
+
+
+class RenderBackend(ABC):
+    """Surface that graphics objects are drawn on
+
+    Besides the methods below, graphics objects use these attributes:
+        width, height: Size in pixels
+        autoflush: Whether to update after every change
+        trans: Coordinate transform, or None
+        images: Item id to image, keeping drawn images alive
+
+    Input methods return "no input" by default, so code written for a
+    window runs unchanged on backends without one.
+    """
+
+    @abstractmethod
+    def create_image(self, *args, **kw):
+        """Add an image item centred on (x, y); returns its id"""
+
+    @abstractmethod
+    def create_oval(self, *args, **kw):
+        """Add an oval item inside (x1, y1, x2, y2); returns its id"""
+
+    @abstractmethod
+    def create_rectangle(self, *args, **kw):
+        """Add a rectangle item (x1, y1, x2, y2); returns its id"""
+
+    @abstractmethod
+    def create_line(self, *args, **kw):
+        """Add a line item through the given points; returns its id"""
+
+    @abstractmethod
+    def create_polygon(self, *args, **kw):
+        """Add a polygon item with the given corners; returns its id"""
+
+    @abstractmethod
+    def create_text(self, *args, **kw):
+        """Add a text item centred on (x, y); returns its id"""
+
+    @abstractmethod
+    def move(self, tagOrId, dx, dy):
+        """Move an item, or every item with a tag"""
+
+    @abstractmethod
+    def itemconfig(self, tagOrId, cnf=None, **kw):
+        """Change options of an item, or of every item with a tag"""
+
+    @abstractmethod
+    def addtag_withtag(self, tag, tagOrId):
+        """Add a tag to an item, or to every item with another tag"""
+
+    @abstractmethod
+    def delete(self, *args):
+        """Remove items"""
+
+    @abstractmethod
+    def update(self):
+        """Show every change made so far"""
+
+    @abstractmethod
+    def close(self):
+        """Release the surface"""
+
+    @abstractmethod
+    def isClosed(self):
+        """Whether the surface was closed"""
+
+    def isOpen(self):
+        """Whether the surface is still open"""
+        return not self.isClosed()
+
+    def commit(self):
+        """Send collected changes to the surface (see GraphWin deferred mode)"""
+
+    def setBackground(self, color):
+        """Set the background colour"""
+        self.background = color
+
+    def getWidth(self):
+        """Return the width of the surface."""
+        return self.width
+
+    def getHeight(self):
+        """Return the height of the surface."""
+        return self.height
+
+    def toScreen(self, x, y):
+        """Convert world coordinates to screen coordinates."""
+        return self.trans.screen(x, y) if self.trans else (x, y)
+
+    def toWorld(self, x, y):
+        """Convert screen coordinates to world coordinates."""
+        return self.trans.world(x, y) if self.trans else (x, y)
+
+    def checkMouse(self):
+        """Last mouse click, or None"""
+        return None
+
+    def checkKey(self):
+        """Last key pressed, or an empty string"""
+        return ""
+
+    def enable_key_buffer(self):
+        """Start tracking every pressed key"""
+
+    ligar_Buffer = enable_key_buffer
+
+    def disable_key_buffer(self):
+        """Stop tracking every pressed key"""
+
+    desligar_Buffer = disable_key_buffer
+
+    def check_key_buffer(self):
+        """Keys currently pressed"""
+        return []
+
+    checkKey_Buffer = check_key_buffer
+
+
+class DisplayItem:
+    """Item of a DisplayListBackend"""
+    __slots__ = ("kind", "coords", "options", "tags", "changed")
+
+    def __init__(self, kind, coords, options):
+        self.kind = kind
+        self.coords = [float(value) for value in coords]
+        self.options = options
+        self.tags = set()
+        self.changed = False
+
+
+class DisplayListBackend(RenderBackend):
+    """Backend keeping its items in Python, for surfaces without Tk
+
+    Args:
+        width: Surface width in pixels
+        height: Surface height in pixels
+        background: Colour behind every item
+
+    Attributes:
+        items: Item id to DisplayItem, in drawing order; ``changed`` is set
+            once an item is moved or reconfigured
+        version: Bumped by deletions and background changes
+    """
+
+    def __init__(self, width=200, height=200, background="black"):
+        self.width = width
+        self.height = height
+        self.background = background
+        self.autoflush = False
+        self.trans = None
+        self.images = {}
+        self.items = {}
+        self.next_id = 1
+        self.version = 0
+        self.closed = False
+
+    def _add(self, kind, args, kw):
+        coords, options = split_args(args, kw)
+        tags = options.pop("tags", ())
+        item = DisplayItem(kind, coords, options)
+        item.tags.update([tags] if isinstance(tags, str) else tags)
+        item_id = self.next_id
+        self.next_id += 1
+        self.items[item_id] = item
+        return item_id
+
+    def create_image(self, *args, **kw):
+        return self._add("image", args, kw)
+
+    def create_oval(self, *args, **kw):
+        return self._add("oval", args, kw)
+
+    def create_rectangle(self, *args, **kw):
+        return self._add("rectangle", args, kw)
+
+    def create_line(self, *args, **kw):
+        return self._add("line", args, kw)
+
+    def create_polygon(self, *args, **kw):
+        return self._add("polygon", args, kw)
+
+    def create_text(self, *args, **kw):
+        return self._add("text", args, kw)
+
+    def find_withtag(self, tagOrId):
+        """Items with a tag, or the item with an id"""
+        if isinstance(tagOrId, str) and not tagOrId.isdigit():
+            if tagOrId == "all":
+                return list(self.items.values())
+            return [item for item in self.items.values() if tagOrId in item.tags]
+        item = self.items.get(int(tagOrId))
+        return [item] if item else []
+
+    def move(self, tagOrId, dx, dy):
+        for item in self.find_withtag(tagOrId):
+            coords = item.coords
+            for i in range(0, len(coords) - 1, 2):
+                coords[i] += dx
+                coords[i + 1] += dy
+            item.changed = True
+
+    def itemconfig(self, tagOrId, cnf=None, **kw):
+        for item in self.find_withtag(tagOrId):
+            item.options.update(cnf or {}, **kw)
+            item.changed = True
+
+    itemconfigure = itemconfig
+
+    def addtag_withtag(self, tag, tagOrId):
+        for item in self.find_withtag(tagOrId):
+            item.tags.add(tag)
+
+    def delete(self, *args):
+        for tagOrId in args:
+            doomed = set(map(id, self.find_withtag(tagOrId)))
+            for item_id in [item_id for item_id, item in self.items.items() if id(item) in doomed]:
+                del self.items[item_id]
+                self.images.pop(item_id, None)
+        self.version += 1
+
+    def coords(self, tagOrId):
+        """Coordinates of the first matching item"""
+        items = self.find_withtag(tagOrId)
+        return list(items[0].coords) if items else []
+
+    def setBackground(self, color):
+        self.background = color
+        self.version += 1
+
+    def close(self):
+        self.closed = True
+        self.items.clear()
+        self.images.clear()
+
+    def isClosed(self):
+        return self.closed
@@ -0,0 +1,171 @@
+"""Precompiled image bundle.
+
+``python -m src.tools.build_assets`` packs every game image into one file:
+a sprite atlas of raw RGBA pixels plus an index of where each image sits in
+it. At startup the bundle is memory-mapped and images are sliced out of the
+mapping, so a cold start reads one file instead of a dozen small ones, and
+only the pages of the images actually shown.
+
+Layout::
+
+    b"HSAB"                  magic
+    uint32 version           little endian
+    uint32 index length
+    index                    JSON, see below
+    padding                  to a multiple of ALIGNMENT
+    atlas                    height rows of width * 4 bytes, RGBA
+    padding                  one more row, so every image can be read
+                             with the atlas stride
+
+The index holds the atlas ``width``, ``height`` and ``offset`` (of the pixel
+data in the file), and ``images``: name to ``[x, y, width, height, sha1]``,
+the SHA-1 being that of the source file.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import numpy as np
+
+MAGIC = b"HSAB"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+ALIGNMENT = 16
+MIN_ATLAS_WIDTH = 1024
+PADDING = 1             # Empty pixels between images
+
+
+def pack_shelves(sizes, width):
+    """Place rectangles on horizontal shelves, tallest first
+
+    Args:
+        sizes: dict of name to (width, height)
+        width: Atlas width
+
+    Returns:
+        tuple: (positions, height) with positions a dict of name to (x, y)
+    """
+    positions = {}
+    x = y = shelf = 0
+    for name in sorted(sizes, key=lambda name: (-sizes[name][1], name)):
+        w, h = sizes[name]
+        if x + w > width:
+            x, y, shelf = 0, y + shelf + PADDING, 0
+        positions[name] = (x, y)
+        x += w + PADDING
+        shelf = max(shelf, h)
+    return positions, y + shelf
+
+
+def write_bundle(paths, out_path):
+    """Pack image files into a bundle
+
+    Args:
+        paths: dict of image name to source file
+        out_path: Bundle file to write
+
+    Returns:
+        dict: The bundle index
+    """
+    from PIL import Image as PILImage
+    pictures = {}
+    digests = {}
+    for name, path in paths.items():
+        with open(path, "rb") as source:
+            digests[name] = hashlib.sha1(source.read()).hexdigest()
+        with PILImage.open(path) as picture:
+            pictures[name] = picture.convert("RGBA")
+
+    sizes = {name: picture.size for name, picture in pictures.items()}
+    width = max([MIN_ATLAS_WIDTH] + [w for w, _ in sizes.values()])
+    positions, height = pack_shelves(sizes, width)
+    atlas = PILImage.new("RGBA", (width, max(height, 1)), (0, 0, 0, 0))
+    for name, picture in pictures.items():
+        atlas.paste(picture, positions[name])
+
+    index = {"width": atlas.width, "height": atlas.height, "offset": 0,
+             "images": {name: [*positions[name], *sizes[name], digests[name]]
+                        for name in sorted(pictures)}}
+    # The offset is part of the index, so settle it before writing
+    while True:
+        encoded = json.dumps(index, sort_keys=True).encode()
+        offset = -(-(HEADER.size + len(encoded)) // ALIGNMENT) * ALIGNMENT
+        if offset == index["offset"]:
+            break
+        index["offset"] = offset
+
+    with open(out_path + ".tmp", "wb") as out:
+        out.write(HEADER.pack(MAGIC, VERSION, len(encoded)))
+        out.write(encoded)
+        out.write(b"\0" * (offset - HEADER.size - len(encoded)))
+        out.write(atlas.tobytes())
+        out.write(b"\0" * atlas.width * 4)
+    os.replace(out_path + ".tmp", out_path)
+    return index
+
+
+class AssetBundle:
+    """Read-only view of a bundle file
+
+    Args:
+        path: Bundle file
+
+    Raises:
+        ValueError: If the file is not a bundle of this version
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as source:
+            self.map = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, length = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.map.close()
+            raise ValueError(f"{path} is not a version {VERSION} asset bundle")
+        index = json.loads(self.map[HEADER.size:HEADER.size + length])
+        self.width = index["width"]
+        self.height = index["height"]
+        self.offset = index["offset"]
+        self.images = index["images"]
+        self.atlas = np.frombuffer(self.map, np.uint8, self.width * self.height * 4,
+                                   self.offset).reshape(self.height, self.width, 4)
+
+    def __contains__(self, name):
+        return name in self.images
+
+    def names(self):
+        """Names of the bundled images"""
+        return list(self.images)
+
+    def digest(self, name):
+        """SHA-1 of the image's source file"""
+        return self.images[name][4]
+
+    def size(self, name):
+        """(width, height) of an image"""
+        return tuple(self.images[name][2:4])
+
+    def array(self, name):
+        """Image pixels as a (height, width, 4) RGBA view of the mapping"""
+        x, y, w, h, _ = self.images[name]
+        return self.atlas[y:y + h, x:x + w]
+
+    def picture(self, name):
+        """Image as a PIL image reading straight from the mapping"""
+        from PIL import Image as PILImage
+        x, y, w, h, _ = self.images[name]
+        start = self.offset + (y * self.width + x) * 4
+        return PILImage.frombuffer("RGBA", (w, h), memoryview(self.map)[start:],
+                                   "raw", "RGBA", self.width * 4, 1)
+
+
+def open_bundle(path):
+    """AssetBundle at ``path``, or None if there is no usable bundle there"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return AssetBundle(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"[ERROR] Ignoring asset bundle {path}: {e}")
+        return None
@@ -13,16 +13,21 @@ The library provides the following graphical objects:
     Text
     Entry (for text-based input)
     Image
+    Group (objects moved together)
 
 Various attributes of graphical objects can be set such as
 outline-color, fill-color and line-width. Graphical objects also
 support moving and hiding for animation effects.
+
+Objects are drawn on a RenderBackend (see backend.py): a GraphWin window,
+or an OffscreenWin that renders frames without a display.
 """
 
 import time
 import os
 import sys
 import tkinter as tk
+from .backend import RenderBackend, image_size
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -54,13 +59,13 @@ class GraphicsObject:
         self._reconfig("width", width)
 
     def draw(self, graphwin):
-        """Draw the object in graphwin, which should be a GraphWin object"""
+        """Draw the object in graphwin, which should be a RenderBackend (e.g. GraphWin)"""
         if self.canvas and not self.canvas.isClosed(): raise GraphicsError(OBJ_ALREADY_DRAWN)
         if graphwin.isClosed(): raise GraphicsError("Can't draw to closed window")
         self.canvas = graphwin
         self.id = self._draw(graphwin, self.config)
         if graphwin.autoflush:
-            _root.update()
+            graphwin.update()
 
     def undraw(self):
         """Undraw the object"""
@@ -68,18 +73,19 @@ class GraphicsObject:
         if not self.canvas.isClosed():
             self.canvas.delete(self.id)
             if self.canvas.autoflush:
-                _root.update()
+                self.canvas.update()
         self.canvas = None
         self.id = None
 
     def _reconfig(self, option, setting):
-        """Reset the configuration"""
+        """Reset the configuration; only a changed option reaches the canvas"""
         if option not in self.config:
             raise GraphicsError(UNSUPPORTED_METHOD)
-        options = self.config
-        options[option] = setting
+        if self.config[option] == setting:
+            return
+        self.config[option] = setting
         if self.canvas and not self.canvas.isClosed():
-            self.canvas.itemconfig(self.id, options)
+            self.canvas.itemconfig(self.id, {option: setting})
 
     def getAnchor(self):
         """Return anchor point."""
@@ -96,7 +102,7 @@ class GraphicsObject:
                 y = dy
             self.canvas.move(self.id, x, y)
             if self.canvas.autoflush:
-                _root.update()
+                self.canvas.update()
         return self
 
     def getX(self):
@@ -124,19 +130,35 @@ OBJ_ALREADY_DRAWN = "Object currently drawn"
 UNSUPPORTED_METHOD = "Object doesn't support operation"
 BAD_OPTION = "Illegal option value"
 
-# Root window setup
-_root = tk.Tk()
-_root.withdraw()
+# Root window, created by the first thing that needs Tk, so importing this
+# module (and the game objects) works without a display
+_root = None
+
+def get_root():
+    """Return the hidden Tk root window, creating it on first use."""
+    global _root
+    if _root is None:
+        _root = tk.Tk()
+        _root.withdraw()
+    return _root
 
 def update():
     """Update the display."""
-    _root.update()
+    get_root().update()
 
-class GraphWin(tk.Canvas):
-    """A GraphWin is a toplevel window for displaying graphics."""
+class GraphWin(tk.Canvas, RenderBackend):
+    """A GraphWin is a toplevel window for displaying graphics (the Tk backend).
 
-    def __init__(self, title="Graphics Window", width=200, height=200, autoflush=True):
-        master = tk.Toplevel(_root)
+    A deferred window doesn't send moves and option changes to Tk as they
+    happen: it collects them per canvas item and sends them all on the next
+    ``update`` (or ``commit``), with every move of the frame in a single Tcl
+    call. Items moved back and forth, or reconfigured several times, in one
+    frame cost one change.
+    """
+
+    def __init__(self, title="Graphics Window", width=200, height=200, autoflush=True,
+                 deferred=False):
+        master = tk.Toplevel(get_root())
         master.protocol("WM_DELETE_WINDOW", self.close)
         tk.Canvas.__init__(self, master, width=width, height=height)
         self.master.title(title)
@@ -144,6 +166,7 @@ class GraphWin(tk.Canvas):
         master.resizable(0, 0)
         self.foreground = "black"
         self.items = []
+        self.images = {}  # Item id -> PhotoImage, keeps drawn images alive
         self.mouseX = None
         self.mouseY = None
         self.bind("<Button-1>", self._onClick)
@@ -157,9 +180,13 @@ class GraphWin(tk.Canvas):
         master.lift()
         self.lastKey = ""
         self.keys = []
+        self.deferred = deferred
+        self.pending_moves = {}    # Item id or tag -> [dx, dy]
+        self.pending_configs = {}  # Item id -> changed options
+        self.presented = None      # PhotoImage showing frames from present()
         
         if autoflush:
-            _root.update()
+            get_root().update()
 
     def enable_key_buffer(self):
         """Enable key buffer for multiple key detection."""
@@ -214,6 +241,9 @@ class GraphWin(tk.Canvas):
         if self.closed:
             return
         self.closed = True
+        self.images.clear()
+        self.pending_moves.clear()
+        self.pending_configs.clear()
         self.master.destroy()
         self.__autoflush()
 
@@ -227,7 +257,7 @@ class GraphWin(tk.Canvas):
 
     def __autoflush(self):
         if self.autoflush:
-            _root.update()
+            get_root().update()
 
     def getMouse(self):
         """Wait for mouse click and return Point object."""
@@ -292,6 +322,69 @@ class GraphWin(tk.Canvas):
         if self._mouseCallback:
             self._mouseCallback(Point(e.x, e.y))
             
+    def move(self, tagOrId, dx, dy):
+        """Move canvas items, now or on the next commit if deferred"""
+        if not self.deferred:
+            tk.Canvas.move(self, tagOrId, dx, dy)
+            return
+        pending = self.pending_moves.get(tagOrId)
+        if pending is None:
+            self.pending_moves[tagOrId] = [dx, dy]
+        else:
+            pending[0] += dx
+            pending[1] += dy
+
+    def itemconfig(self, tagOrId, cnf=None, **kw):
+        """Change item options, now or on the next commit if deferred"""
+        if not self.deferred or (cnf is None and not kw):
+            return tk.Canvas.itemconfigure(self, tagOrId, cnf, **kw)
+        self.pending_configs.setdefault(tagOrId, {}).update(cnf or {}, **kw)
+
+    itemconfigure = itemconfig
+
+    def delete(self, *args):
+        """Delete canvas items, dropping their uncommitted changes"""
+        for tagOrId in args:
+            self.pending_moves.pop(tagOrId, None)
+            self.pending_configs.pop(tagOrId, None)
+        tk.Canvas.delete(self, *args)
+
+    def commit(self):
+        """Send the collected moves and option changes to Tk"""
+        if self.pending_moves:
+            script = "\n".join(f"{self._w} move {tagOrId} {float(dx)!r} {float(dy)!r}"
+                               for tagOrId, (dx, dy) in self.pending_moves.items()
+                               if dx or dy)
+            self.pending_moves.clear()
+            if script:
+                self.tk.eval(script)
+        if self.pending_configs:
+            for tagOrId, options in self.pending_configs.items():
+                tk.Canvas.itemconfigure(self, tagOrId, options)
+            self.pending_configs.clear()
+
+    def present(self, picture):
+        """Show a whole frame composited elsewhere as one image item
+
+        With an OffscreenWin doing the compositing, the window holds a
+        single canvas item whose pixels are replaced every frame.
+
+        Args:
+            picture: PIL image of the window's size
+        """
+        if self.presented is None:
+            self.presented = image_from_pil(picture)
+            item = self.create_image(self.width / 2, self.height / 2, image=self.presented)
+            self.images[item] = self.presented
+        else:
+            self.presented.paste(picture)
+
+    def update(self):
+        """Commit pending changes and process Tk events"""
+        if not self.closed:
+            self.commit()
+        tk.Canvas.update(self)
+
     def toScreen(self, x, y):
         """Convert world coordinates to screen coordinates."""
         if self.trans:
@@ -454,7 +547,7 @@ class Polygon(GraphicsObject):
             args.append(x)
             args.append(y)
         args.append(options)
-        return GraphWin.create_polygon(*args) 
+        return canvas.create_polygon(*args[1:])
 
 class Text(GraphicsObject):
     
@@ -519,7 +612,7 @@ class Entry(GraphicsObject):
         self.anchor = p.clone()
         #print self.anchor
         self.width = width
-        self.text = tk.StringVar(_root)
+        self.text = tk.StringVar(get_root())
         self.text.set("")
         self.fill = "gray"
         self.color = "black"
@@ -602,45 +695,62 @@ class Entry(GraphicsObject):
 class Image(GraphicsObject):
     """Image class for loading and displaying game images."""
     
-    idCount = 0
-    imageCache = {}  # Cache to prevent garbage collection of displayed images
-    
     def __init__(self, p, pixmap):
+        """Create an image
+
+        Args:
+            p: Point at the centre of the image
+            pixmap: Path of an image file, or an already loaded PhotoImage
+                (see ``load_image`` and ``assets``) to share it without reading
+                the file again
+        """
         GraphicsObject.__init__(self, [])
         self.anchor = p.clone()
-        self.imageId = Image.idCount
-        Image.idCount = Image.idCount + 1
-        self.img = tk.PhotoImage(file=pixmap, master=_root)
+        if isinstance(pixmap, str):
+            self.img = tk.PhotoImage(file=pixmap, master=get_root())
+        else:
+            self.img = pixmap
         
     def _draw(self, canvas, options):
         p = self.anchor
         x,y = canvas.toScreen(p.x,p.y)
-        self.imageCache[self.imageId] = self.img
-        return canvas.create_image(x,y,image=self.img)
+        item = canvas.create_image(x,y,image=self.img)
+        canvas.images[item] = self.img
+        return item
         
     def _move(self, dx, dy):
         self.anchor.move(dx,dy)
         
     def drawAt(self, canvas, px, py):
         """Draw image at specific pixel coordinates."""
-        self.imageCache[self.imageId] = self.img
-        return canvas.create_image(px, py, image=self.img)
+        item = canvas.create_image(px, py, image=self.img)
+        canvas.images[item] = self.img
+        return item
         
+    def setImage(self, pixmap):
+        """Show another loaded PhotoImage on the same canvas item
+
+        The item keeps its place and stacking order; nothing is read from
+        disk or created.
+        """
+        self.img = pixmap
+        if self.canvas and not self.canvas.isClosed():
+            self.canvas.images[self.id] = pixmap
+            self.canvas.itemconfig(self.id, image=pixmap)
+
     def undraw(self):
         """Remove image from display."""
-        try:
-            del self.imageCache[self.imageId]
-            GraphicsObject.undraw(self)
-        except KeyError:
-            pass
+        if self.canvas:
+            self.canvas.images.pop(self.id, None)
+        GraphicsObject.undraw(self)
     
     def getWidth(self):
         """Return image width in pixels."""
-        return self.img.width()
+        return image_size(self.img)[0]
 
     def getHeight(self):
         """Return image height in pixels."""
-        return self.img.height()
+        return image_size(self.img)[1]
         
     def getPixel(self, x, y):
         """Get pixel RGB color at given (x,y) coordinate"""
@@ -650,6 +760,66 @@ class Image(GraphicsObject):
         else:
             return list(value[:3])
 
+class Group(GraphicsObject):
+    """Graphics objects that move together
+
+    Members share a canvas tag, so moving the group is one canvas move
+    whatever the number of members.
+    """
+
+    count = 0
+
+    def __init__(self, *objects):
+        GraphicsObject.__init__(self, [])
+        Group.count += 1
+        self.tag = f"group{Group.count}"
+        self.members = []
+        for obj in objects:
+            self.add(obj)
+
+    def add(self, obj):
+        """Add an object; it is drawn with the group if not drawn yet"""
+        self.members.append(obj)
+        if self.canvas and not self.canvas.isClosed():
+            if not obj.isDrawn():
+                obj.draw(self.canvas)
+            self.canvas.addtag_withtag(self.tag, obj.id)
+
+    def draw(self, graphwin):
+        """Draw every member not drawn yet and tag them all"""
+        if self.canvas and not self.canvas.isClosed(): raise GraphicsError(OBJ_ALREADY_DRAWN)
+        if graphwin.isClosed(): raise GraphicsError("Can't draw to closed window")
+        for obj in self.members:
+            if not obj.isDrawn():
+                obj.draw(graphwin)
+            graphwin.addtag_withtag(self.tag, obj.id)
+        self.canvas = graphwin
+        self.id = self.tag
+        return self
+
+    def undraw(self):
+        """Undraw every member"""
+        for obj in self.members:
+            obj.undraw()
+        self.canvas = None
+        self.id = None
+
+    def _move(self, dx, dy):
+        for obj in self.members:
+            obj._move(dx, dy)
+
+    def getAnchor(self):
+        return self.members[0].getAnchor()
+
+def load_image(path):
+    """Read an image file into a PhotoImage that Image objects can share"""
+    return tk.PhotoImage(file=path, master=get_root())
+
+def image_from_pil(picture):
+    """PhotoImage showing a PIL image, without going through a file"""
+    from PIL import ImageTk
+    return ImageTk.PhotoImage(picture, master=get_root())
+
 def color_rgb(r, g, b):
     """Convert RGB values to color string."""
     return "#%02x%02x%02x" % (r, g, b)
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""Null rendering backend.
+
+``NullWin`` accepts every drawing call and renders nothing: the game objects
+run in CI, benchmarks and server workers with no X display. It records the
+calls it gets, so tests can check what would have been sent to the screen.
+Images can't be decoded without files or Tk, so ``use_null_images`` gives
+the shared asset manager placeholder images instead.
+"""
+from collections import Counter, deque
+from .backend import DisplayListBackend
+
+HISTORY = 10000     # Calls kept in NullWin.calls
+
+
+class NullImage:
+    """Placeholder for an image that is never decoded"""
+
+    def __init__(self, name, width=0, height=0):
+        self.name = name
+        self._width = width
+        self._height = height
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def __repr__(self):
+        return f"NullImage({self.name!r})"
+
+
+def use_null_images(manager=None):
+    """Make an asset manager (the shared one by default) hand out NullImages"""
+    if manager is None:
+        from .assets import assets as manager
+    manager.use(NullImage, lambda picture: NullImage("derived", *picture.size))
+    return manager
+
+
+class NullWin(DisplayListBackend):
+    """Backend that records drawing calls instead of rendering them
+
+    Args:
+        width: Surface width in pixels
+        height: Surface height in pixels
+        history: Recent calls kept in ``calls``
+
+    Attributes:
+        calls: Recent calls as (method, arguments...) tuples
+        counts: Number of calls per method since creation
+    """
+
+    def __init__(self, width=200, height=200, history=HISTORY):
+        DisplayListBackend.__init__(self, width, height)
+        self.calls = deque(maxlen=history)
+        self.counts = Counter()
+
+    def _record(self, *call):
+        self.calls.append(call)
+        self.counts[call[0]] += 1
+
+    def _add(self, kind, args, kw):
+        item_id = DisplayListBackend._add(self, kind, args, kw)
+        self._record("create_" + kind, item_id)
+        return item_id
+
+    def move(self, tagOrId, dx, dy):
+        self._record("move", tagOrId, dx, dy)
+        DisplayListBackend.move(self, tagOrId, dx, dy)
+
+    def itemconfig(self, tagOrId, cnf=None, **kw):
+        self._record("itemconfig", tagOrId, dict(cnf or {}, **kw))
+        DisplayListBackend.itemconfig(self, tagOrId, cnf, **kw)
+
+    itemconfigure = itemconfig
+
+    def addtag_withtag(self, tag, tagOrId):
+        self._record("addtag_withtag", tag, tagOrId)
+        DisplayListBackend.addtag_withtag(self, tag, tagOrId)
+
+    def delete(self, *args):
+        self._record("delete", *args)
+        DisplayListBackend.delete(self, *args)
+
+    def update(self):
+        self._record("update")
+
+    def reset_counts(self):
+        """Forget the recorded calls, e.g. after setting a scene up"""
+        self.calls.clear()
+        self.counts.clear()
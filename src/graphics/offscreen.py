@@ -0,0 +1,170 @@
+"""Off-screen rendering backend.
+
+``OffscreenWin`` takes the same graphics objects as a window and composites
+them into a NumPy framebuffer with PIL, without a display: for video export,
+thumbnails or streaming. The leading items that never change (field
+background, goals) are composited once and reused, so a frame costs a copy
+of that layer plus the few moving sprites and texts on top.
+
+Images drawn off screen must be PIL images or NumPy arrays;
+``use_offscreen_images`` makes the shared asset manager load them that way.
+"""
+import numpy as np
+from PIL import Image as PILImage, ImageColor, ImageDraw, ImageFont
+from .backend import DisplayListBackend
+
+FONT_FILES = {
+    ("helvetica", "normal"): "DejaVuSans.ttf",
+    ("helvetica", "bold"): "DejaVuSans-Bold.ttf",
+    ("arial", "normal"): "DejaVuSans.ttf",
+    ("arial", "bold"): "DejaVuSans-Bold.ttf",
+    ("courier", "normal"): "DejaVuSansMono.ttf",
+    ("courier", "bold"): "DejaVuSansMono-Bold.ttf",
+    ("times roman", "normal"): "DejaVuSerif.ttf",
+    ("times roman", "bold"): "DejaVuSerif-Bold.ttf",
+}
+DEFAULT_OPTIONS = {"outline": "black", "fill": "", "width": 1}
+
+
+def load_picture(path):
+    """Loader for the asset manager: an RGBA PIL image"""
+    with PILImage.open(path) as picture:
+        return picture.convert("RGBA")
+
+
+def use_offscreen_images(manager=None):
+    """Make an asset manager (the shared one by default) hand out PIL images"""
+    if manager is None:
+        from .assets import assets as manager
+    manager.use(load_picture, lambda picture: picture.convert("RGBA"))
+    return manager
+
+
+class OffscreenWin(DisplayListBackend):
+    """Backend compositing graphics objects into a framebuffer
+
+    Args:
+        width: Frame width in pixels
+        height: Frame height in pixels
+        background: Colour behind every item
+    """
+
+    def __init__(self, width=200, height=200, background="black"):
+        DisplayListBackend.__init__(self, width, height, background)
+        self.static = None      # Composited leading unchanged items
+        self.static_key = None
+        self.frame = None
+        self.pictures = {}      # id(image) -> (image, RGBA PIL image)
+        self.fonts = {}
+
+    def update(self):
+        """Composite the current frame"""
+        self.render()
+
+    def close(self):
+        DisplayListBackend.close(self)
+        self.pictures.clear()
+        self.static = self.frame = None
+
+    # Compositing
+
+    def render(self):
+        """Composite every item into a new frame
+
+        Returns:
+            numpy.ndarray: (height, width, 3) RGB framebuffer
+        """
+        items = list(self.items.values())
+        stable = 0
+        for item in items:
+            if item.changed:
+                break
+            stable += 1
+        key = (stable, self.version)
+        if self.static_key != key:
+            self.static = PILImage.new("RGB", (self.width, self.height),
+                                       self._color(self.background) or (0, 0, 0))
+            draw = ImageDraw.Draw(self.static)
+            for item in items[:stable]:
+                self._composite(self.static, draw, item)
+            self.static_key = key
+        frame = self.static.copy()
+        draw = ImageDraw.Draw(frame)
+        for item in items[stable:]:
+            self._composite(frame, draw, item)
+        self.frame = frame
+        return np.asarray(frame)
+
+    def picture(self):
+        """Last composited frame as a PIL image"""
+        if self.frame is None:
+            self.render()
+        return self.frame
+
+    def save(self, path):
+        """Save the last composited frame"""
+        self.picture().save(path)
+
+    def _color(self, color):
+        if not color:
+            return None
+        try:
+            return ImageColor.getrgb(color)
+        except ValueError:
+            return None
+
+    def _font(self, font):
+        face, size, style = font if font else ("helvetica", 12, "normal")
+        key = (face, size, style)
+        if key not in self.fonts:
+            name = FONT_FILES.get((face, "bold" if "bold" in style else "normal"), "DejaVuSans.ttf")
+            try:
+                self.fonts[key] = ImageFont.truetype(name, int(size))
+            except OSError:
+                self.fonts[key] = ImageFont.load_default()
+        return self.fonts[key]
+
+    def _rgba(self, image):
+        """RGBA PIL version of a drawn image, converted once"""
+        cached = self.pictures.get(id(image))
+        if cached is not None and cached[0] is image:
+            return cached[1]
+        if isinstance(image, np.ndarray):
+            picture = PILImage.fromarray(image).convert("RGBA")
+        elif isinstance(image, PILImage.Image):
+            picture = image if image.mode == "RGBA" else image.convert("RGBA")
+        else:
+            raise TypeError(f"Off-screen images must be PIL images or arrays, not {type(image).__name__}")
+        self.pictures[id(image)] = (image, picture)
+        return picture
+
+    def _composite(self, frame, draw, item):
+        options = dict(DEFAULT_OPTIONS, **item.options) if item.kind != "image" else item.options
+        if options.get("state") == "hidden":
+            return
+        coords = item.coords
+        width = int(float(options.get("width") or 0))
+        if item.kind == "image":
+            image = options.get("image")
+            if image is None:
+                return
+            picture = self._rgba(image)
+            left = int(round(coords[0] - picture.width / 2))
+            top = int(round(coords[1] - picture.height / 2))
+            frame.paste(picture, (left, top), picture)
+        elif item.kind in ("oval", "rectangle"):
+            box = [min(coords[0], coords[2]), min(coords[1], coords[3]),
+                   max(coords[0], coords[2]), max(coords[1], coords[3])]
+            shape = draw.ellipse if item.kind == "oval" else draw.rectangle
+            shape(box, fill=self._color(options.get("fill")),
+                  outline=self._color(options.get("outline")) if width else None, width=width)
+        elif item.kind == "line":
+            draw.line(coords, fill=self._color(options.get("fill")), width=max(width, 1))
+        elif item.kind == "polygon":
+            draw.polygon(coords, fill=self._color(options.get("fill")),
+                         outline=self._color(options.get("outline")) if width else None)
+        elif item.kind == "text":
+            color = self._color(options.get("fill"))
+            if color is not None:
+                draw.text((coords[0], coords[1]), str(options.get("text", "")), fill=color,
+                          font=self._font(options.get("font")), anchor="mm", align="center")
@@ -0,0 +1,87 @@
+"""Headless rollback test peer.
+
+Run one process per player, e.g. on localhost::
+
+    python -m src.net --player 1 --port 7001 --peer 127.0.0.1:7002 --loss 0.1 --delay 0.05
+    python -m src.net --player 2 --port 7002 --peer 127.0.0.1:7001 --loss 0.1 --delay 0.05
+
+Each peer drives its player with a simple ball-chasing bot and prints the
+checksum of the state at the final tick; matching checksums mean the two
+simulations stayed in sync.
+"""
+import argparse
+import time
+from ..core.game.loop import FixedTimestep
+from ..core.game.world import World
+from .rollback import RollbackSession
+from .transport import UdpTransport
+
+
+def chase_ball(world, player):
+    """Control state that runs at the ball, jumping and kicking when close"""
+    state = world.player1 if player == 1 else world.player2
+    dx = world.ball.x - state.x
+    movement = "none"
+    if dx > 10:
+        movement = "right"
+    elif dx < -10:
+        movement = "left"
+    close = abs(dx) < 60
+    return {
+        "movement": movement,
+        "jump": "jumping" if close and world.ball.y < state.y - 40 else "ready",
+        "kick": "kicking" if close and world.ball.y > state.y else "ready"
+    }
+
+
+def parse_address(text):
+    """Turn "host:port" into a socket address"""
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Head Soccer rollback test peer")
+    parser.add_argument("--player", type=int, choices=(1, 2), required=True)
+    parser.add_argument("--port", type=int, required=True, help="local UDP port")
+    parser.add_argument("--peer", type=parse_address, required=True, help="peer host:port")
+    parser.add_argument("--ticks", type=int, default=600, help="ticks to play")
+    parser.add_argument("--loss", type=float, default=0.0, help="outgoing packet loss rate")
+    parser.add_argument("--delay", type=float, default=0.0, help="outgoing delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra delay in seconds")
+    parser.add_argument("--input-delay", type=int, default=1, help="local input delay in ticks")
+    parser.add_argument("--seed", type=int, default=None, help="seed for simulated loss")
+    parser.add_argument("--linger", type=float, default=2.0,
+                        help="seconds to keep resending after finishing")
+    args = parser.parse_args()
+
+    transport = UdpTransport(args.port, args.peer, loss=args.loss, delay=args.delay,
+                             jitter=args.jitter, seed=args.seed)
+    session = RollbackSession(World(), args.player, transport, input_delay=args.input_delay)
+    print(f"[INFO] Player {args.player} on port {args.port}, peer {args.peer[0]}:{args.peer[1]}")
+
+    timestep = FixedTimestep()
+    stalls = 0
+    done_at = None
+    try:
+        while True:
+            for _ in range(timestep.advance()):
+                if not session.advance(chase_ball(session.world, args.player)):
+                    stalls += 1
+            if session.checksum(args.ticks) is not None:
+                # Keep sending until the peer has confirmed our inputs too
+                done_at = done_at or time.monotonic()
+                if (session.peer_ack >= args.ticks - 1
+                        or time.monotonic() - done_at > args.linger):
+                    break
+            timestep.wait()
+    finally:
+        transport.close()
+
+    print(f"[INFO] Rollbacks: {session.rollbacks}, resimulated ticks: {session.resimulated}, "
+          f"stalled ticks: {stalls}")
+    print(f"[INFO] Checksum at tick {args.ticks}: {session.checksum(args.ticks):08x}")
+
+
+if __name__ == "__main__":
+    main()
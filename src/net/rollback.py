@@ -0,0 +1,166 @@
+"""Rollback netcode for two-machine play.
+
+Each machine runs the full ``World`` and only exchanges its own player's
+per-tick input. Ticks are simulated immediately with the remote input
+predicted as the last one received; when the real input for an earlier tick
+arrives and differs from the prediction, the world is restored from the
+snapshot of that tick and the ticks since are simulated again.
+
+Packet format (little endian)::
+
+    "HSNP", sender player (uint8), ack (int32), first tick (uint32), count (uint8)
+    followed by ``count`` input bytes (see ``replay.encode_player``)
+
+Every packet repeats all inputs the peer hasn't acknowledged yet, so lost
+packets are covered by the next one and no resend timers are needed.
+"""
+import struct
+import zlib
+from ..core.game.replay import encode_player, decode_player
+
+MAGIC = b"HSNP"
+PACKET = struct.Struct("<4sBiIB")
+MAX_INPUTS_PER_PACKET = 255
+CHECKSUM_HISTORY = 600
+
+
+class RollbackSession:
+    """Keeps a local World in sync with a remote peer"""
+
+    def __init__(self, world, local_player, transport, input_delay=1, max_prediction=20):
+        """Start a session at the world's current tick
+
+        Args:
+            world: World both peers start from
+            local_player: Player controlled on this machine (1 or 2)
+            transport: Object with ``send(bytes)`` and ``receive()`` (e.g. UdpTransport)
+            input_delay: Ticks between reading a local input and applying it;
+                one or two ticks hides most rollbacks on a LAN
+            max_prediction: Ticks the simulation may run ahead of the last
+                confirmed remote input before it waits for the peer
+        """
+        self.world = world
+        self.local_player = local_player
+        self.remote_player = 2 if local_player == 1 else 1
+        self.transport = transport
+        self.input_delay = input_delay
+        self.max_prediction = max_prediction
+
+        start = world.tick
+        self.start_tick = start
+        self.local_inputs = {start + t: 0 for t in range(input_delay)}
+        self.local_last = start + input_delay - 1
+        self.remote_inputs = {}
+        self.predicted = {}    # Remote input each simulated tick was run with
+        self.snapshots = {}    # World state at the start of each unconfirmed tick
+        self.checksums = {}    # CRC32 of the final state at the start of each confirmed tick
+        self.remote_confirmed = start - 1  # Every remote input up to here is known
+        self.last_remote = 0
+        self.peer_ack = start - 1          # Every local input up to here reached the peer
+        self.rollbacks = 0
+        self.resimulated = 0
+
+    def advance(self, local_state):
+        """Run one tick with the local player's control state
+
+        Args:
+            local_state: ``{movement, jump, kick}`` dict from ``Controller.process_input``
+
+        Returns:
+            bool: False if the tick was held back to wait for the peer
+        """
+        self.poll()
+        if self.world.tick - self.remote_confirmed > self.max_prediction:
+            self._send()
+            return False
+
+        self.local_last = self.world.tick + self.input_delay
+        self.local_inputs[self.local_last] = encode_player(local_state)
+        self._send()
+        self._simulate(self.world.tick)
+        self._prune()
+        return True
+
+    def poll(self):
+        """Take in the peer's packets and roll back on a misprediction"""
+        rollback_tick = None
+        for data in self.transport.receive():
+            if len(data) < PACKET.size:
+                continue
+            magic, player, ack, first, count = PACKET.unpack_from(data)
+            if magic != MAGIC or player != self.remote_player:
+                continue
+            self.peer_ack = max(self.peer_ack, ack)
+            codes = data[PACKET.size:PACKET.size + count]
+            for tick, code in enumerate(codes, first):
+                if tick <= self.remote_confirmed or tick in self.remote_inputs:
+                    continue
+                self.remote_inputs[tick] = code
+                if tick < self.world.tick and self.predicted[tick] != code:
+                    if rollback_tick is None or tick < rollback_tick:
+                        rollback_tick = tick
+        while self.remote_confirmed + 1 in self.remote_inputs:
+            self.remote_confirmed += 1
+            self.last_remote = self.remote_inputs[self.remote_confirmed]
+
+        if rollback_tick is not None:
+            self._rollback(rollback_tick)
+
+    def checksum(self, tick):
+        """CRC32 of the confirmed state at the start of ``tick``, or None
+
+        Both peers compute the same value for the same tick unless they have
+        desynced.
+        """
+        return self.checksums.get(tick)
+
+    def _predict(self, tick):
+        """Remote input for a tick: the real one if known, else the last one received"""
+        code = self.remote_inputs.get(tick)
+        return self.last_remote if code is None else code
+
+    def _simulate(self, tick):
+        """Run one tick from the current world state"""
+        remote = self._predict(tick)
+        self.predicted[tick] = remote
+        self.snapshots[tick] = self.world.snapshot()
+        self.world.apply_inputs({
+            self.local_player: decode_player(self.local_inputs[tick]),
+            self.remote_player: decode_player(remote)
+        })
+        self.world.update_physics()
+        if self.world.is_goal:
+            # Kickoff happens inside the tick so both peers see it identically
+            self.world.reset_positions()
+
+    def _rollback(self, tick):
+        """Rewind to the start of ``tick`` and simulate back to the present"""
+        present = self.world.tick
+        self.world.restore(self.snapshots[tick])
+        for t in range(tick, present):
+            self._simulate(t)
+        self.rollbacks += 1
+        self.resimulated += present - tick
+
+    def _send(self):
+        """Send every local input the peer hasn't acknowledged"""
+        first = self.peer_ack + 1
+        last = min(self.local_last, first + MAX_INPUTS_PER_PACKET - 1)
+        if last < first:
+            return
+        codes = bytes(self.local_inputs[t] for t in range(first, last + 1))
+        header = PACKET.pack(MAGIC, self.local_player, self.remote_confirmed, first, len(codes))
+        self.transport.send(header + codes)
+
+    def _prune(self):
+        """Drop history that can no longer be rolled back to or resent"""
+        # A snapshot is final once every remote input before its tick is known
+        for tick in [t for t in self.snapshots if t <= self.remote_confirmed]:
+            self.checksums[tick] = zlib.crc32(self.snapshots.pop(tick))
+            del self.predicted[tick]
+            del self.remote_inputs[tick]
+        while len(self.checksums) > CHECKSUM_HISTORY:
+            del self.checksums[next(iter(self.checksums))]
+        for tick in [t for t in self.local_inputs
+                     if t <= self.peer_ack and t <= self.remote_confirmed]:
+            del self.local_inputs[tick]
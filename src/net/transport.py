@@ -0,0 +1,80 @@
+"""UDP transport with optional simulated packet loss and delay."""
+import heapq
+import random
+import socket
+import time
+
+
+class UdpTransport:
+    """Non-blocking datagram link to a single peer
+
+    Loss, delay and jitter are applied to outgoing packets, so two processes
+    on localhost can be tested under bad network conditions.
+    """
+
+    def __init__(self, local_port, remote_addr, loss=0.0, delay=0.0, jitter=0.0,
+                 seed=None, bind_host=""):
+        """Open the socket
+
+        Args:
+            local_port: UDP port to listen on
+            remote_addr: (host, port) of the peer
+            loss: Probability of dropping an outgoing packet
+            delay: Extra latency added to outgoing packets, in seconds
+            jitter: Random extra latency up to this many seconds
+            seed: Seed for the loss/jitter random generator
+            bind_host: Interface to bind (default: all)
+        """
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((bind_host, local_port))
+        self.sock.setblocking(False)
+        self.remote_addr = remote_addr
+        self.loss = loss
+        self.delay = delay
+        self.jitter = jitter
+        self.rng = random.Random(seed)
+        self.outbox = []  # Heap of (release time, sequence, data)
+        self.sequence = 0
+
+    def send(self, data):
+        """Send a datagram to the peer, subject to the simulated conditions"""
+        if self.loss and self.rng.random() < self.loss:
+            return
+        if self.delay or self.jitter:
+            release = time.monotonic() + self.delay + self.rng.uniform(0, self.jitter)
+            heapq.heappush(self.outbox, (release, self.sequence, data))
+            self.sequence += 1
+        else:
+            self._sendto(data)
+        self._flush()
+
+    def receive(self):
+        """Return all datagrams received since the last call"""
+        self._flush()
+        packets = []
+        while True:
+            try:
+                data, _ = self.sock.recvfrom(2048)
+            except BlockingIOError:
+                break
+            except OSError:
+                # ICMP port unreachable while the peer isn't up yet
+                continue
+            packets.append(data)
+        return packets
+
+    def _flush(self):
+        """Send delayed datagrams that are due"""
+        now = time.monotonic()
+        while self.outbox and self.outbox[0][0] <= now:
+            self._sendto(heapq.heappop(self.outbox)[2])
+
+    def _sendto(self, data):
+        try:
+            self.sock.sendto(data, self.remote_addr)
+        except OSError:
+            pass
+
+    def close(self):
+        """Close the socket"""
+        self.sock.close()
@@ -0,0 +1,330 @@
+"""Reinforcement-learning environments on top of the headless simulation.
+
+``HeadSoccerEnv`` wraps one ``World`` with the usual ``reset()``/``step()``
+API; ``VectorHeadSoccerEnv`` runs many matches in one ``BatchWorld`` and steps
+all of them with a single call. Neither touches Tk or sleeps, so they run as
+fast as the physics allow.
+
+Observations are float32 arrays laid out as ``OBSERVATION_FIELDS``, seen from
+the player's side: player 2 sees and acts on a mirrored field, so both players
+attack to the right and one policy can play either side. Actions are indexes
+into ``ACTIONS``, which are control states in the ``Controller.process_input``
+format; the scalar environment also takes such a dict directly.
+
+An episode ends (``terminated``) when a goal is scored, with a reward of +1
+for the scorer and -1 for the other player, and is cut short (``truncated``)
+after ``max_ticks`` ticks.
+"""
+import random
+from multiprocessing import shared_memory
+import numpy as np
+from ..controllers.base import IDLE
+from ..core.config import x as field_width, physics_substeps
+from ..core.game.batch import BatchWorld, MOVEMENT_CODES
+from ..core.game.world import World
+
+OBSERVATION_FIELDS = (
+    "ball_x", "ball_y", "ball_velx", "ball_vely",
+    "x", "y", "jumping", "kicking",
+    "opponent_x", "opponent_y", "opponent_jumping", "opponent_kicking"
+)
+OBSERVATION_SIZE = len(OBSERVATION_FIELDS)
+
+# Every combination of controls; index 0 is idle
+ACTIONS = tuple(
+    {"movement": movement, "jump": jump, "kick": kick}
+    for movement in ("none", "left", "right")
+    for jump in ("ready", "jumping")
+    for kick in ("ready", "kicking")
+)
+ACTION_MOVEMENT = np.array([MOVEMENT_CODES[action["movement"]] for action in ACTIONS])
+ACTION_JUMP = np.array([action["jump"] == "jumping" for action in ACTIONS])
+ACTION_KICK = np.array([action["kick"] == "kicking" for action in ACTIONS])
+
+MIRRORED_MOVEMENT = {"none": "none", "left": "right", "right": "left"}
+
+
+def observe(world, player, out=None):
+    """Observation of a World from one player's side
+
+    Args:
+        world: World to observe
+        player: Player number (1 or 2) whose side is used
+        out: Optional float32 array of ``OBSERVATION_SIZE`` to fill
+
+    Returns:
+        numpy.ndarray: The observation
+    """
+    if out is None:
+        out = np.empty(OBSERVATION_SIZE, dtype=np.float32)
+    ball = world.ball
+    own, other = (world.player1, world.player2) if player == 1 else (world.player2, world.player1)
+    if player == 1:
+        out[0], out[2] = ball.x, ball.velx
+        out[4], out[8] = own.x, other.x
+    else:
+        out[0], out[2] = field_width - ball.x, -ball.velx
+        out[4], out[8] = field_width - own.x, field_width - other.x
+    out[1], out[3] = ball.y, ball.vely
+    out[5], out[6], out[7] = own.y, own.jumping, own.kicking
+    out[9], out[10], out[11] = other.y, other.jumping, other.kicking
+    return out
+
+
+class HeadSoccerEnv:
+    """One match, played by a learning agent against an opponent controller"""
+
+    def __init__(self, player=1, opponent=None, max_ticks=3600, kickoff_speed=0.0,
+                 substeps=physics_substeps):
+        """Create an environment
+
+        Args:
+            player: Player number (1 or 2) controlled through ``step``
+            opponent: Controller for the other player, e.g. an AIController;
+                it's attached to the environment's world if it can be. The
+                opponent stands still without one
+            max_ticks: Ticks after which an episode is truncated
+            kickoff_speed: Max random ball speed, in pixels per tick, given at
+                every kickoff so episodes don't all start the same
+            substeps: Physics substeps per tick
+        """
+        self.player = player
+        self.opponent = opponent
+        self.max_ticks = max_ticks
+        self.kickoff_speed = kickoff_speed
+        self.world = World(substeps=substeps)
+        self.rng = random.Random()
+        self.side = "left" if player == 1 else "right"
+        self.observation = np.empty(OBSERVATION_SIZE, dtype=np.float32)
+        if opponent is not None and hasattr(opponent, "attach"):
+            opponent.attach(self.world)
+
+    def reset(self, seed=None):
+        """Start a new episode
+
+        Args:
+            seed: Optional seed of the kickoff randomness
+
+        Returns:
+            tuple: (observation, info)
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+        world = self.world
+        world.reset_match()
+        world.tick = 0
+        if self.kickoff_speed:
+            world.ball.velx = self.rng.uniform(-self.kickoff_speed, self.kickoff_speed)
+            world.ball.vely = self.rng.uniform(-self.kickoff_speed, 0)
+        return observe(world, self.player, self.observation).copy(), {}
+
+    def step(self, action):
+        """Advance the match by one tick
+
+        Args:
+            action: Index into ``ACTIONS``, or a control state dict, from the
+                player's side of the field
+
+        Returns:
+            tuple: (observation, reward, terminated, truncated, info)
+        """
+        state = ACTIONS[action] if not isinstance(action, dict) else action
+        if self.player == 2:
+            state = dict(state, movement=MIRRORED_MOVEMENT[state["movement"]])
+        states = dict(self.opponent.process_input()) if self.opponent else {1: dict(IDLE), 2: dict(IDLE)}
+        states[self.player] = state
+
+        world = self.world
+        before = world.score[self.side]
+        world.step(states)
+        reward = 0.0
+        if world.is_goal:
+            reward = 1.0 if world.score[self.side] > before else -1.0
+        terminated = world.is_goal
+        truncated = not terminated and world.tick >= self.max_ticks
+        info = {"score": dict(world.score), "tick": world.tick}
+        return observe(world, self.player, self.observation).copy(), reward, terminated, truncated, info
+
+    def close(self):
+        """Clean up the opponent controller"""
+        if self.opponent is not None:
+            self.opponent.cleanup()
+
+
+class EnvBuffers:
+    """Output arrays of a VectorHeadSoccerEnv, in one block of memory
+
+    The block can be a ``multiprocessing.shared_memory`` segment, so trainer
+    processes read observations and rewards without copies or pickling.
+    """
+
+    def __init__(self, num_envs, shared=False, name=None):
+        """Allocate the buffers, or attach to ones shared by another process
+
+        Args:
+            num_envs: Number of environments
+            shared: Allocate the block in shared memory
+            name: Name of an existing shared block to attach to
+        """
+        layout = (
+            ("observations", (num_envs, 2, OBSERVATION_SIZE), np.float32),
+            ("final_observations", (num_envs, 2, OBSERVATION_SIZE), np.float32),
+            ("rewards", (num_envs, 2), np.float32),
+            ("terminated", (num_envs,), np.bool_),
+            ("truncated", (num_envs,), np.bool_),
+        )
+        size = sum(int(np.prod(shape)) * np.dtype(dtype).itemsize for _, shape, dtype in layout)
+        self.owner = name is None
+        if name is not None:
+            self.shm = shared_memory.SharedMemory(name=name)
+        elif shared:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = None
+        buffer = self.shm.buf if self.shm is not None else bytearray(size)
+        self.names = [field for field, _, _ in layout]
+        offset = 0
+        for field, shape, dtype in layout:
+            array = np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+            setattr(self, field, array)
+            offset += array.nbytes
+
+    @property
+    def name(self):
+        """Name other processes attach with, or None if not shared"""
+        return self.shm.name if self.shm is not None else None
+
+    def close(self):
+        """Release the block; the creator also frees the shared memory
+
+        Arrays taken from the buffers must not be used afterwards.
+        """
+        for field in self.names:
+            setattr(self, field, None)
+        if self.shm is not None:
+            self.shm.close()
+            if self.owner:
+                self.shm.unlink()
+            self.shm = None
+
+
+class VectorHeadSoccerEnv:
+    """Many matches stepped together, for both players at once
+
+    Actions, observations and rewards have one row per match and, where they
+    have a second axis, one column per player. Finished matches are reset in
+    the same ``step`` call; their last observation is kept in
+    ``buffers.final_observations``.
+    """
+
+    def __init__(self, num_envs, max_ticks=3600, kickoff_speed=0.0,
+                 substeps=physics_substeps, shared=False):
+        """Create the environments
+
+        Args:
+            num_envs: Number of matches
+            max_ticks: Ticks after which an episode is truncated
+            kickoff_speed: Max random ball speed given at every kickoff
+            substeps: Physics substeps per tick
+            shared: Keep the output arrays in shared memory (see ``EnvBuffers``)
+        """
+        self.num_envs = num_envs
+        self.max_ticks = max_ticks
+        self.kickoff_speed = kickoff_speed
+        self.batch = BatchWorld(num_envs, substeps=substeps)
+        self.elapsed = np.zeros(num_envs, dtype=np.int64)
+        self.rng = np.random.default_rng()
+        self.buffers = EnvBuffers(num_envs, shared)
+        self._idle = np.zeros(num_envs, dtype=np.int64)
+
+    def reset(self, seed=None):
+        """Start a new episode in every match
+
+        Returns:
+            tuple: ((num_envs, 2, OBSERVATION_SIZE) observations, info)
+        """
+        if seed is not None:
+            self.rng = np.random.default_rng(seed)
+        self.reset_rows(np.ones(self.num_envs, dtype=bool))
+        return self.observe(), {}
+
+    def reset_rows(self, rows):
+        """Start a new episode in the matches of a bool mask"""
+        batch = self.batch
+        batch.reset_match(rows)
+        batch.tick[rows] = 0
+        self.elapsed[rows] = 0
+        if self.kickoff_speed:
+            count = int(np.count_nonzero(rows))
+            speed = self.kickoff_speed
+            batch.ball_velx[rows] = self.rng.uniform(-speed, speed, count)
+            batch.ball_vely[rows] = self.rng.uniform(-speed, 0, count)
+
+    def step(self, actions):
+        """Advance every match by one tick
+
+        Args:
+            actions: (num_envs, 2) indexes into ``ACTIONS``, one per player,
+                or (num_envs,) for player 1 against an idle player 2
+
+        Returns:
+            tuple: (observations, rewards, terminated, truncated, info). The
+                arrays are the environment's buffers, overwritten by the next
+                step
+        """
+        actions = np.asarray(actions)
+        if actions.ndim == 1:
+            actions = np.stack((actions, self._idle), axis=1)
+        movement = ACTION_MOVEMENT[actions]
+        movement[:, 1] = -movement[:, 1]  # Player 2 acts on a mirrored field
+
+        batch = self.batch
+        buffers = self.buffers
+        before = batch.score[:, 0] - batch.score[:, 1]
+        batch.step(movement, ACTION_JUMP[actions], ACTION_KICK[actions])
+        self.elapsed += 1
+
+        scored = batch.score[:, 0] - batch.score[:, 1] - before
+        buffers.rewards[:, 0] = scored
+        buffers.rewards[:, 1] = -scored
+        np.copyto(buffers.terminated, batch.is_goal)
+        np.greater_equal(self.elapsed, self.max_ticks, out=buffers.truncated)
+        buffers.truncated &= ~buffers.terminated
+
+        observations = self.observe()
+        done = buffers.terminated | buffers.truncated
+        if done.any():
+            buffers.final_observations[done] = observations[done]
+            self.reset_rows(done)
+            observations = self.observe()
+        return observations, buffers.rewards, buffers.terminated, buffers.truncated, {"done": done}
+
+    def observe(self):
+        """Write the observations of every match into the buffers and return them"""
+        batch = self.batch
+        out = self.buffers.observations
+        for col, other in ((0, 1), (1, 0)):
+            view = out[:, col]
+            if col == 0:
+                view[:, 0] = batch.ball_x
+                view[:, 2] = batch.ball_velx
+                view[:, 4] = batch.player_x[:, 0]
+                view[:, 8] = batch.player_x[:, 1]
+            else:
+                np.subtract(field_width, batch.ball_x, out=view[:, 0], casting="unsafe")
+                np.negative(batch.ball_velx, out=view[:, 2], casting="unsafe")
+                np.subtract(field_width, batch.player_x[:, 1], out=view[:, 4], casting="unsafe")
+                np.subtract(field_width, batch.player_x[:, 0], out=view[:, 8], casting="unsafe")
+            view[:, 1] = batch.ball_y
+            view[:, 3] = batch.ball_vely
+            view[:, 5] = batch.player_y[:, col]
+            view[:, 6] = batch.jumping[:, col]
+            view[:, 7] = batch.kicking[:, col]
+            view[:, 9] = batch.player_y[:, other]
+            view[:, 10] = batch.jumping[:, other]
+            view[:, 11] = batch.kicking[:, other]
+        return out
+
+    def close(self):
+        """Release the buffers"""
+        self.buffers.close()
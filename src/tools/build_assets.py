@@ -0,0 +1,57 @@
+"""Build the image bundle.
+
+Packs every image the game shows (field, players, ball, intro and
+control-selection screens) into one memory-mappable file::
+
+    python -m src.tools.build_assets
+    python -m src.tools.build_assets --images path/to/images --out images.bundle
+
+Run it again whenever an image changes; the game reads the loose files
+whenever there is no bundle.
+"""
+import argparse
+import os
+import sys
+import time
+from ..graphics.assets import GAMEPLAY_IMAGES, MENU_IMAGES
+from ..graphics.bundle import write_bundle
+from ..graphics.paths import IMAGES_DIR, BUNDLE_PATH
+
+BUNDLED_IMAGES = GAMEPLAY_IMAGES + MENU_IMAGES
+
+
+def build(images_dir=IMAGES_DIR, out_path=BUNDLE_PATH, names=BUNDLED_IMAGES):
+    """Pack the named images of a directory into a bundle
+
+    Returns:
+        dict: The bundle index
+
+    Raises:
+        FileNotFoundError: If an image is missing
+    """
+    paths = {name: os.path.join(images_dir, name) for name in names}
+    missing = [path for path in paths.values() if not os.path.exists(path)]
+    if missing:
+        raise FileNotFoundError(f"Missing images: {', '.join(missing)}")
+    return write_bundle(paths, out_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack the game images into one bundle")
+    parser.add_argument("--images", default=IMAGES_DIR, help="directory of the source images")
+    parser.add_argument("--out", default=BUNDLE_PATH, help="bundle file to write")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        index = build(args.images, args.out)
+    except FileNotFoundError as e:
+        print(f"[ERROR] {e}")
+        sys.exit(1)
+    print(f"[INFO] Packed {len(index['images'])} images into a {index['width']}x{index['height']} "
+          f"atlas, {os.path.getsize(args.out) / 1024:.0f} KiB in {args.out} "
+          f"({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
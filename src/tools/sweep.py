@@ -0,0 +1,241 @@
+"""Physics parameter sweeps.
+
+Evaluates many ``PhysicsParams`` sets on scripted scenarios, spread over the
+CPU cores, and reports how each one plays::
+
+    python -m src.tools.sweep --param gravity=0.3:0.5:5 --param restitution=1.0,1.2
+    python -m src.tools.sweep --param gravity=0.3:0.5 --param kick_force=1.5:2.5 --samples 64
+
+``NAME=a,b,c`` lists values and ``NAME=lo:hi:n`` spreads n values over a
+range; every combination is tried. With ``--samples`` the parameter sets are
+drawn at random from the ranges instead.
+
+Scenarios:
+    Matches between scripted controllers (``--match``, tournament specs)
+    give goals per minute, rally length and crossbar time. Balls dropped
+    onto both crossbars give the share that ends up stuck there.
+
+Metrics:
+    goals_per_minute    Goals per minute of play over every match
+    rally_ticks         Average ticks from kickoff to a goal or the end of a match
+    rally_touches       Average touches per rally
+    crossbar_stuck      Share of match time the ball spends held on a crossbar
+    crossbar_drops      Share of crossbar drops still on the crossbar after
+                        ``DROP_TICKS``
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import random
+import time
+import numpy as np
+from .tournament import make_controller
+from ..controllers.base import IDLE
+from ..core.config import raio, tick_rate, physics_substeps
+from ..core.game.params import PhysicsParams
+from ..core.game.world import World, CROSSBAR_DEPTH
+
+DEFAULT_MATCHES = ("ai:ai", "ai:random", "random:random")
+STUCK_TICKS = 30        # Ticks on a crossbar after which the ball counts as stuck
+DROP_TICKS = 180        # Ticks a crossbar drop is followed for
+DROP_OFFSETS = (-60, -40, -20, 0, 20, 40, 60)
+METRICS = ("goals_per_minute", "rally_ticks", "rally_touches", "crossbar_stuck", "crossbar_drops")
+
+
+def on_crossbar(field, ball_x, ball_y):
+    """Whether a ball is in the zone where it bounces off a crossbar"""
+    for bounds in (field.left_goal_bounds, field.right_goal_bounds):
+        if (bounds['x1'] - raio <= ball_x <= bounds['x2'] + raio and
+                bounds['y1'] - 5 - raio < ball_y <= bounds['y1'] + CROSSBAR_DEPTH):
+            return True
+    return False
+
+
+def play_scenario(params, left, right, ticks, seed, substeps):
+    """Play one scripted match
+
+    Returns:
+        dict: goals, touches, rallies, ticks and crossbar_ticks (ticks the
+            ball sat on a crossbar for at least STUCK_TICKS in a row)
+    """
+    world = World(substeps=substeps, params=params)
+    controllers = {1: make_controller(left, 1, world, seed * 2 + 1),
+                   2: make_controller(right, 2, world, seed * 2 + 2)}
+    states = {1: dict(IDLE), 2: dict(IDLE)}
+    field = world.field
+    ball = world.ball
+    rallies = 1
+    streak = 0
+    crossbar_ticks = 0
+    try:
+        while world.tick < ticks:
+            for player, controller in controllers.items():
+                if controller is not None:
+                    states[player] = controller.process_input()[player]
+            world.step(states)
+            if on_crossbar(field, ball.x, ball.y):
+                streak += 1
+                if streak == STUCK_TICKS:
+                    crossbar_ticks += STUCK_TICKS
+                elif streak > STUCK_TICKS:
+                    crossbar_ticks += 1
+            else:
+                streak = 0
+            if world.is_goal:
+                world.reset_positions()
+                streak = 0
+                if world.tick < ticks:
+                    rallies += 1
+    finally:
+        for controller in controllers.values():
+            if controller is not None:
+                controller.cleanup()
+    return {
+        "goals": world.score["left"] + world.score["right"],
+        "touches": world.touches["left"] + world.touches["right"],
+        "rallies": rallies,
+        "ticks": world.tick,
+        "crossbar_ticks": crossbar_ticks
+    }
+
+
+def crossbar_drops(params, substeps):
+    """Share of balls dropped onto a crossbar that are still on it after DROP_TICKS"""
+    stuck = 0
+    total = 0
+    for side in ("left", "right"):
+        for offset in DROP_OFFSETS:
+            world = World(substeps=substeps, params=params)
+            bounds = getattr(world.field, f"{side}_goal_bounds")
+            centre = (bounds['x1'] + bounds['x2']) / 2
+            world.ball.set_position(centre + offset, bounds['y1'] - 150)
+            # Players out of the way
+            world.player1.set_position(500, 503)
+            world.player2.set_position(700, 503)
+            for _ in range(DROP_TICKS):
+                world.step({})
+                if world.is_goal:
+                    break
+            total += 1
+            stuck += not world.is_goal and on_crossbar(world.field, world.ball.x, world.ball.y)
+    return stuck / total
+
+
+def evaluate(job):
+    """Play every scenario with one parameter set
+
+    Args:
+        job: dict with index, params (changed values), matches
+            ("left:right" specs), ticks, seeds and substeps
+
+    Returns:
+        dict: The job plus the METRICS and wall time
+    """
+    start = time.perf_counter()
+    params = PhysicsParams(**job["params"])
+    totals = {"goals": 0, "touches": 0, "rallies": 0, "ticks": 0, "crossbar_ticks": 0}
+    for match in job["matches"]:
+        left, right = match.split(":", 1)
+        for seed in range(job["seeds"]):
+            result = play_scenario(params, left, right, job["ticks"], seed, job["substeps"])
+            for key, value in result.items():
+                totals[key] += value
+
+    minutes = totals["ticks"] / tick_rate / 60
+    result = dict(job)
+    result.update({
+        "goals_per_minute": round(totals["goals"] / minutes, 3) if minutes else 0.0,
+        "rally_ticks": round(totals["ticks"] / totals["rallies"], 1) if totals["rallies"] else 0.0,
+        "rally_touches": round(totals["touches"] / totals["rallies"], 2) if totals["rallies"] else 0.0,
+        "crossbar_stuck": round(totals["crossbar_ticks"] / totals["ticks"], 4) if totals["ticks"] else 0.0,
+        "crossbar_drops": round(crossbar_drops(params, job["substeps"]), 3),
+        "seconds": round(time.perf_counter() - start, 2)
+    })
+    return result
+
+
+def parse_values(text):
+    """Turn "NAME=a,b,c" or "NAME=lo:hi[:n]" into (name, values, (lo, hi))
+
+    Raises:
+        argparse.ArgumentTypeError: If the text is malformed or the name unknown
+    """
+    name, sep, spec = text.partition("=")
+    if not sep or name not in PhysicsParams.DEFAULTS:
+        raise argparse.ArgumentTypeError(
+            f"expected NAME=VALUES with NAME one of {', '.join(PhysicsParams.DEFAULTS)}")
+    cast = int if isinstance(PhysicsParams.DEFAULTS[name], int) else float
+    try:
+        if ":" in spec:
+            parts = spec.split(":")
+            lo, hi = float(parts[0]), float(parts[1])
+            count = int(parts[2]) if len(parts) > 2 else 3
+            values = [float(value) for value in np.linspace(lo, hi, count)]
+        else:
+            values = [float(value) for value in spec.split(",")]
+    except (ValueError, IndexError):
+        raise argparse.ArgumentTypeError(f"bad values for {name}: {spec}")
+    if cast is int and all(value.is_integer() for value in values):
+        values = [int(value) for value in values]
+    return name, values, (min(values), max(values))
+
+
+def make_param_sets(sweeps, samples=0, seed=0):
+    """Parameter changes to evaluate: the full grid, or ``samples`` random draws"""
+    if not sweeps:
+        return [{}]
+    names = [name for name, _, _ in sweeps]
+    if samples:
+        rng = random.Random(seed)
+        return [{name: round(rng.uniform(lo, hi), 4) for name, _, (lo, hi) in sweeps}
+                for _ in range(samples)]
+    return [dict(zip(names, combination))
+            for combination in itertools.product(*(values for _, values, _ in sweeps))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Head Soccer physics parameter sweep")
+    parser.add_argument("--param", type=parse_values, action="append", default=[],
+                        metavar="NAME=VALUES", help="a,b,c or lo:hi[:n]; repeat for more parameters")
+    parser.add_argument("--samples", type=int, default=0,
+                        help="draw this many random sets from the ranges instead of the grid")
+    parser.add_argument("--match", action="append", metavar="LEFT:RIGHT",
+                        help=f"scripted match to play (default: {' '.join(DEFAULT_MATCHES)})")
+    parser.add_argument("--ticks", type=int, default=3600, help="ticks per match")
+    parser.add_argument("--seeds", type=int, default=2, help="matches per scripted match")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random sets")
+    parser.add_argument("--substeps", type=int, default=physics_substeps, help="physics substeps")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count(),
+                        help="worker processes")
+    parser.add_argument("--sort", choices=METRICS, default="goals_per_minute",
+                        help="metric to order the table by")
+    parser.add_argument("--out", default="sweep.jsonl", help="JSON-lines file for results")
+    args = parser.parse_args()
+
+    param_sets = make_param_sets(args.param, args.samples, args.seed)
+    jobs = [{"index": index, "params": params, "matches": list(args.match or DEFAULT_MATCHES),
+             "ticks": args.ticks, "seeds": args.seeds, "substeps": args.substeps}
+            for index, params in enumerate(param_sets)]
+    print(f"[INFO] Evaluating {len(jobs)} parameter sets on {args.processes} processes")
+
+    start = time.perf_counter()
+    results = []
+    with multiprocessing.Pool(args.processes) as pool, open(args.out, "w") as out:
+        for result in pool.imap_unordered(evaluate, jobs):
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            results.append(result)
+            print(f"[INFO] {len(results)}/{len(jobs)} {result['params']}")
+    print(f"[INFO] Done in {time.perf_counter() - start:.1f}s, results in {args.out}")
+
+    names = [name for name, _, _ in args.param]
+    header = "".join(f"{name:>18s}" for name in names) + "".join(f"{m:>18s}" for m in METRICS)
+    print(header)
+    for result in sorted(results, key=lambda r: -r[args.sort]):
+        print("".join(f"{result['params'][name]:>18}" for name in names)
+              + "".join(f"{result[metric]:>18}" for metric in METRICS))
+
+
+if __name__ == "__main__":
+    main()
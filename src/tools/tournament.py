@@ -0,0 +1,448 @@
+"""Headless self-play tournaments between controllers.
+
+Plays round-robin matches between controller specs on a local process pool,
+streams every match result to a JSON-lines file and prints win rates, goals,
+touches and match lengths::
+
+    python -m src.tools.tournament ai search random --games 200 --out results.jsonl
+
+To spread the matches over several hosts, serve the job queue from one
+machine and start workers anywhere that can reach it::
+
+    python -m src.tools.tournament ai search --games 2000 --serve 0.0.0.0:5000
+    python -m src.tools.tournament --work server-host:5000 --authkey KEY --processes 8
+
+The queue passes pickles, so anyone holding its key can run code on the
+server and the workers. ``--serve`` prints a random key unless one is given,
+binds to localhost unless a host is given, and should only be exposed on
+trusted networks.
+
+A match that raises is recorded as a failed result instead of stopping the
+tournament, and ``--serve`` gives up once no result arrives for ``--timeout``
+seconds; either makes the command exit with an error after the standings.
+
+Controller specs:
+    idle            Stands still
+    random[:P]      Scripted key mashing; P is the chance of changing keys per tick
+    ai              Heuristic AIController
+    search          SearchAIController, searching inline so matches are deterministic
+    replay:PATH     Inputs recorded for the same player in a replay log
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import queue
+import random
+import secrets
+import sys
+import time
+from multiprocessing.managers import BaseManager
+from ..controllers.ai import AIController
+from ..controllers.base import Controller, IDLE
+from ..controllers.search_ai import SearchAIController
+from ..core.config import physics_substeps
+from ..core.game.replay import InputLog
+from ..core.game.world import World
+
+SIDES = {1: "left", 2: "right"}
+
+
+class RandomController(Controller):
+    """Scripted player that holds random keys for random stretches"""
+
+    def __init__(self, player, seed, change=0.1):
+        """Create a random player
+
+        Args:
+            player: Player number it drives
+            seed: Random seed, so the same match can be replayed
+            change: Chance per tick of picking new keys
+        """
+        self.player = player
+        self.rng = random.Random(seed)
+        self.change = change
+        self.state = dict(IDLE)
+
+    def process_input(self):
+        rng = self.rng
+        if rng.random() < self.change:
+            self.state = {
+                "movement": rng.choice(("none", "left", "right")),
+                "jump": "jumping" if rng.random() < 0.3 else "ready",
+                "kick": "kicking" if rng.random() < 0.3 else "ready"
+            }
+        return {self.player: self.state}
+
+    def cleanup(self):
+        pass
+
+
+class LogController(Controller):
+    """Replays one player's inputs from a replay log, then stands still"""
+
+    def __init__(self, player, path):
+        self.player = player
+        self.ticks = iter(InputLog(path))
+
+    def process_input(self):
+        for _, player_states, _ in self.ticks:
+            return {self.player: player_states[self.player]}
+        return {self.player: dict(IDLE)}
+
+    def cleanup(self):
+        pass
+
+
+def make_controller(spec, player, world, seed):
+    """Build the controller described by a spec for one player
+
+    Returns:
+        Controller: Its ``process_input`` holds at least ``player``'s state;
+            None for an idle player
+
+    Raises:
+        ValueError: If the spec is unknown
+    """
+    name, _, arg = spec.partition(":")
+    if name == "idle":
+        return None
+    if name == "random":
+        return RandomController(player, seed, float(arg) if arg else 0.1)
+    if name == "ai":
+        # A generous budget keeps decisions independent of machine load
+        return AIController((player,), world=world, budget=1.0)
+    if name == "search":
+        return SearchAIController((player,), world=world, budget=1.0, worker="inline")
+    if name == "replay":
+        return LogController(player, arg)
+    raise ValueError(f"Unknown controller spec: {spec}")
+
+
+def play_match(job):
+    """Play one headless match
+
+    Args:
+        job: dict with match, left, right (controller specs), ticks, goals,
+            seed and substeps
+
+    Returns:
+        dict: The job plus score, touches, ticks played, winner spec (None
+            for a draw) and wall time
+    """
+    start = time.perf_counter()
+    world = World(substeps=job["substeps"])
+    controllers = {
+        player: make_controller(job[side], player, world, job["seed"] * 2 + player)
+        for player, side in SIDES.items()
+    }
+    states = {1: dict(IDLE), 2: dict(IDLE)}
+    try:
+        while world.tick < job["ticks"]:
+            for player, controller in controllers.items():
+                if controller is not None:
+                    states[player] = controller.process_input()[player]
+            world.step(states)
+            if world.is_goal:
+                world.reset_positions()
+                if job["goals"] and max(world.score.values()) >= job["goals"]:
+                    break
+    finally:
+        for controller in controllers.values():
+            if controller is not None:
+                controller.cleanup()
+
+    left, right = world.score["left"], world.score["right"]
+    result = dict(job)
+    result.update({
+        "score": dict(world.score),
+        "touches": dict(world.touches),
+        "length": world.tick,
+        "winner": job["left"] if left > right else job["right"] if right > left else None,
+        "seconds": round(time.perf_counter() - start, 3)
+    })
+    return result
+
+
+def run_job(job):
+    """Play one match, turning an error into a failed result
+
+    A bad spec or a crashing controller costs its own match only, so the
+    tournament still gets a result for every job.
+
+    Returns:
+        dict: The result of ``play_match``, or the job plus an ``error``
+    """
+    try:
+        return play_match(job)
+    except Exception as e:
+        print(f"[ERROR] Match {job['match']} ({job['left']} vs {job['right']}) failed: {e!r}")
+        return dict(job, error=repr(e))
+
+
+def make_jobs(specs, games, ticks, goals, substeps, seed=0):
+    """Round-robin jobs, ``games`` per pairing, alternating sides"""
+    jobs = []
+    for a, b in itertools.combinations(specs, 2):
+        for game in range(games):
+            left, right = (a, b) if game % 2 == 0 else (b, a)
+            jobs.append({"match": len(jobs), "left": left, "right": right, "ticks": ticks,
+                         "goals": goals, "seed": seed + len(jobs), "substeps": substeps})
+    return jobs
+
+
+class Standings:
+    """Running totals per controller spec"""
+
+    def __init__(self):
+        self.table = {}
+        self.matches = 0
+        self.failed = []  # Results of the matches that raised
+
+    def add(self, result):
+        """Count one match result; failed matches are kept apart"""
+        self.matches += 1
+        if "error" in result:
+            self.failed.append(result)
+            return
+        for side, opponent_side in (("left", "right"), ("right", "left")):
+            spec = result[side]
+            row = self.table.setdefault(spec, {
+                "matches": 0, "wins": 0, "draws": 0, "losses": 0,
+                "goals_for": 0, "goals_against": 0, "touches": 0, "ticks": 0
+            })
+            row["matches"] += 1
+            goals_for = result["score"][side]
+            goals_against = result["score"][opponent_side]
+            if goals_for > goals_against:
+                row["wins"] += 1
+            elif goals_for < goals_against:
+                row["losses"] += 1
+            else:
+                row["draws"] += 1
+            row["goals_for"] += goals_for
+            row["goals_against"] += goals_against
+            row["touches"] += result["touches"][side]
+            row["ticks"] += result["length"]
+
+    def summary(self):
+        """Table with win rates and per-match averages"""
+        summary = {}
+        for spec, row in self.table.items():
+            matches = row["matches"]
+            summary[spec] = dict(row, win_rate=round(row["wins"] / matches, 3),
+                                 touches_per_match=round(row["touches"] / matches, 2),
+                                 average_length=round(row["ticks"] / matches, 1))
+        return summary
+
+    def print(self):
+        print(f"{'controller':16s} {'played':>6s} {'win%':>6s} {'W':>5s} {'D':>5s} {'L':>5s} "
+              f"{'GF':>6s} {'GA':>6s} {'touch/m':>8s} {'ticks/m':>8s}")
+        rows = sorted(self.summary().items(), key=lambda item: -item[1]["win_rate"])
+        for spec, row in rows:
+            print(f"{spec:16s} {row['matches']:6d} {row['win_rate'] * 100:6.1f} {row['wins']:5d} "
+                  f"{row['draws']:5d} {row['losses']:5d} {row['goals_for']:6d} "
+                  f"{row['goals_against']:6d} {row['touches_per_match']:8.2f} "
+                  f"{row['average_length']:8.1f}")
+        for result in self.failed:
+            print(f"[ERROR] Match {result['match']} ({result['left']} vs {result['right']}) "
+                  f"failed: {result['error']}")
+
+
+def collect(results, total, out_path):
+    """Stream results to a JSON-lines file as they arrive
+
+    Args:
+        results: Iterable of match results; it may end early if results
+            stop arriving
+        total: Number of results expected
+        out_path: File to write
+
+    Returns:
+        Standings: Totals of all results, failed matches included
+    """
+    standings = Standings()
+    with open(out_path, "w") as out:
+        for result in results:
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+            standings.add(result)
+            if standings.matches % 50 == 0 or standings.matches == total:
+                print(f"[INFO] {standings.matches}/{total} matches played")
+            if standings.matches == total:
+                break
+    return standings
+
+
+def run_local(jobs, processes, out_path):
+    """Play the jobs on a local process pool"""
+    with multiprocessing.Pool(processes) as pool:
+        return collect(pool.imap_unordered(run_job, jobs), len(jobs), out_path)
+
+
+# ----------------------------------------------------------------------
+# Job queue over a socket, for workers on other processes or hosts
+# ----------------------------------------------------------------------
+
+RESULT_TIMEOUT = 600  # Seconds without any result before the server gives up on its workers
+
+# Queues of a served tournament, living in the manager's server process
+_job_queue = queue.Queue()
+_result_queue = queue.Queue()
+
+
+class QueueManager(BaseManager):
+    """Serves the job and result queues"""
+
+
+def _get_jobs():
+    return _job_queue
+
+
+def _get_results():
+    return _result_queue
+
+
+def parse_address(text):
+    """Turn "host:port" into a socket address; without a host, localhost"""
+    host, _, port = text.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def serve(jobs, address, authkey, out_path, timeout=RESULT_TIMEOUT):
+    """Offer the jobs on a socket queue and collect the workers' results
+
+    Args:
+        jobs: Jobs from ``make_jobs``
+        address: (host, port) to listen on
+        authkey: Shared secret of the queue
+        out_path: JSON-lines file for the results
+        timeout: Seconds to wait for the next result; after that the
+            remaining matches are given up, e.g. because every worker died
+
+    Returns:
+        Standings: Totals of the results received, which fall short of
+            ``len(jobs)`` if the server gave up
+    """
+    QueueManager.register("get_jobs", callable=_get_jobs)
+    QueueManager.register("get_results", callable=_get_results)
+    manager = QueueManager(address=address, authkey=authkey)
+    manager.start()
+    print(f"[INFO] Serving {len(jobs)} matches on {address[0]}:{address[1]}")
+    try:
+        job_queue = manager.get_jobs()
+        result_queue = manager.get_results()
+        for job in jobs:
+            job_queue.put(job)
+        job_queue.put(None)  # Passed on from worker to worker once the jobs run out
+
+        def results():
+            while True:
+                try:
+                    yield result_queue.get(timeout=timeout)
+                except queue.Empty:
+                    print(f"[ERROR] No result for {timeout}s, giving up on the remaining matches")
+                    return
+
+        return collect(results(), len(jobs), out_path)
+    finally:
+        manager.shutdown()
+
+
+def _queue_worker(address, authkey):
+    """Play jobs from a served queue until it runs out"""
+    QueueManager.register("get_jobs")
+    QueueManager.register("get_results")
+    manager = QueueManager(address=address, authkey=authkey)
+    try:
+        manager.connect()
+    except (OSError, multiprocessing.AuthenticationError) as e:
+        print(f"[ERROR] Could not join {address[0]}:{address[1]}: {e!r}")
+        sys.exit(1)
+    jobs = manager.get_jobs()
+    results = manager.get_results()
+    while True:
+        try:
+            job = jobs.get()
+        except (EOFError, ConnectionError):
+            break  # The server has every result and shut down
+        if job is None:
+            jobs.put(None)
+            break
+        results.put(run_job(job))
+
+
+def work(address, authkey, processes):
+    """Run worker processes that take jobs from a served queue"""
+    print(f"[INFO] Working for {address[0]}:{address[1]} with {processes} processes")
+    workers = [multiprocessing.Process(target=_queue_worker, args=(address, authkey))
+               for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    failed = [worker for worker in workers if worker.exitcode != 0]
+    if failed:
+        print(f"[ERROR] {len(failed)} of {len(workers)} workers failed "
+              f"(exit codes {', '.join(str(worker.exitcode) for worker in failed)})")
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Head Soccer self-play tournament")
+    parser.add_argument("specs", nargs="*", help="controller specs to play round-robin")
+    parser.add_argument("--games", type=int, default=100, help="matches per pairing")
+    parser.add_argument("--ticks", type=int, default=3600, help="max ticks per match")
+    parser.add_argument("--goals", type=int, default=0, help="end a match at this many goals")
+    parser.add_argument("--substeps", type=int, default=physics_substeps, help="physics substeps")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first match")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count(),
+                        help="local worker processes")
+    parser.add_argument("--out", default="tournament.jsonl", help="JSON-lines file for results")
+    parser.add_argument("--summary", metavar="PATH", help="also write the standings as JSON")
+    parser.add_argument("--serve", type=parse_address, metavar="[HOST:]PORT",
+                        help="offer the matches to remote workers instead of playing them "
+                             "(on localhost unless HOST is given)")
+    parser.add_argument("--timeout", type=float, default=RESULT_TIMEOUT,
+                        help="seconds --serve waits for a result before giving up on its workers")
+    parser.add_argument("--work", type=parse_address, metavar="HOST:PORT",
+                        help="play matches from a served queue")
+    parser.add_argument("--authkey",
+                        help="shared secret of the job queue; required with --work, "
+                             "generated and printed by --serve if not given")
+    args = parser.parse_args()
+
+    # The queue exchanges pickles, so whoever knows the key can run code on
+    # the server and the workers: never fall back to a well-known key
+    if args.work:
+        if not args.authkey:
+            parser.error("--work needs the --authkey printed by the server")
+        work(args.work, args.authkey.encode(), args.processes)
+        return
+    if args.serve and not args.authkey:
+        args.authkey = secrets.token_urlsafe(16)
+        print(f"[INFO] Job queue key: {args.authkey} (pass it to the workers with --authkey)")
+    if len(args.specs) < 2:
+        parser.error("need at least two controller specs")
+
+    jobs = make_jobs(args.specs, args.games, args.ticks, args.goals, args.substeps, args.seed)
+    start = time.perf_counter()
+    if args.serve:
+        standings = serve(jobs, args.serve, args.authkey.encode(), args.out, args.timeout)
+    else:
+        standings = run_local(jobs, args.processes, args.out)
+    elapsed = time.perf_counter() - start
+
+    print(f"[INFO] {standings.matches} matches in {elapsed:.1f}s, results in {args.out}")
+    standings.print()
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(standings.summary(), f, indent=2)
+    if standings.matches < len(jobs):
+        print(f"[ERROR] {len(jobs) - standings.matches} matches never reported a result")
+    if standings.failed or standings.matches < len(jobs):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
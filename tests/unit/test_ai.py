@@ -0,0 +1,67 @@
+"""Unit tests for the AI opponent controller."""
+
+from src.controllers.ai import AIController
+from src.controllers.base import Controller, IDLE
+from src.core.game.world import World
+
+class FixedController(Controller):
+    """Always returns the same control state."""
+
+    def __init__(self, states):
+        self.states = states
+
+    def process_input(self):
+        return self.states
+
+    def cleanup(self):
+        pass
+
+def play(world, controller, ticks):
+    """Run a headless match, resetting after goals."""
+    for _ in range(ticks):
+        world.step(controller.process_input())
+        if world.is_goal:
+            world.reset_positions()
+
+def test_ai_scores_against_idle_player():
+    """The AI finds the ball and puts it in the opponent's goal."""
+    world = World()
+    play(world, AIController(players=(2,), world=world), 1200)
+    assert world.score["right"] > 0
+    assert world.score["left"] == 0
+
+def test_base_controller_drives_other_player():
+    """Players not driven by the AI get the base controller's input."""
+    human = {"movement": "left", "jump": "ready", "kick": "ready"}
+    ai = AIController(players=(2,), base=FixedController({1: human, 2: IDLE}), world=World())
+    states = ai.process_input()
+    assert states[1] == human
+    assert set(states[2]) == {"movement", "jump", "kick"}
+
+def test_zero_budget_still_decides():
+    """Without time to predict, the AI still chases the ball."""
+    world = World()
+    ai = AIController(players=(1,), budget=0, world=world)
+    assert ai.process_input()[1]["movement"] == "right"
+    assert ai.predictor.misses == 0
+
+def test_unattached_ai_is_idle():
+    """Before it gets a world the AI stands still."""
+    assert AIController(players=(1, 2)).process_input() == {1: IDLE, 2: IDLE}
+
+def test_idle_states_are_copies():
+    """Callers may change the returned states without touching IDLE."""
+    states = AIController(players=(1, 2)).process_input()
+    states[1]["movement"] = "left"
+    assert IDLE["movement"] == "none"
+
+def test_earlier_states_are_not_changed_later():
+    """Each tick hands out new state dicts, so kept states stay as they were."""
+    world = World()
+    ai = AIController(players=(1,), world=world)
+    first = ai.process_input()
+    kept = dict(first[1])
+    for _ in range(60):
+        world.step(ai.process_input())
+    assert first[1] == kept
+    assert ai.process_input()[1] is not ai.process_input()[1]
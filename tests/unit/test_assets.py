@@ -0,0 +1,122 @@
+"""Unit tests for the shared asset manager."""
+
+import os
+from src.graphics.assets import AssetManager, DerivedCache, GAMEPLAY_IMAGES
+
+class FakeImage:
+    """Stands in for a decoded image of a fixed size."""
+    def __init__(self, path):
+        self.path = path
+
+    def width(self):
+        return 10
+
+    def height(self):
+        return 5
+
+def counting_loader(loads):
+    def load(path):
+        loads.append(path)
+        return FakeImage(path)
+    return load
+
+def test_images_are_decoded_once_and_shared():
+    """Every caller gets the same decoded image from a single load."""
+    loads = []
+    manager = AssetManager("/images", loader=counting_loader(loads))
+    first = manager.get("ball.gif")
+    assert manager.get("ball.gif") is first
+    assert loads == ["/images/ball.gif"]
+
+def test_menu_images_are_evicted_least_recently_used():
+    """Only menu_cache_size menu images stay cached; gameplay ones are pinned."""
+    loads = []
+    manager = AssetManager("/images", menu_cache_size=2, loader=counting_loader(loads))
+    manager.get("ball.gif")
+    manager.get("a.gif")
+    manager.get("b.gif")
+    manager.get("a.gif")        # b.gif is now the least recently used
+    manager.get("c.gif")
+    assert list(manager.menu) == ["a.gif", "c.gif"]
+    assert "ball.gif" in manager.pinned
+    manager.get("b.gif")
+    assert loads.count("/images/b.gif") == 2
+
+def test_preload_step_loads_one_gameplay_image_at_a_time():
+    """The intro can spread gameplay decoding over its idle frames."""
+    loads = []
+    manager = AssetManager("/images", loader=counting_loader(loads))
+    manager.get("ball.gif")
+    steps = 0
+    while manager.preload_step():
+        steps += 1
+    assert steps == len(GAMEPLAY_IMAGES) - 1
+    assert sorted(manager.pinned) == sorted(GAMEPLAY_IMAGES)
+    assert len(loads) == len(GAMEPLAY_IMAGES)
+
+def test_failed_preload_does_not_stop_the_rest():
+    """A missing file is reported and the other images still load."""
+    def loader(path):
+        if path.endswith("bg.gif"):
+            raise OSError("missing")
+        return FakeImage(path)
+    manager = AssetManager("/images", loader=loader)
+    manager.preload()
+    assert "bg.gif" not in manager.pinned
+    assert len(manager.pinned) == len(GAMEPLAY_IMAGES) - 1
+
+def test_memory_is_reported_per_asset():
+    """Decoded sizes are width * height * 4 bytes."""
+    manager = AssetManager("/images", loader=FakeImage)
+    manager.get("ball.gif")
+    manager.get("intro2.gif")
+    assert manager.memory() == {"ball.gif": 200, "intro2.gif": 200}
+    manager.release("intro2.gif")
+    assert manager.memory() == {"ball.gif": 200}
+
+def write_source(path, color=(200, 30, 30), size=(40, 20)):
+    from PIL import Image as PILImage
+    PILImage.new("RGB", size, color).save(path, format="GIF")
+    return str(path)
+
+def test_cover_scales_to_cover_and_is_computed_once(tmp_path):
+    """The scaled copy covers the target and later visits reuse it."""
+    source = write_source(tmp_path / "bg.gif")
+    cache = DerivedCache()
+    picture = cache.cover(source, (100, 100))
+    assert picture.size == (200, 100)
+    assert cache.cover(source, (100, 100)) is picture
+    assert cache.cover(source, (80, 40)).size == (80, 40)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["bg.gif"]
+
+def test_cover_is_keyed_by_source_content(tmp_path):
+    """Changing the source file gives a new derived image."""
+    source = write_source(tmp_path / "bg.gif")
+    cache = DerivedCache()
+    red = cache.cover(source, (40, 20))
+    os.utime(source, ns=(0, 0))
+    write_source(tmp_path / "bg.gif", color=(0, 0, 255))
+    blue = cache.cover(source, (40, 20))
+    assert blue is not red
+    assert blue.convert("RGB").getpixel((5, 5)) == (0, 0, 255)
+
+def test_cover_is_persisted_to_the_cache_dir(tmp_path):
+    """A new run loads the saved copy instead of resizing again."""
+    source = write_source(tmp_path / "bg.gif")
+    cache_dir = tmp_path / "cache"
+    first = DerivedCache(str(cache_dir)).cover(source, (100, 100))
+    saved = list(cache_dir.iterdir())
+    assert len(saved) == 1 and saved[0].suffix == ".png"
+    second = DerivedCache(str(cache_dir)).cover(source, (100, 100))
+    assert second.size == first.size
+    assert second.convert("RGB").tobytes() == first.convert("RGB").tobytes()
+
+def test_manager_cover_is_cached_with_menu_images(tmp_path):
+    """Repeat visits get the converted image straight from the LRU cache."""
+    write_source(tmp_path / "bg.gif")
+    conversions = []
+    manager = AssetManager(str(tmp_path), loader=FakeImage,
+                           converter=lambda picture: conversions.append(picture) or picture)
+    first = manager.cover("bg.gif", (100, 100))
+    assert manager.cover("bg.gif", (100, 100)) is first
+    assert len(conversions) == 1
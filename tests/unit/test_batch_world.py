@@ -0,0 +1,77 @@
+"""Golden-master test of the batch simulator against the scalar world."""
+
+import numpy as np
+from src.core.game.batch import BatchWorld, decode_inputs
+from src.core.game.params import PhysicsParams
+from src.core.game.world import World
+
+def random_inputs(rng, batch):
+    """Random controls biased towards chasing the ball, so contacts happen."""
+    chase = np.sign(batch.ball_x[:, None] - batch.player_x).astype(int)
+    movement = np.where(rng.random((batch.n, 2)) < 0.7, chase,
+                        rng.integers(-1, 2, (batch.n, 2)))
+    jump = rng.random((batch.n, 2)) < 0.08
+    kick = rng.random((batch.n, 2)) < 0.15
+    return movement, jump, kick
+
+def assert_same_state(batch, row, world):
+    """Compare one batch row against a scalar world, field by field."""
+    expected = batch.to_world(row)
+    assert (world.ball.x, world.ball.y, world.ball.velx, world.ball.vely) == \
+        (expected.ball.x, expected.ball.y, expected.ball.velx, expected.ball.vely)
+    for player, other in ((world.player1, expected.player1), (world.player2, expected.player2)):
+        for attr in player.__slots__:
+            assert getattr(player, attr) == getattr(other, attr), attr
+    assert world.score == expected.score
+    assert world.is_goal == expected.is_goal
+    assert world.tick == expected.tick
+
+def run_golden_master(substeps, ticks, params=None):
+    """Step a batch and scalar worlds side by side and compare every tick."""
+    rng = np.random.default_rng(1234)
+    n = 64
+    batch = BatchWorld(n, substeps=substeps, params=params)
+    worlds = [World(substeps=substeps, params=params) for _ in range(n)]
+    goals = 0
+
+    for _ in range(ticks):
+        movement, jump, kick = random_inputs(rng, batch)
+        batch.step(movement, jump, kick)
+        for row, world in enumerate(worlds):
+            world.step(decode_inputs(movement[row], jump[row], kick[row]))
+
+        for row, world in enumerate(worlds):
+            assert_same_state(batch, row, world)
+
+        goals += int(batch.is_goal.sum())
+        for world in worlds:
+            if world.is_goal:
+                world.reset_positions()
+        batch.reset_positions(batch.is_goal)
+
+    # The scenario has to exercise goals as well as collisions
+    assert goals > 0
+
+def test_batch_matches_scalar_world():
+    """Every batch row reproduces a scalar World fed the same inputs."""
+    run_golden_master(substeps=1, ticks=1500)
+
+def test_batch_matches_scalar_world_with_substeps():
+    """The match also holds when physics runs at 180 Hz."""
+    run_golden_master(substeps=3, ticks=500)
+
+def test_load_world_round_trip():
+    """A scalar state loaded into the batch comes back unchanged."""
+    world = World()
+    for _ in range(30):
+        world.step({1: {"movement": "right", "jump": "jumping", "kick": "kicking"},
+                    2: {"movement": "left", "jump": "ready", "kick": "ready"}})
+    batch = BatchWorld(3)
+    batch.load_world(world)
+    assert_same_state(batch, 2, world)
+
+def test_batch_matches_scalar_world_with_tuned_params():
+    """Both simulators follow the same non-default physics parameters."""
+    params = PhysicsParams(gravity=0.55, restitution=0.9, kick_force=2.2, touch_force=6,
+                           header_vely=-10, friction=0.5, move_speed=8, bounce_max=0.7)
+    run_golden_master(substeps=1, ticks=600, params=params)
@@ -0,0 +1,16 @@
+"""Smoke test for the physics benchmark suite."""
+
+import json
+from benchmarks.physics import run_all, SCENARIOS, KERNELS
+from src.core.game.world import BallState
+
+def test_suite_reports_every_scenario_and_kernel():
+    """A short run fills in every field and serializes to JSON."""
+    original = BallState.apply_physics
+    results = json.loads(json.dumps(run_all(ticks=50, repeats=1)))
+    assert set(results["scenarios"]) == set(SCENARIOS)
+    for entry in results["scenarios"].values():
+        assert entry["ns_per_tick"] > 0 and entry["ticks_per_sec"] > 0
+        assert set(entry["kernels"]) == set(KERNELS)
+    # The timing wrappers are removed afterwards
+    assert BallState.apply_physics is original
@@ -0,0 +1,76 @@
+"""Unit tests for the precompiled image bundle."""
+
+import numpy as np
+from PIL import Image as PILImage
+from src.graphics.assets import AssetManager, DerivedCache
+from src.graphics.bundle import AssetBundle, open_bundle, pack_shelves
+from src.tools.build_assets import build
+
+SIZES = {"bg.gif": (120, 60), "ball.gif": (12, 12), "LeftChar.gif": (30, 45),
+         "intro2.gif": (80, 60)}
+
+def make_images(directory):
+    """Write GIFs of different sizes and colours, with a transparent corner."""
+    rng = np.random.default_rng(0)
+    for name, (w, h) in SIZES.items():
+        pixels = rng.integers(0, 200, (h, w, 3), dtype=np.uint8)
+        picture = PILImage.fromarray(pixels).quantize(255)
+        picture.putpixel((0, 0), 255)
+        picture.save(directory / name, transparency=255)
+
+def test_bundle_round_trips_every_image(tmp_path):
+    """Each image sliced from the mapped atlas equals its source file."""
+    make_images(tmp_path)
+    out = str(tmp_path / "images.bundle")
+    build(str(tmp_path), out, tuple(SIZES))
+    bundle = AssetBundle(out)
+    assert sorted(bundle.names()) == sorted(SIZES)
+    for name, size in SIZES.items():
+        expected = np.asarray(PILImage.open(tmp_path / name).convert("RGBA"))
+        assert bundle.size(name) == size
+        assert np.array_equal(bundle.array(name), expected)
+        assert np.array_equal(np.asarray(bundle.picture(name)), expected)
+        assert bundle.array(name)[0, 0, 3] == 0
+
+def test_shelves_do_not_overlap():
+    """Packed rectangles stay inside the atlas and apart from each other."""
+    sizes = {f"i{n}": (10 + n * 7 % 50, 5 + n * 11 % 40) for n in range(40)}
+    positions, height = pack_shelves(sizes, 128)
+    covered = np.zeros((height, 128), dtype=int)
+    for name, (x, y) in positions.items():
+        w, h = sizes[name]
+        covered[y:y + h, x:x + w] += 1
+    assert covered.max() == 1
+    assert covered.sum() == sum(w * h for w, h in sizes.values())
+
+def test_manager_prefers_the_bundle(tmp_path):
+    """Bundled images never touch the file loader."""
+    make_images(tmp_path)
+    out = str(tmp_path / "images.bundle")
+    build(str(tmp_path), out, tuple(SIZES))
+    loads = []
+    manager = AssetManager(str(tmp_path), loader=loads.append, converter=lambda picture: picture,
+                           derived=DerivedCache(), bundle=open_bundle(out))
+    assert manager.get("ball.gif").size == SIZES["ball.gif"]
+    assert manager.cover("intro2.gif", (160, 100)).size == (160, 120)
+    assert loads == []
+
+def test_bundled_images_need_no_loose_files(tmp_path):
+    """An install shipping only the bundle still has every bundled image."""
+    make_images(tmp_path)
+    out = str(tmp_path / "images.bundle")
+    build(str(tmp_path), out, tuple(SIZES))
+    for name in SIZES:
+        (tmp_path / name).unlink()
+    manager = AssetManager(str(tmp_path), converter=lambda picture: picture,
+                           derived=DerivedCache(), bundle=open_bundle(out))
+    assert manager.has("intro2.gif")
+    assert not manager.has("missing.gif")
+    assert manager.cover("intro2.gif", (160, 100)).size == (160, 120)
+
+def test_unusable_bundles_are_ignored(tmp_path):
+    """A missing or foreign file means reading the loose images."""
+    assert open_bundle(str(tmp_path / "missing.bundle")) is None
+    junk = tmp_path / "junk.bundle"
+    junk.write_bytes(b"not a bundle at all")
+    assert open_bundle(str(junk)) is None
@@ -0,0 +1,56 @@
+"""Unit tests for the collision system."""
+
+import random
+from src.core.game.collision import CollisionSystem, Body, BALL, POST, HEAD
+from src.core.game.world import World, BallState, PlayerState
+
+def random_scene(rng, players=4, balls=40):
+    """Players and balls scattered over the field."""
+    return ([PlayerState(rng.uniform(50, 1150), 503, rng.random() < 0.5) for _ in range(players)],
+            [BallState(rng.uniform(0, 1200), rng.uniform(300, 540)) for _ in range(balls)])
+
+def test_grid_matches_all_pairs():
+    """The grid broadphase finds exactly the contacts of the all-pairs test."""
+    rng = random.Random(3)
+    world = World()
+    for _ in range(20):
+        players, balls = random_scene(rng)
+        bodies = []
+        for player in players:
+            bodies.append(Body(HEAD, player, *player.head_position, radius=25))
+        bodies.extend(world.posts)
+        bodies.extend(Body(BALL, ball, ball.x, ball.y, radius=15) for ball in balls)
+
+        grid = CollisionSystem(grid_min_bodies=0).find_contacts(bodies)
+        brute = CollisionSystem(grid_min_bodies=10**9).find_contacts(bodies)
+        key = lambda pair: sorted((id(pair[0]), id(pair[1])))
+        assert sorted(map(key, grid)) == sorted(map(key, brute))
+
+def test_balls_bounce_off_each_other():
+    """Two balls meeting head-on exchange velocities and separate."""
+    world = World()
+    a = world.ball
+    a.x, a.y, a.velx, a.vely = 500, 300, 4, 0
+    b = world.add_ball(525, 300)
+    b.velx = -4
+    world.handle_collisions()
+    assert (a.velx, b.velx) == (-4, 4)
+    assert b.x - a.x >= 30
+
+def test_extra_player_heads_the_ball():
+    """Players added for 2v2 take part in collisions and inputs."""
+    world = World()
+    teammate = world.add_player(600, 503, True)
+    world.ball.x, world.ball.y = teammate.head_position[0] + 10, teammate.head_position[1] - 30
+    world.apply_inputs({3: {"movement": "none", "jump": "ready", "kick": "ready"}})
+    world.handle_collisions()
+    assert (world.ball.velx, world.ball.vely) == (5, -8)
+
+def test_posts_are_sensors():
+    """A ball on the crossbar is reported but not moved by the collision system."""
+    world = World()
+    bar = world.posts[0]
+    world.ball.x, world.ball.y = bar.x, bar.y
+    contacts = world.collisions.step(world.players, world.balls, world.posts)
+    assert any(POST in (a.kind, b.kind) for a, b in contacts)
+    assert (world.ball.x, world.ball.y) == (bar.x, bar.y)
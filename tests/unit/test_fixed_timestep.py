@@ -0,0 +1,41 @@
+"""Unit tests for the fixed-timestep scheduler."""
+
+from src.core.game.loop import FixedTimestep
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_ticks_follow_elapsed_time():
+    """Slow and fast frames run the same number of ticks overall."""
+    clock = FakeClock()
+    timestep = FixedTimestep(rate=60, max_catchup=5, clock=clock)
+    total = 0
+    for frame_time in [0.005, 0.030, 0.010, 0.045, 0.015]:
+        clock.now += frame_time
+        total += timestep.advance()
+    # 0.105 s at 60 Hz
+    assert total == 6
+    assert 0.0 <= timestep.alpha < 1.0
+
+def test_alpha_is_fraction_of_pending_tick():
+    """The leftover time gives the render interpolation factor."""
+    clock = FakeClock()
+    timestep = FixedTimestep(rate=50, clock=clock)
+    clock.now += 0.03
+    assert timestep.advance() == 1
+    assert abs(timestep.alpha - 0.5) < 1e-9
+
+def test_catchup_is_capped():
+    """A long stall runs at most max_catchup ticks and drops the rest."""
+    clock = FakeClock()
+    timestep = FixedTimestep(rate=60, max_catchup=5, clock=clock)
+    clock.now += 2.0
+    assert timestep.advance() == 5
+    assert timestep.alpha == 0.0
+    clock.now += 0.02
+    assert timestep.advance() == 1
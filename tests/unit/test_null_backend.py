@@ -0,0 +1,79 @@
+"""Unit tests for headless rendering with the null backend."""
+
+import pytest
+from src.core.game.ball import Ball
+from src.core.game.field import Field
+from src.core.game.player import Player
+from src.graphics import graphics
+from src.graphics.assets import assets
+from src.graphics.graphics import Point, Text
+from src.graphics.null import NullWin, NullImage, use_null_images
+
+@pytest.fixture
+def null_images():
+    """Give the shared asset manager placeholder images for one test."""
+    loader, converter = assets.loader, assets.converter
+    use_null_images()
+    yield assets
+    assets.use(loader, converter)
+
+def test_importing_the_game_objects_does_not_start_tk():
+    """The Tk root is only created when a window or Tk image needs it."""
+    assert graphics._root is None
+
+def test_game_objects_draw_on_the_null_backend(null_images):
+    """Field, players and ball draw their sprites without a display."""
+    win = NullWin(1200, 600)
+    Field(1200, 600, win)
+    Player(300, 503, True, win)
+    Player(900, 503, False, win)
+    Ball(600, 100, win)
+    assert win.counts["create_image"] == 6
+    images = [item.options["image"] for item in win.items.values()]
+    assert all(isinstance(image, NullImage) for image in images)
+    assert images[-1].name.endswith("ball.gif")
+
+def test_entities_move_with_one_call_per_frame(null_images):
+    """A moving player or ball is a single tag move; still ones cost nothing."""
+    win = NullWin(1200, 600)
+    player = Player(300, 503, True, win)
+    ball = Ball(600, 100, win)
+    win.reset_counts()
+
+    player.state.move(10, 0)
+    ball.state.set_position(620, 150)
+    player.render(1.0)
+    ball.render(1.0)
+    assert win.counts == {"move": 2}
+    assert [call[1] for call in win.calls] == [player.entity.tag, ball.entity.tag]
+    assert win.coords(ball.sprite.id) == [620.0, 150.0]
+
+    win.reset_counts()
+    player.render(1.0)
+    ball.render(1.0)
+    assert not win.counts
+
+def test_kick_frames_swap_the_image_in_place(null_images):
+    """Animation frames are an option change on the same item."""
+    win = NullWin(1200, 600)
+    player = Player(300, 503, True, win)
+    sprite_id = player.sprite.id
+    win.reset_counts()
+    player.state.start_kick()
+    player.state.update_kick()
+    player.render(1.0)
+    assert win.counts["itemconfig"] == 1
+    assert "create_image" not in win.counts and "delete" not in win.counts
+    (_, item, options), = [call for call in win.calls if call[0] == "itemconfig"]
+    assert item == sprite_id and options["image"].name.endswith("LeftChar_kick1.gif")
+
+def test_unchanged_text_is_not_sent_again():
+    """setText with the current text makes no backend call."""
+    win = NullWin()
+    score = Text(Point(10, 10), "0")
+    score.draw(win)
+    win.reset_counts()
+    score.setText("0")
+    assert not win.counts
+    score.setText("1")
+    assert win.counts["itemconfig"] == 1
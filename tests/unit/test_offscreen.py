@@ -0,0 +1,104 @@
+"""Unit tests for the off-screen rendering backend."""
+
+import numpy as np
+import pytest
+from PIL import Image as PILImage
+from src.graphics.offscreen import OffscreenWin
+
+def sprite(color, size=(10, 10)):
+    return PILImage.new("RGBA", size, color)
+
+def test_images_are_composited_centred_with_alpha():
+    """Images sit centred on their point; transparent pixels show what's below."""
+    win = OffscreenWin(100, 50, background="black")
+    win.create_image(50, 25, image=sprite((0, 128, 0, 255), (100, 50)))
+    ball = np.zeros((10, 10, 4), dtype=np.uint8)
+    ball[2:8, 2:8] = (255, 255, 255, 255)
+    win.create_image(20, 20, image=ball)
+    frame = win.render()
+    assert frame.shape == (50, 100, 3)
+    assert frame[20, 20].tolist() == [255, 255, 255]
+    assert frame[15, 15].tolist() == [0, 128, 0]     # Transparent corner
+    assert frame[40, 80].tolist() == [0, 128, 0]
+
+def test_tagged_items_move_together():
+    """Moving a tag moves every item carrying it."""
+    win = OffscreenWin(100, 100)
+    head = win.create_oval(10, 10, 20, 20, {"fill": "red", "outline": ""})
+    body = win.create_image(15, 30, image=sprite((0, 0, 255, 255)))
+    win.addtag_withtag("player", head)
+    win.addtag_withtag("player", body)
+    win.move("player", 50, 5)
+    frame = win.render()
+    assert frame[20, 65].tolist() == [255, 0, 0]
+    assert frame[35, 65].tolist() == [0, 0, 255]
+    assert frame[15, 15].tolist() == [0, 0, 0]
+
+def test_unchanged_leading_items_are_composited_once():
+    """The static layer is reused while only later items change."""
+    win = OffscreenWin(60, 60)
+    win.create_rectangle(0, 0, 60, 60, {"fill": "green", "width": 0})
+    ball = win.create_image(10, 10, image=sprite((255, 255, 255, 255)))
+    win.move(ball, 5, 0)
+    win.render()
+    static = win.static
+    for _ in range(3):
+        win.move(ball, 5, 0)
+        win.render()
+    assert win.static is static
+    win.itemconfig(1, fill="blue")
+    frame = win.render()
+    assert win.static is not static
+    assert frame[50, 50].tolist() == [0, 0, 255]
+
+def test_deleted_items_disappear():
+    """Deleting an item, even a cached one, removes it from the next frame."""
+    win = OffscreenWin(20, 20)
+    square = win.create_rectangle(0, 0, 20, 20, {"fill": "white", "width": 0})
+    assert win.render()[10, 10].tolist() == [255, 255, 255]
+    win.delete(square)
+    assert win.render()[10, 10].tolist() == [0, 0, 0]
+
+def test_text_is_drawn():
+    """Text items put their colour around their anchor."""
+    win = OffscreenWin(80, 40)
+    win.create_text(40, 20, {"text": "88", "fill": "white", "font": ("helvetica", 20, "bold")})
+    frame = win.render()
+    assert frame[10:30, 25:55].max() > 0
+    assert frame[:, :10].max() == 0
+
+def test_tk_images_are_rejected():
+    """Only PIL images and arrays can be composited."""
+    win = OffscreenWin(10, 10)
+    win.create_image(5, 5, image=object())
+    with pytest.raises(TypeError):
+        win.render()
+
+def test_game_objects_render_off_screen():
+    """Field, players and ball composite into a frame without a display."""
+    from src.core.game.ball import Ball
+    from src.core.game.field import Field
+    from src.core.game.player import Player
+    from src.graphics.assets import assets
+
+    def loader(path):
+        if path.endswith("bg.gif"):
+            return sprite((0, 120, 0, 255), (1200, 600))
+        return sprite((200, 0, 0, 255), (30, 30))
+
+    saved = assets.loader, assets.converter
+    assets.use(loader, lambda picture: picture)
+    try:
+        win = OffscreenWin(1200, 600)
+        Field(1200, 600, win)
+        player = Player(300, 503, True, win)
+        ball = Ball(600, 100, win)
+        assert win.render()[503, 300].tolist() == [200, 0, 0]
+        ball.state.set_position(640, 300)
+        ball.render(1.0)
+        frame = win.render()
+        assert frame[300, 640].tolist() == [200, 0, 0]
+        assert frame[100, 600].tolist() == [0, 120, 0]
+        assert win.static_key[0] >= 3      # Background and goals stay cached
+    finally:
+        assets.use(*saved)
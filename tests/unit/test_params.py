@@ -0,0 +1,45 @@
+"""Unit tests for the physics parameter set."""
+
+import pickle
+import pytest
+from src.core.config import raio, chao
+from src.core.game.params import PhysicsParams, DEFAULT_PARAMS
+from src.core.game.world import World, BallState
+
+def test_defaults_are_the_original_constants():
+    """An unchanged set has no changes and equals the shared defaults."""
+    params = PhysicsParams()
+    assert params == DEFAULT_PARAMS
+    assert params.changes() == {}
+    assert World().params is DEFAULT_PARAMS
+    assert World().field.params is DEFAULT_PARAMS
+
+def test_unknown_parameter_is_rejected():
+    """Typos in parameter names fail loudly."""
+    with pytest.raises(TypeError):
+        PhysicsParams(gravty=0.5)
+
+def test_replace_and_pickle():
+    """Sets can be copied with changes and sent to worker processes."""
+    params = DEFAULT_PARAMS.replace(gravity=0.6)
+    assert params.changes() == {"gravity": 0.6}
+    assert DEFAULT_PARAMS.gravity == 0.4
+    assert pickle.loads(pickle.dumps(params)) == params
+
+def test_gravity_changes_the_fall():
+    """A ball falls further per tick with more gravity."""
+    light = BallState(600, 100)
+    heavy = BallState(600, 100)
+    for _ in range(10):
+        light.apply_physics(0.25, chao)
+        heavy.apply_physics(0.25, chao, params=PhysicsParams(gravity=0.8))
+    assert heavy.y > light.y
+
+def test_world_uses_its_params():
+    """Movement speed and wall bounces follow the world's parameters."""
+    world = World(params=PhysicsParams(move_speed=4, restitution=2.0, min_bounce_speed=0,
+                                       wall_push=0))
+    x = world.player1.x
+    world.apply_inputs({1: {"movement": "right", "jump": "ready", "kick": "ready"}})
+    assert world.player1.x == x + 4
+    assert world.field.check_field_collision(1200, 300, raio, 5, 0) == (-10.0, 0)
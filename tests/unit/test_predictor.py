@@ -0,0 +1,54 @@
+"""Unit tests for the ball trajectory predictor."""
+
+import random
+from src.controllers.base import IDLE
+from src.core.config import raio, chao
+from src.core.game.predictor import TrajectoryPredictor, CROSSBAR, GROUND
+from src.core.game.world import World
+
+IDLE_STATES = {1: dict(IDLE), 2: dict(IDLE)}
+
+def ball_only_world(x, y, velx, vely):
+    """A world without players, so nothing touches the ball."""
+    world = World()
+    world.players = []
+    world.ball.set_position(x, y)
+    world.ball.velx, world.ball.vely = velx, vely
+    return world
+
+def test_prediction_matches_world():
+    """Path, landing and goal agree tick for tick with the real simulation."""
+    rng = random.Random(5)
+    predictor = TrajectoryPredictor(position_quantum=0, velocity_quantum=0)
+    for _ in range(100):
+        state = (rng.uniform(20, 1180), rng.uniform(20, 500), rng.randint(-10, 10), rng.randint(-12, 6))
+        prediction = predictor.predict(ball_only_world(*state).ball)
+        world = ball_only_world(*state)
+        for tick, position in enumerate(prediction.path, 1):
+            world.step(IDLE_STATES)
+            assert (world.ball.x, world.ball.y) == position
+            if tick == prediction.landing_tick:
+                assert world.ball.y + raio == chao
+        assert world.is_goal == prediction.on_target
+        if prediction.on_target:
+            assert world.score[prediction.goal_side] == 1
+
+def test_crossbar_bounce_and_landing():
+    """A ball dropped on the crossbar reports the bounce, then lands."""
+    world = World()
+    bar = world.field.left_goal_bounds
+    world.ball.set_position((bar["x1"] + bar["x2"]) / 2, 200)
+    prediction = TrajectoryPredictor().predict(world.ball)
+    kinds = [kind for _, kind, _, _ in prediction.bounces]
+    assert kinds[0] == CROSSBAR
+    assert GROUND in kinds
+    assert prediction.landing_tick is not None
+
+def test_queries_are_memoized():
+    """Nearby states share one cached prediction."""
+    world = World()
+    predictor = TrajectoryPredictor()
+    first = predictor.predict(world.ball)
+    world.ball.x += 0.2
+    assert predictor.predict(world.ball) is first
+    assert (predictor.hits, predictor.misses) == (1, 1)
@@ -0,0 +1,122 @@
+"""Unit tests for input-log recording and replay."""
+
+import random
+from src.controllers.base import Controller, IDLE
+from src.core.game.replay import (
+    InputRecorder, InputLog, RecordingController, ReplayController, replay
+)
+from src.core.game.world import World
+
+def idle_states():
+    """Control states of two idle players."""
+    return {1: dict(IDLE), 2: dict(IDLE)}
+
+class ScriptedController(Controller):
+    """Random but seeded controls that chase the ball."""
+
+    def __init__(self, world, seed):
+        self.world = world
+        self.rng = random.Random(seed)
+
+    def process_input(self):
+        states = {}
+        for number, player in ((1, self.world.player1), (2, self.world.player2)):
+            if self.rng.random() < 0.7:
+                movement = "left" if self.world.ball.x < player.x else "right"
+            else:
+                movement = self.rng.choice(["none", "left", "right"])
+            states[number] = {
+                "movement": movement,
+                "jump": "jumping" if self.rng.random() < 0.05 else "ready",
+                "kick": "kicking" if self.rng.random() < 0.1 else "ready"
+            }
+        return states
+
+    def cleanup(self):
+        pass
+
+def play_live(world, controller, ticks, recorder=None, restart_at=None):
+    """Run a live session the way the game loop does."""
+    for tick in range(ticks):
+        if tick == restart_at:
+            world.reset_match()
+            if recorder:
+                recorder.mark_restart()
+        world.apply_inputs(controller.process_input())
+        world.update_physics()
+        if world.is_goal:
+            world.reset_positions()
+
+def test_replay_reproduces_session(tmp_path):
+    """Replaying a recorded session ends in exactly the same state."""
+    path = tmp_path / "session.hsr"
+    world = World()
+    recorder = InputRecorder(path)
+    controller = RecordingController(ScriptedController(world, seed=7), recorder)
+    play_live(world, controller, 3000, recorder, restart_at=1800)
+    recorder.close()
+
+    replayed = replay(path)
+    assert replayed.tick == world.tick == 3000
+    assert replayed.score == world.score
+    assert (replayed.ball.x, replayed.ball.y, replayed.ball.velx, replayed.ball.vely) == \
+        (world.ball.x, world.ball.y, world.ball.velx, world.ball.vely)
+    for attr in world.player1.__slots__:
+        assert getattr(replayed.player1, attr) == getattr(world.player1, attr)
+        assert getattr(replayed.player2, attr) == getattr(world.player2, attr)
+
+def test_log_only_stores_changes(tmp_path):
+    """Held controls are stored once, with the tick count kept in the trailer."""
+    path = tmp_path / "idle.hsr"
+    recorder = InputRecorder(path)
+    idle = idle_states()
+    for _ in range(600):
+        recorder.record(idle)
+    recorder.close()
+
+    log = InputLog(path)
+    assert len(log) == 600
+    assert len(log.entries) == 1
+
+def test_replay_controller_feeds_ticks(tmp_path):
+    """The replay controller returns one recorded tick per call, then idles."""
+    path = tmp_path / "short.hsr"
+    recorder = InputRecorder(path)
+    kick = {1: {"movement": "right", "jump": "ready", "kick": "kicking"},
+            2: {"movement": "none", "jump": "jumping", "kick": "ready"}}
+    recorder.record(kick)
+    recorder.record(idle_states())
+    recorder.close()
+
+    controller = ReplayController(path)
+    assert controller.process_input() == kick
+    assert controller.process_input() == idle_states()
+    assert controller.process_input() == idle_states()
+
+class BurstController(ScriptedController):
+    """Plays in short bursts with long idle stretches in between."""
+
+    def __init__(self, world, seed):
+        super().__init__(world, seed)
+        self.tick = 0
+
+    def process_input(self):
+        self.tick += 1
+        if self.tick % 240 < 40:
+            return super().process_input()
+        return idle_states()
+
+def test_replay_skips_idle_stretches_exactly(tmp_path):
+    """Replays fast-forward idle stretches without changing the result."""
+    path = tmp_path / "bursts.hsr"
+    world = World()
+    recorder = InputRecorder(path)
+    controller = RecordingController(BurstController(world, seed=3), recorder)
+    play_live(world, controller, 2400, recorder)
+    recorder.close()
+
+    log = InputLog(path)
+    assert sum(count for _, count, _, _ in log.runs()) == 2400
+    replayed = replay(log)
+    assert replayed.snapshot() == world.snapshot()
+    assert replayed.touches == world.touches
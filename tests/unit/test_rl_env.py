@@ -0,0 +1,83 @@
+"""Unit tests for the reinforcement-learning environments."""
+
+import numpy as np
+from src.controllers.ai import AIController
+from src.rl.env import (
+    HeadSoccerEnv, VectorHeadSoccerEnv, EnvBuffers, ACTIONS, OBSERVATION_SIZE
+)
+
+def test_vector_env_matches_scalar_env():
+    """A vector env row plays out exactly like the scalar env fed the same actions."""
+    env = HeadSoccerEnv()
+    vector = VectorHeadSoccerEnv(3)
+    observation, _ = env.reset()
+    observations, _ = vector.reset()
+    assert np.array_equal(observations[1, 0], observation)
+
+    rng = np.random.default_rng(1)
+    for _ in range(400):
+        actions = rng.integers(0, len(ACTIONS), 3)
+        observation, reward, terminated, truncated, _ = env.step(int(actions[1]))
+        observations, rewards, terminals, _, _ = vector.step(actions)
+        if terminated:
+            assert terminals[1] and rewards[1, 0] == reward
+            observation, _ = env.reset()
+        assert np.array_equal(observations[1, 0], observation)
+    vector.close()
+
+def test_player_two_sees_a_mirrored_field():
+    """Both players see their opponent's goal to the right."""
+    vector = VectorHeadSoccerEnv(1)
+    observations, _ = vector.reset()
+    left, right = observations[0]
+    # Kickoff is symmetric, so both players see the same thing
+    assert np.array_equal(left, right)
+    assert left[4] < left[8]    # Own x left of the opponent's
+
+    # "right" takes both players towards the opponent's goal
+    right_action = ACTIONS.index({"movement": "right", "jump": "ready", "kick": "ready"})
+    start = vector.batch.player_x[0].copy()
+    vector.step([[right_action, right_action]])
+    assert vector.batch.player_x[0, 0] > start[0]
+    assert vector.batch.player_x[0, 1] < start[1]
+    vector.close()
+
+def test_goal_rewards_and_autoreset():
+    """A goal ends the episode with +1/-1 rewards and starts a new one."""
+    vector = VectorHeadSoccerEnv(2)
+    vector.reset()
+    vector.batch.ball_x[0] = 50.0   # Ball inside the left goal
+    vector.batch.ball_y[0] = 450.0
+    observations, rewards, terminated, truncated, info = vector.step(np.zeros(2, dtype=int))
+    assert terminated.tolist() == [True, False]
+    assert rewards[0].tolist() == [-1.0, 1.0]
+    assert vector.buffers.final_observations[0, 0, 0] < 100
+    assert vector.elapsed[0] == 0 and vector.batch.score[0].tolist() == [0, 0]
+    vector.close()
+
+def test_truncation_after_max_ticks():
+    """Episodes are cut short after max_ticks."""
+    env = HeadSoccerEnv(max_ticks=5)
+    env.reset()
+    results = [env.step(0)[3] for _ in range(5)]
+    assert results == [False] * 4 + [True]
+
+def test_opponent_controller_plays():
+    """An AI opponent moves in the environment's world."""
+    env = HeadSoccerEnv(player=1, opponent=AIController((2,), budget=1.0))
+    observation, _ = env.reset()
+    for _ in range(30):
+        next_observation, *_ = env.step(0)
+    assert next_observation[8] != observation[8]
+    env.close()
+
+def test_shared_buffers_are_visible_from_another_attachment():
+    """Another process can read the observations through the shared block."""
+    vector = VectorHeadSoccerEnv(4, shared=True)
+    vector.reset()
+    vector.step(np.zeros(4, dtype=int))
+    reader = EnvBuffers(4, name=vector.buffers.name)
+    assert reader.observations.shape == (4, 2, OBSERVATION_SIZE)
+    assert np.array_equal(reader.observations, vector.buffers.observations)
+    reader.close()
+    vector.close()
@@ -0,0 +1,42 @@
+"""Unit tests for the rollout-search AI."""
+
+from src.controllers.search_ai import RolloutPlanner, SearchAIController, OPPONENT_MOVES
+from src.core.config import raio, chao
+from src.core.game.world import World
+
+def test_planner_finds_open_goal():
+    """With the ball at its feet in front of an open goal, the best plan scores."""
+    world = World()
+    world.player2.set_position(250, 503)
+    world.player1.set_position(900, 503)
+    world.ball.set_position(215, chao - raio)
+    planner = RolloutPlanner(2)
+    plan, score, _ = planner.search(world.snapshot())
+    assert score >= RolloutPlanner.GOAL_VALUE
+    assert plan[0] == -1  # Heads for the left goal
+
+def test_rollout_budget_limits_search():
+    """The rollout budget caps the work done per decision."""
+    planner = RolloutPlanner(1, chunk=5)
+    calls = []
+    _, _, done = planner.search(World().snapshot(), rollouts=30,
+                                should_stop=lambda: calls.append(1) and False)
+    assert done == 30
+    assert len(calls) == 30 // len(OPPONENT_MOVES) // 5
+
+def test_search_ai_plays_with_worker_thread():
+    """Plans from the background worker drive the player."""
+    world = World()
+    ai = SearchAIController(players=(1,), world=world, worker="thread")
+    try:
+        for _ in range(200):
+            world.step(ai.process_input())
+            if world.is_goal:
+                world.reset_positions()
+            if 1 in ai.plans:
+                break
+            ai.workers[1][1].poll(0.05)
+        assert ai.plans[1][2] is not None
+    finally:
+        ai.stop()
+    assert not ai.workers
@@ -0,0 +1,55 @@
+"""Unit tests for world snapshot and restore."""
+
+import random
+from src.core.game.world import World
+
+def random_controls(rng):
+    """Random control state for both players."""
+    return {
+        p: {
+            "movement": rng.choice(["none", "left", "right"]),
+            "jump": "jumping" if rng.random() < 0.1 else "ready",
+            "kick": "kicking" if rng.random() < 0.2 else "ready"
+        }
+        for p in (1, 2)
+    }
+
+def full_state(world):
+    """Every simulated value of a world, for comparison."""
+    ball = world.ball
+    players = tuple(getattr(p, attr) for p in (world.player1, world.player2)
+                    for attr in p.__slots__)
+    return ((ball.x, ball.y, ball.velx, ball.vely), players,
+            dict(world.score), world.is_goal, world.tick)
+
+def test_snapshot_is_fixed_size():
+    """Snapshots are a small fixed-size record."""
+    world = World()
+    assert len(world.snapshot()) == World.SNAPSHOT.size <= 128
+
+def test_restore_rewinds_exactly():
+    """Restoring mid-kick and re-running the same inputs gives the same state."""
+    rng = random.Random(3)
+    world = World()
+    for _ in range(200):
+        world.step(random_controls(rng))
+        if world.is_goal:
+            world.reset_positions()
+
+    saved = world.snapshot()
+    saved_state = full_state(world)
+    ball, player1 = world.ball, world.player1
+
+    inputs = [random_controls(rng) for _ in range(300)]
+    for controls in inputs:
+        world.step(controls)
+    after = full_state(world)
+
+    world.restore(saved)
+    assert full_state(world) == saved_state
+    # Restoring reuses the existing state objects
+    assert world.ball is ball and world.player1 is player1
+
+    for controls in inputs:
+        world.step(controls)
+    assert full_state(world) == after
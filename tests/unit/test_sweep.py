@@ -0,0 +1,40 @@
+"""Unit tests for the physics parameter sweep tool."""
+
+import argparse
+import pytest
+from src.core.game.params import PhysicsParams
+from src.tools.sweep import parse_values, make_param_sets, evaluate, crossbar_drops
+
+def test_parse_values():
+    """Lists and ranges of values are parsed, integer parameters stay integers."""
+    assert parse_values("gravity=0.3,0.5") == ("gravity", [0.3, 0.5], (0.3, 0.5))
+    assert parse_values("gravity=0.2:0.4:3")[1] == pytest.approx([0.2, 0.3, 0.4])
+    assert parse_values("move_speed=8:12:3")[1] == [8, 10, 12]
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_values("gravty=0.3")
+
+def test_grid_and_random_sets():
+    """The grid holds every combination; samples stay within the ranges."""
+    sweeps = [parse_values("gravity=0.3,0.4"), parse_values("restitution=1.0:1.4:3")]
+    grid = make_param_sets(sweeps)
+    assert len(grid) == 6
+    assert {"gravity": 0.4, "restitution": 1.2} in grid
+    samples = make_param_sets(sweeps, samples=20, seed=1)
+    assert len(samples) == 20
+    assert all(0.3 <= s["gravity"] <= 0.4 and 1.0 <= s["restitution"] <= 1.4 for s in samples)
+    assert make_param_sets([]) == [{}]
+
+def test_evaluate_reports_metrics():
+    """A parameter set is scored on scripted matches."""
+    job = {"index": 0, "params": {"gravity": 0.4}, "matches": ["ai:idle"],
+           "ticks": 1200, "seeds": 1, "substeps": 1}
+    result = evaluate(job)
+    assert result["goals_per_minute"] > 0
+    assert result["rally_touches"] > 0
+    assert 0 <= result["crossbar_stuck"] <= 1
+
+def test_crossbar_drops_detect_a_dead_crossbar():
+    """Without any crossbar bounce, dropped balls stay on top of it."""
+    assert crossbar_drops(PhysicsParams(), 1) == 0
+    dead = PhysicsParams(restitution=0.0, min_bounce_speed=0, crossbar_push=0)
+    assert crossbar_drops(dead, 1) == 1
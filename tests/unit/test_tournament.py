@@ -0,0 +1,109 @@
+"""Unit tests for the self-play tournament runner."""
+
+import json
+import socket
+import sys
+import threading
+import time
+import pytest
+from src.tools.tournament import (
+    make_jobs, play_match, run_local, Standings, serve, work, main, parse_address
+)
+
+def free_port():
+    """A local port nobody listens on."""
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    return port
+
+def test_jobs_alternate_sides():
+    """Every pairing gets the requested games, with sides swapped every game."""
+    jobs = make_jobs(["ai", "idle", "random"], games=4, ticks=100, goals=0, substeps=1)
+    assert len(jobs) == 3 * 4
+    first = [(job["left"], job["right"]) for job in jobs[:4]]
+    assert first == [("ai", "idle"), ("idle", "ai")] * 2
+    assert len({job["seed"] for job in jobs}) == len(jobs)
+
+def test_matches_are_deterministic():
+    """Replaying a job gives the same result."""
+    job = make_jobs(["ai", "random"], games=1, ticks=600, goals=0, substeps=1, seed=3)[0]
+    first = play_match(job)
+    second = play_match(job)
+    for key in ("score", "touches", "length", "winner"):
+        assert first[key] == second[key]
+
+def test_ai_beats_idle_and_stops_at_goal_limit():
+    """The heuristic AI beats a player that stands still, first to two goals."""
+    job = make_jobs(["ai", "idle"], games=1, ticks=3600, goals=2, substeps=1)[0]
+    result = play_match(job)
+    assert result["winner"] == "ai"
+    assert result["score"]["left"] == 2
+    assert result["length"] < 3600
+    assert result["touches"]["left"] > 0
+
+def test_local_pool_streams_results(tmp_path):
+    """Every result is written to disk and counted in the standings."""
+    out = tmp_path / "results.jsonl"
+    jobs = make_jobs(["idle", "random"], games=2, ticks=120, goals=0, substeps=1)
+    standings = run_local(jobs, 2, str(out))
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert sorted(line["match"] for line in lines) == [0, 1]
+    summary = standings.summary()
+    assert summary["idle"]["matches"] == summary["random"]["matches"] == 2
+    assert summary["idle"]["average_length"] == 120
+
+def test_standings_count_both_sides():
+    """A result counts as a win for one spec and a loss for the other."""
+    standings = Standings()
+    standings.add({"left": "a", "right": "b", "score": {"left": 3, "right": 1},
+                   "touches": {"left": 5, "right": 2}, "length": 600})
+    summary = standings.summary()
+    assert summary["a"]["wins"] == 1 and summary["a"]["goals_for"] == 3
+    assert summary["b"]["losses"] == 1 and summary["b"]["touches"] == 2
+    assert summary["a"]["win_rate"] == 1.0
+
+def test_workers_that_cannot_connect_fail_the_command():
+    """An unreachable server makes work() exit with an error."""
+    with pytest.raises(SystemExit) as exit_info:
+        work(("127.0.0.1", free_port()), b"key", 1)
+    assert exit_info.value.code == 1
+
+def test_queue_needs_an_explicit_key(monkeypatch):
+    """Workers refuse to start without --authkey; there is no default key."""
+    monkeypatch.setattr(sys, "argv", ["tournament", "--work", "127.0.0.1:5000"])
+    with pytest.raises(SystemExit) as exit_info:
+        main()
+    assert exit_info.value.code == 2
+    assert parse_address(":5000") == ("127.0.0.1", 5000)
+
+def test_failed_match_is_reported_not_waited_for(tmp_path):
+    """A job that raises comes back as a failed result and the server returns."""
+    address = ("127.0.0.1", free_port())
+    jobs = make_jobs(["idle", "bogus"], games=2, ticks=60, goals=0, substeps=1)
+    served = {}
+    server = threading.Thread(target=lambda: served.update(
+        standings=serve(jobs, address, b"key", str(tmp_path / "results.jsonl"), timeout=30)))
+    server.start()
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(address).close()
+            break
+        except OSError:
+            time.sleep(0.05)
+    work(address, b"key", 1)
+    server.join(timeout=30)
+    assert not server.is_alive()
+    standings = served["standings"]
+    assert standings.matches == 2
+    assert sorted(result["match"] for result in standings.failed) == [0, 1]
+    assert "bogus" in standings.failed[0]["error"]
+
+def test_server_gives_up_without_workers(tmp_path):
+    """With nobody playing, serve() stops after the timeout instead of hanging."""
+    jobs = make_jobs(["idle", "random"], games=1, ticks=60, goals=0, substeps=1)
+    standings = serve(jobs, ("127.0.0.1", free_port()), b"key", str(tmp_path / "results.jsonl"),
+                      timeout=0.5)
+    assert standings.matches == 0
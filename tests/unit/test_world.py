@@ -0,0 +1,159 @@
+"""Unit tests for the headless world simulation."""
+
+import random
+from src.controllers.base import IDLE
+from src.core.config import raio, chao
+from src.core.game.world import World, FieldRules, BALL_START
+
+IDLE_STATES = {1: dict(IDLE), 2: dict(IDLE)}
+
+def controls(movement="none", jump="ready", kick="ready"):
+    """Build a control state for player 1 with player 2 idle."""
+    return {1: {"movement": movement, "jump": jump, "kick": kick}, 2: IDLE_STATES[2]}
+
+def test_ball_falls_to_rest_on_ground():
+    """A dropped ball bounces and comes to rest on the floor."""
+    world = World()
+    for _ in range(600):
+        world.step(IDLE_STATES)
+    assert world.ball.y + raio == chao
+    assert world.ball.velx == 0 and world.ball.vely == 0
+    assert world.tick == 600
+
+def test_jump_returns_to_ground():
+    """A jump lasts 24 ticks and lands where it started."""
+    world = World()
+    start_y = world.player1.y
+    world.step(controls(jump="jumping"))
+    assert world.player1.jumping
+    for _ in range(23):
+        world.step(IDLE_STATES)
+    assert not world.player1.jumping
+    assert world.player1.y == start_y
+    assert world.player1.jump_ready
+
+def test_kick_restores_foot():
+    """A kick moves the foot and puts it back after 15 ticks."""
+    world = World()
+    rest = world.player1.foot_position
+    world.step(controls(kick="kicking"))
+    assert world.player1.sprite_action == "kick1"
+    assert world.player1.foot_position != rest
+    for _ in range(14):
+        world.step(IDLE_STATES)
+    assert not world.player1.kicking
+    assert world.player1.sprite_action == ""
+    assert world.player1.foot_position == rest
+
+def test_goal_scores_and_resets():
+    """A ball rolling into the left goal scores for the right player."""
+    world = World()
+    world.ball.set_position(150, chao - raio)
+    world.ball.velx = -6
+    for _ in range(60):
+        if world.step(IDLE_STATES):
+            break
+    assert world.score == {"left": 0, "right": 1}
+    world.reset_positions()
+    assert not world.is_goal
+    assert (world.ball.x, world.ball.y) == BALL_START
+
+def test_header_sends_ball_away_from_player():
+    """A ball dropping on player 2's head is sent to the left."""
+    world = World()
+    head_x, head_y = world.player2.head_position
+    world.ball.set_position(head_x, head_y - 60)
+    for _ in range(20):
+        world.step(IDLE_STATES)
+        if world.ball.velx:
+            break
+    assert world.ball.velx == -5
+
+def test_substeps_stop_fast_ball_tunneling():
+    """A ball crossing a head in one tick is only caught with substeps."""
+    results = []
+    for substeps in (1, 4):
+        world = World(substeps=substeps)
+        head_x, head_y = world.player2.head_position
+        world.ball.set_position(head_x - 45, head_y)
+        world.ball.velx = 45
+        world.step(IDLE_STATES)
+        results.append(world.ball.velx)
+    assert results[0] == 45
+    assert results[1] == -5
+
+def test_substeps_keep_jump_duration():
+    """A jump takes the same number of ticks at 240 Hz physics."""
+    world = World(substeps=4)
+    start_y = world.player1.y
+    world.step(controls(jump="jumping"))
+    for _ in range(23):
+        world.step(IDLE_STATES)
+    assert not world.player1.jumping
+    assert world.player1.y == start_y
+
+def test_field_grid_quiet_cells_are_exact():
+    """Positions in cells without flags never trigger a bounce or a goal."""
+    rng = random.Random(9)
+    rules = FieldRules(1200)
+    grid = rules.grid
+    for _ in range(20000):
+        bx, by = rng.uniform(-20, 1220), rng.uniform(-20, 620)
+        velx, vely = rng.uniform(-20, 20), rng.uniform(-20, 20)
+        flags = grid.lookup(bx, by)
+        if not flags & grid.COLLISION:
+            assert rules.check_field_collision(bx, by, raio, velx, vely) == (velx, vely)
+        if not flags & grid.GOAL:
+            assert rules.check_goal(bx, by, raio) == (False, None)
+
+def random_flight(seed, substeps=1):
+    """World with the ball thrown from a random spot and the players standing still."""
+    rng = random.Random(seed)
+    world = World(substeps=substeps)
+    world.ball.set_position(rng.uniform(20, 1180), rng.uniform(20, 520))
+    world.ball.velx = rng.uniform(-15, 15)
+    world.ball.vely = rng.uniform(-15, 10)
+    world.player1.set_position(rng.uniform(50, 600), 503)
+    world.player2.set_position(rng.uniform(600, 1150), 503)
+    return world
+
+def test_skip_idle_matches_stepping():
+    """Skipping free flight ends in exactly the state of tick-by-tick stepping."""
+    for seed in range(60):
+        for substeps in (1, 3):
+            stepped = random_flight(seed, substeps)
+            skipped = random_flight(seed, substeps)
+            for _ in range(400):
+                stepped.step(IDLE_STATES)
+                if stepped.is_goal:
+                    stepped.reset_positions()
+            remaining = 400
+            while remaining:
+                remaining -= skipped.skip_idle(remaining)
+                if skipped.is_goal:
+                    skipped.reset_positions()
+            assert skipped.snapshot() == stepped.snapshot()
+            assert repr(vars_of(skipped.ball)) == repr(vars_of(stepped.ball))
+            assert skipped.touches == stepped.touches
+
+def vars_of(state):
+    """Slot values of a state object, types included in their repr."""
+    return [getattr(state, attr) for attr in state.__slots__]
+
+def test_skip_idle_stops_after_a_goal():
+    """A skip ends on the scoring tick so the kickoff can be reset."""
+    world = World()
+    world.ball.set_position(300, 200)
+    world.ball.velx = -6
+    world.player1.set_position(600, 503)
+    done = world.skip_idle(1000)
+    assert world.is_goal and sum(world.score.values()) == 1
+    assert done == world.tick < 1000
+
+def test_skip_idle_jumps_over_a_resting_ball():
+    """Once nothing moves, any number of ticks is skipped at once."""
+    world = World()
+    world.ball.set_position(600, chao - raio)
+    assert world.skip_idle(10 ** 9) == 10 ** 9
+    assert world.tick == 10 ** 9
+    assert (world.ball.x, world.ball.y) == (600, chao - raio)